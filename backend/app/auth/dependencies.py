@@ -6,9 +6,11 @@ from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import jwt
 
-from app.db.database import get_db
+from app.db.database import get_db, get_async_db
+from app.db.async_repository import get_first_user, get_user_by_id
 from .models import User
 from .utils import verify_token
 
@@ -16,43 +18,13 @@ from .utils import verify_token
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
+def _user_id_from_token(token: str) -> int:
     """
-    Dependency to get current authenticated user from access token
-
-    Usage in routes:
-        @router.get("/protected")
-        async def protected_route(current_user: User = Depends(get_current_user)):
-            return {"user_id": current_user.id}
-
-    Args:
-        credentials: HTTP Authorization credentials (Bearer token)
-        db: Database session
-
-    Returns:
-        User object if token is valid
+    Verify an access token and return its user ID
 
     Raises:
-        HTTPException 401: If token is invalid or user not found
+        HTTPException 401: If token is invalid or expired
     """
-    token = credentials.credentials
-
-    # [DEV ONLY] Bypass for testing without real OAuth
-    if token == "dev-token-bypass":
-        # Get the first user or a specific test user
-        user = db.query(User).first()
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="[DEV] No users found in DB to impersonate.",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        return user
-
-    # Verify token
     try:
         payload = verify_token(token, token_type="access")
         user_id = int(payload["sub"])
@@ -74,20 +46,88 @@ async def get_current_user(
             detail=f"Token verification failed: {str(e)}",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return user_id
 
-    # Get user from database
-    user = db.query(User).filter(User.ID == user_id).first()
 
+def _dev_user_or_401(user: Optional[User]) -> User:
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
+            detail="[DEV] No users found in DB to impersonate.",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return user
+
 
+def _user_or_401(user: Optional[User]) -> User:
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+) -> User:
+    """
+    Dependency to get current authenticated user from access token
+
+    Usage in routes:
+        @router.get("/protected")
+        async def protected_route(current_user: User = Depends(get_current_user)):
+            return {"user_id": current_user.id}
+
+    Args:
+        credentials: HTTP Authorization credentials (Bearer token)
+        db: Database session
+
+    Returns:
+        User object if token is valid
+
+    Raises:
+        HTTPException 401: If token is invalid or user not found
+    """
+    token = credentials.credentials
+
+    # [DEV ONLY] Bypass for testing without real OAuth
+    if token == "dev-token-bypass":
+        # Get the first user or a specific test user
+        return _dev_user_or_401(db.query(User).first())
+
+    user_id = _user_id_from_token(token)
+
+    # Get user from database
+    user = db.query(User).filter(User.ID == user_id).first()
+    return _user_or_401(user)
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """
+    Same as get_current_user, but looks the user up on the async engine
+    so the request does not block the event loop
+
+    Usage in routes:
+        @router.get("/protected")
+        async def protected_route(current_user: User = Depends(get_current_user_async)):
+            return {"user_id": current_user.ID}
+    """
+    token = credentials.credentials
+
+    # [DEV ONLY] Bypass for testing without real OAuth
+    if token == "dev-token-bypass":
+        return _dev_user_or_401(await get_first_user(db))
+
+    user_id = _user_id_from_token(token)
+    return _user_or_401(await get_user_by_id(db, user_id))
+
+
 async def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(
         HTTPBearer(auto_error=False)
@@ -1,7 +1,15 @@
 """
 Database module for centralized DB management
 """
-from .database import Base, get_db, init_db, engine, SessionLocal
+from .database import (
+    Base,
+    get_db,
+    get_async_db,
+    init_db,
+    engine,
+    SessionLocal,
+    AsyncSessionLocal,
+)
 from .models import (
     User, 
     DailyMoodSelection, 
@@ -23,9 +31,11 @@ from .models import (
 __all__ = [
     "Base",
     "get_db",
+    "get_async_db",
     "init_db",
     "engine",
     "SessionLocal",
+    "AsyncSessionLocal",
     "User",
     "DailyMoodSelection",
     "EmotionAnalysis",
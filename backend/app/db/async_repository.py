@@ -0,0 +1,195 @@
+"""
+Async repository for the request hot paths
+
+Conversations, global memories, user lookup and emotion analysis writes on an
+AsyncSession (see database.AsyncSessionLocal / get_async_db), so async routes
+and the agent do not block the event loop on MySQL round trips.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import Conversation, EmotionAnalysis, GlobalMemory, SessionSummary, User
+from .session_summary import bump_session_summary
+
+
+# ============================================================================
+# User lookup
+# ============================================================================
+
+async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
+    return await db.get(User, user_id)
+
+
+async def get_first_user(db: AsyncSession) -> Optional[User]:
+    """First user by ID (dev-token bypass)"""
+    result = await db.execute(select(User).order_by(User.ID).limit(1))
+    return result.scalars().first()
+
+
+# ============================================================================
+# Conversations
+# ============================================================================
+
+async def add_conversation_message(
+    db: AsyncSession,
+    user_id: int,
+    session_id: str,
+    speaker_type: str,
+    content: str,
+) -> int:
+    """
+    Insert a message and count it in its session summary (one transaction)
+
+    Returns:
+        ID of the created conversation record
+    """
+    conversation = Conversation(
+        USER_ID=user_id,
+        SESSION_ID=session_id,
+        SPEAKER_TYPE=speaker_type,
+        CONTENT=content,
+        IS_DELETED="N",
+        CREATED_BY=user_id,
+        UPDATED_BY=None,
+    )
+    db.add(conversation)
+    await db.flush()
+    conversation_id = conversation.ID
+    await db.run_sync(
+        bump_session_summary, user_id, session_id, conversation_id, speaker_type, content
+    )
+    await db.commit()
+    return conversation_id
+
+
+def history_select(user_id: int, session_id: str, before_id: Optional[int] = None):
+    """Newest-first keyset select over idx_conv_user_session_live_id (column projection)"""
+    stmt = select(
+        Conversation.ID,
+        Conversation.SPEAKER_TYPE,
+        Conversation.CONTENT,
+        Conversation.CREATED_AT,
+    ).where(
+        and_(
+            Conversation.USER_ID == user_id,
+            Conversation.SESSION_ID == session_id,
+            Conversation.IS_DELETED == "N",
+        )
+    )
+    if before_id is not None:
+        stmt = stmt.where(Conversation.ID < before_id)
+    return stmt.order_by(Conversation.ID.desc())
+
+
+async def get_history_rows(
+    db: AsyncSession,
+    user_id: int,
+    session_id: str,
+    limit: Optional[int] = None,
+    before_id: Optional[int] = None,
+) -> List[Any]:
+    """
+    History rows (ID, SPEAKER_TYPE, CONTENT, CREATED_AT), newest first
+
+    Args:
+        limit: Maximum number of rows (None: all)
+        before_id: Only rows with a smaller ID
+    """
+    stmt = history_select(user_id, session_id, before_id)
+    if limit:
+        stmt = stmt.limit(limit)
+    result = await db.execute(stmt)
+    return list(result.all())
+
+
+async def get_session_summary(
+    db: AsyncSession, user_id: int, session_id: str
+) -> Optional[SessionSummary]:
+    """Summary row of one session (TB_SESSION_SUMMARY, single-row lookup)"""
+    result = await db.execute(
+        select(SessionSummary)
+        .where(
+            and_(
+                SessionSummary.USER_ID == user_id,
+                SessionSummary.SESSION_ID == session_id,
+            )
+        )
+        .limit(1)
+    )
+    return result.scalars().first()
+
+
+# ============================================================================
+# Memories
+# ============================================================================
+
+async def get_global_memories(db: AsyncSession, user_id: int) -> List[GlobalMemory]:
+    """Active global memories of a user, most important first"""
+    result = await db.execute(
+        select(GlobalMemory)
+        .where(
+            and_(
+                GlobalMemory.USER_ID == user_id,
+                GlobalMemory.IS_DELETED == "N",
+            )
+        )
+        .order_by(GlobalMemory.IMPORTANCE.desc())
+    )
+    return list(result.scalars().all())
+
+
+# ============================================================================
+# Emotion analysis
+# ============================================================================
+
+def build_emotion_analysis(
+    user_id: int,
+    text: str,
+    emotion_result: Dict[str, Any],
+    check_root: str = "conversation",
+    input_text_embedding: Optional[str] = None,
+) -> EmotionAnalysis:
+    """TB_EMOTION_ANALYSIS row from an emotion analysis result (shared with the sync store)"""
+    return EmotionAnalysis(
+        USER_ID=user_id,
+        CHECK_ROOT=check_root,
+        TEXT=text,
+        INPUT_TEXT_EMBEDDING=input_text_embedding,
+        LANGUAGE=emotion_result.get("language", "ko"),
+        RAW_DISTRIBUTION=emotion_result.get("raw_distribution"),
+        PRIMARY_EMOTION=emotion_result.get("primary_emotion"),
+        SECONDARY_EMOTIONS=emotion_result.get("secondary_emotions"),
+        SENTIMENT_OVERALL=emotion_result.get("sentiment_overall", "neutral"),
+        MIXED_EMOTION=emotion_result.get("mixed_emotion"),
+        SERVICE_SIGNALS=emotion_result.get("service_signals"),
+        RECOMMENDED_RESPONSE_STYLE=emotion_result.get("recommended_response_style"),
+        RECOMMENDED_ROUTINE_TAGS=emotion_result.get("recommended_routine_tags"),
+        REPORT_TAGS=emotion_result.get("report_tags"),
+    )
+
+
+async def add_emotion_analysis(
+    db: AsyncSession,
+    user_id: int,
+    text: str,
+    emotion_result: Dict[str, Any],
+    check_root: str = "conversation",
+    input_text_embedding: Optional[str] = None,
+) -> int:
+    """
+    Save an emotion analysis result to TB_EMOTION_ANALYSIS
+
+    Returns:
+        ID of the created record
+    """
+    emotion_analysis = build_emotion_analysis(
+        user_id, text, emotion_result, check_root, input_text_embedding
+    )
+    db.add(emotion_analysis)
+    await db.flush()
+    analysis_id = emotion_analysis.ID
+    await db.commit()
+    return analysis_id
@@ -5,11 +5,18 @@ Centralized database management for all models
 
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 from pathlib import Path
 
+from .instrumentation import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    instrument_engine,
+)
+
 # Load environment variables
 project_root = Path(__file__).parent.parent.parent
 env_path = project_root / ".env"
@@ -26,17 +33,81 @@ DB_NAME = os.getenv("DB_NAME", "bomdb")
 # MySQL connection URL
 DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
 
+# Connection pool settings, applied to the sync and the async engine separately:
+# with the defaults one process can open up to 2 x (10 + 20) = 60 connections,
+# against MySQL's default max_connections of 151 - lower these when running
+# several workers (see DB_GUIDE.md)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # seconds to wait for a free connection
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+
+POOL_KWARGS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_pre_ping": True,  # Verify connections before using them
+    "pool_recycle": DB_POOL_RECYCLE,  # Recycle connections (default 1 hour)
+}
+
 # Create SQLAlchemy engine
 engine = create_engine(
     DATABASE_URL,
-    pool_pre_ping=True,  # Verify connections before using them
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    poolclass=InstrumentedQueuePool,
     echo=False,  # Set to True for SQL query logging
+    **POOL_KWARGS,
 )
+instrument_engine(engine, "sync")
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async MySQL connection URL (aiomysql, or DB_ASYNC_DRIVER=asyncmy)
+DB_ASYNC_DRIVER = os.getenv("DB_ASYNC_DRIVER", "aiomysql")
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    f"mysql+{DB_ASYNC_DRIVER}://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4",
+)
+
+# 비동기 엔진은 첫 사용 시 생성 (드라이버가 없는 환경에서도 sync 경로는 그대로 동작)
+_async_engine = None
+_async_session_factory = None
+
+
+def configure_async_engine(url: str = None, **engine_kwargs):
+    """
+    (Re)create the async engine and session factory
+
+    Called lazily with ASYNC_DATABASE_URL; tests pass e.g. "sqlite+aiosqlite://"
+
+    Returns:
+        The async engine
+    """
+    global _async_engine, _async_session_factory
+    if not engine_kwargs:
+        engine_kwargs = {"poolclass": InstrumentedAsyncAdaptedQueuePool, **POOL_KWARGS}
+    _async_engine = create_async_engine(url or ASYNC_DATABASE_URL, **engine_kwargs)
+    instrument_engine(_async_engine.sync_engine, "async")
+    # expire_on_commit=False: attributes stay readable after commit without an implicit (sync) reload
+    _async_session_factory = async_sessionmaker(
+        bind=_async_engine, autoflush=False, expire_on_commit=False
+    )
+    return _async_engine
+
+
+def get_async_engine():
+    """Get the async engine (created on first use)"""
+    if _async_engine is None:
+        configure_async_engine()
+    return _async_engine
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    """Create an AsyncSession (async counterpart of SessionLocal())"""
+    if _async_session_factory is None:
+        configure_async_engine()
+    return _async_session_factory()
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -57,6 +128,19 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    Dependency function to get an async database session
+
+    Usage in FastAPI:
+        @app.get("/endpoint")
+        async def endpoint(db: AsyncSession = Depends(get_async_db)):
+            ...
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """
     Initialize database tables
@@ -75,6 +159,19 @@ def init_db():
         # 대소문자 무시하고 테이블 이름 찾기 (Windows 등 Case-insensitive 환경 대응)
         table_map = {name.upper(): name for name in table_names}
 
+        # TB_CONVERSATIONS 마이그레이션: 히스토리 keyset 조회용 인덱스
+        if "TB_CONVERSATIONS" in table_map:
+            real_table_name = table_map["TB_CONVERSATIONS"]
+            index_names = {idx["name"] for idx in inspector.get_indexes(real_table_name)}
+            if "idx_conv_user_session_live_id" not in index_names:
+                with engine.begin() as conn:
+                    conn.execute(
+                        text(
+                            f"CREATE INDEX idx_conv_user_session_live_id ON {real_table_name} (USER_ID, SESSION_ID, IS_DELETED, ID)"
+                        )
+                    )
+                print(f"[DB] Added idx_conv_user_session_live_id to {real_table_name}")
+
         # TB_SCENARIO_RESULTS 마이그레이션
         if "TB_SCENARIO_RESULTS" in table_map:
             real_table_name = table_map["TB_SCENARIO_RESULTS"]
@@ -298,4 +395,18 @@ def init_db():
         print(f"[DB] Migration failed: {e}")
         traceback.print_exc()
 
+    # TB_SESSION_SUMMARY 백필: 요약 테이블 도입 전에 저장된 대화
+    try:
+        from .session_summary import backfill_session_summaries
+
+        db = SessionLocal()
+        try:
+            backfilled = backfill_session_summaries(db)
+        finally:
+            db.close()
+        if backfilled:
+            print(f"[DB] Backfilled TB_SESSION_SUMMARY for {backfilled} users")
+    except Exception as e:
+        print(f"[DB] Session summary backfill failed: {e}")
+
     print("[DB] All tables created successfully")
@@ -0,0 +1,320 @@
+"""
+Connection pool and query instrumentation
+
+- Pool saturation: checked-out connections (current/peak) and the time spent
+  acquiring a connection from the pool, per engine
+- Per-statement latency via cursor execute events, with a slow-query log
+  above DB_SLOW_QUERY_MS
+- Per-request DB time: track_db_request collects the statements run in a block
+  (one HTTP request via DBTimingMiddleware, one websocket turn in the agent
+  websocket) and prints a summary line (queries, DB time, pool wait, repeated
+  statements = likely N+1); HTTP responses also get a Server-Timing header
+"""
+
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+# Statements slower than this are logged (ms)
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+# The same statement this many times in one request is reported as a likely N+1
+DB_REPEATED_QUERY_THRESHOLD = int(os.getenv("DB_REPEATED_QUERY_THRESHOLD", "5"))
+# Per-request summary line (Server-Timing header is always added)
+DB_REQUEST_LOG = os.getenv("DB_REQUEST_LOG", "true").lower() == "true"
+
+SQL_PREVIEW_CHARS = 200
+
+
+def _preview(statement: str) -> str:
+    statement = " ".join(statement.split())
+    if len(statement) > SQL_PREVIEW_CHARS:
+        return statement[:SQL_PREVIEW_CHARS] + "..."
+    return statement
+
+
+# ============================================================================
+# Per-request stats
+# ============================================================================
+
+class DBRequestStats:
+    """DB work done while serving one request"""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.queries = 0
+        self.db_time = 0.0
+        self.pool_wait = 0.0
+        self.slow_queries = 0
+        self.statements: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record_query(self, statement: str, elapsed: float, slow: bool) -> None:
+        with self._lock:
+            self.queries += 1
+            self.db_time += elapsed
+            self.slow_queries += slow
+            self.statements[statement] += 1
+
+    def record_pool_wait(self, elapsed: float) -> None:
+        with self._lock:
+            self.pool_wait += elapsed
+
+    def repeated_statements(
+        self, threshold: int = DB_REPEATED_QUERY_THRESHOLD
+    ) -> List[Tuple[str, int]]:
+        """Statements executed at least `threshold` times (most repeated first)"""
+        return [(sql, count) for sql, count in self.statements.most_common() if count >= threshold]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries"'
+
+    def summary(self) -> str:
+        text = (
+            f"[DB] {self.label}: {self.queries} queries, "
+            f"{self.db_time * 1000:.1f}ms DB, {self.pool_wait * 1000:.1f}ms pool wait"
+        )
+        if self.slow_queries:
+            text += f", {self.slow_queries} slow"
+        for statement, count in self.repeated_statements():
+            text += f"\n[DB]   ⚠️ N+1? {count}x {_preview(statement)}"
+        return text
+
+
+_current_request: ContextVar[Optional[DBRequestStats]] = ContextVar(
+    "db_request_stats", default=None
+)
+
+
+def current_request_stats() -> Optional[DBRequestStats]:
+    return _current_request.get()
+
+
+@contextmanager
+def track_db_request(label: str) -> Iterator[DBRequestStats]:
+    """
+    Collect the DB work of a block into a DBRequestStats and print its summary
+    (per HTTP request by DBTimingMiddleware, per turn in websocket handlers)
+    """
+    stats = DBRequestStats(label)
+    token = _current_request.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_request.reset(token)
+        if DB_REQUEST_LOG and stats.queries:
+            print(stats.summary())
+
+
+# ============================================================================
+# Engine-wide stats
+# ============================================================================
+
+class PoolStats:
+    """Connection acquisition stats of one engine's pool (survives pool recreation)"""
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.peak_checked_out = 0
+        self._lock = threading.Lock()
+
+    def record(self, elapsed: float, checked_out: int) -> None:
+        with self._lock:
+            self.acquisitions += 1
+            self.wait_total += elapsed
+            self.wait_max = max(self.wait_max, elapsed)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "acquisitions": self.acquisitions,
+                "timeouts": self.timeouts,
+                "peak_checked_out": self.peak_checked_out,
+                "wait_total_ms": round(self.wait_total * 1000, 2),
+                "wait_avg_ms": round(self.wait_total * 1000 / self.acquisitions, 3)
+                if self.acquisitions
+                else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 2),
+            }
+
+
+class QueryStats:
+    """Statement count/latency of one engine"""
+
+    def __init__(self):
+        self.queries = 0
+        self.slow_queries = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, elapsed: float, slow: bool) -> None:
+        with self._lock:
+            self.queries += 1
+            self.slow_queries += slow
+            self.total_time += elapsed
+            self.max_time = max(self.max_time, elapsed)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queries": self.queries,
+                "slow_queries": self.slow_queries,
+                "total_ms": round(self.total_time * 1000, 2),
+                "avg_ms": round(self.total_time * 1000 / self.queries, 3) if self.queries else 0.0,
+                "max_ms": round(self.max_time * 1000, 2),
+            }
+
+
+_pool_stats: Dict[str, PoolStats] = {}
+_query_stats: Dict[str, QueryStats] = {}
+_engines: Dict[str, Any] = {}
+
+
+def _stats_for(registry: Dict[str, Any], factory, name: str):
+    stats = registry.get(name)
+    if stats is None:
+        stats = registry.setdefault(name, factory())
+    return stats
+
+
+# ============================================================================
+# Instrumented pools
+# ============================================================================
+
+class _TimedAcquireMixin:
+    """
+    Times QueuePool._do_get: waiting for a free connection, or opening a new
+    one while under pool_size + max_overflow
+    """
+
+    stats_name = "default"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            _stats_for(_pool_stats, PoolStats, self.stats_name).record_timeout()
+            raise
+        elapsed = time.perf_counter() - start
+        _stats_for(_pool_stats, PoolStats, self.stats_name).record(elapsed, self.checkedout())
+        request = _current_request.get()
+        if request is not None:
+            request.record_pool_wait(elapsed)
+        return connection
+
+
+class InstrumentedQueuePool(_TimedAcquireMixin, QueuePool):
+    stats_name = "sync"
+
+
+class InstrumentedAsyncAdaptedQueuePool(_TimedAcquireMixin, AsyncAdaptedQueuePool):
+    stats_name = "async"
+
+
+# ============================================================================
+# Statement timing
+# ============================================================================
+
+def instrument_engine(engine, name: str) -> None:
+    """
+    Attach statement timing to an Engine (pass AsyncEngine.sync_engine for async)
+    and register it for get_db_stats()
+    """
+    _engines[name] = engine
+    query_stats = _stats_for(_query_stats, QueryStats, name)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        slow = elapsed * 1000 >= DB_SLOW_QUERY_MS
+        query_stats.record(elapsed, slow)
+        request = _current_request.get()
+        if request is not None:
+            request.record_query(statement, elapsed, slow)
+        if slow:
+            where = f" ({request.label})" if request is not None else ""
+            print(f"[DB] 🐢 Slow query {elapsed * 1000:.1f}ms{where}: {_preview(statement)}")
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        # after_cursor_execute does not fire for failed statements
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_start_time"):
+            connection.info["query_start_time"].pop()
+
+
+def get_db_stats() -> Dict[str, Any]:
+    """Pool saturation and query latency per instrumented engine"""
+    stats = {}
+    for name, engine in _engines.items():
+        pool = engine.pool
+        pool_info: Dict[str, Any] = {"status": pool.status()}
+        if isinstance(pool, QueuePool):
+            pool_info.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                overflow=max(pool.overflow(), 0),
+                checked_in=pool.checkedin(),
+            )
+        if name in _pool_stats:
+            pool_info.update(_pool_stats[name].snapshot())
+        stats[name] = {
+            "pool": pool_info,
+            "queries": _query_stats[name].snapshot(),
+            "slow_query_ms": DB_SLOW_QUERY_MS,
+        }
+    return stats
+
+
+# ============================================================================
+# Per-request middleware
+# ============================================================================
+
+class DBTimingMiddleware:
+    """
+    ASGI middleware: one DBRequestStats per HTTP request, added to the response as
+    `Server-Timing: db;dur=<ms>;desc="<n> queries"`.
+
+    Websocket scopes are passed through: a connection lives for a whole
+    conversation, so websocket handlers wrap each turn in track_db_request instead.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_db_request(f'{scope["method"]} {scope["path"]}') as stats:
+
+            async def send_with_timing(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", stats.server_timing().encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
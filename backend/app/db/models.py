@@ -412,6 +412,8 @@ class Conversation(Base):
         Index("idx_user_session_conv", "USER_ID", "SESSION_ID"),
         Index("idx_session_created", "SESSION_ID", "CREATED_AT"),
         Index("idx_user_deleted_conv", "USER_ID", "IS_DELETED"),
+        # Keyset history reads: ORDER BY ID DESC LIMIT N per live session
+        Index("idx_conv_user_session_live_id", "USER_ID", "SESSION_ID", "IS_DELETED", "ID"),
     )
 
     # Relationships
@@ -423,6 +425,49 @@ class Conversation(Base):
         return f"<Conversation(ID={self.ID}, USER_ID={self.USER_ID}, SESSION_ID={self.SESSION_ID}, SPEAKER={self.SPEAKER_TYPE})>"
 
 
+class SessionSummary(Base):
+    """
+    Conversation session summary (read model for session listings)
+    Maintained incrementally by DBConversationStore on message insert/delete
+
+    Attributes:
+        ID: Primary key
+        USER_ID: Foreign key to TB_USERS (data isolation)
+        SESSION_ID: Session identifier
+        MESSAGE_COUNT: Number of active (not deleted) messages
+        FIRST_MESSAGE_AT: Timestamp of the oldest active message
+        LAST_ACTIVITY_AT: Timestamp of the newest message
+        LAST_MESSAGE_ID: ID of the newest message (recency order / pagination cursor)
+        PREVIEW: First user message of the session (None until the user speaks)
+        UPDATED_AT: Last update timestamp
+
+    Rows exist only for sessions with active messages; deleting a session deletes its row.
+    """
+
+    __tablename__ = "TB_SESSION_SUMMARY"
+
+    ID = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    USER_ID = Column(Integer, ForeignKey("TB_USERS.ID"), nullable=False)
+    SESSION_ID = Column(String(255), nullable=False)
+    MESSAGE_COUNT = Column(Integer, nullable=False, default=0, server_default="0")
+    FIRST_MESSAGE_AT = Column(DateTime(timezone=True), server_default=func.now())
+    LAST_ACTIVITY_AT = Column(DateTime(timezone=True), server_default=func.now())
+    LAST_MESSAGE_ID = Column(Integer, nullable=False, default=0, server_default="0")
+    PREVIEW = Column(Text, nullable=True)
+    UPDATED_AT = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint("USER_ID", "SESSION_ID", name="uq_session_summary_user_session"),
+        # Session list: newest first, keyset-paginated by LAST_MESSAGE_ID
+        Index("idx_session_summary_user_last", "USER_ID", "LAST_MESSAGE_ID"),
+    )
+
+    def __repr__(self):
+        return f"<SessionSummary(USER_ID={self.USER_ID}, SESSION_ID={self.SESSION_ID}, MESSAGE_COUNT={self.MESSAGE_COUNT})>"
+
+
 class GlobalMemory(Base):
     """
     Global long-term memory model
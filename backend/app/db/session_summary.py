@@ -0,0 +1,139 @@
+"""
+Session summary read model maintenance (TB_SESSION_SUMMARY)
+
+DBConversationStore keeps one summary row per active session in the same
+transaction as its message writes, so session listings are a single indexed
+read instead of an aggregate plus one preview query per session.
+"""
+
+from typing import List, Optional
+
+from sqlalchemy import and_, case, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .models import Conversation, SessionSummary
+
+
+def bump_session_summary(
+    db: Session,
+    user_id: int,
+    session_id: str,
+    message_id: int,
+    speaker_type: str,
+    content: str,
+) -> None:
+    """Count a new message in its session summary (creates the row for a new session)"""
+    values = {
+        "MESSAGE_COUNT": SessionSummary.MESSAGE_COUNT + 1,
+        "LAST_ACTIVITY_AT": func.now(),
+        "LAST_MESSAGE_ID": message_id,
+    }
+    if speaker_type == "user-A":
+        values["PREVIEW"] = func.coalesce(SessionSummary.PREVIEW, content)
+    summary = db.query(SessionSummary).filter(
+        SessionSummary.USER_ID == user_id,
+        SessionSummary.SESSION_ID == session_id,
+    )
+    if summary.update(values, synchronize_session=False):
+        return
+    try:
+        with db.begin_nested():
+            db.add(
+                SessionSummary(
+                    USER_ID=user_id,
+                    SESSION_ID=session_id,
+                    MESSAGE_COUNT=1,
+                    LAST_MESSAGE_ID=message_id,
+                    PREVIEW=content if speaker_type == "user-A" else None,
+                )
+            )
+    except IntegrityError:
+        # Another request created the row first
+        summary.update(values, synchronize_session=False)
+
+
+def rebuild_session_summaries(
+    db: Session, user_id: int, session_ids: Optional[List[str]] = None
+) -> None:
+    """
+    Recompute summary rows from TB_CONVERSATIONS
+    (all sessions of the user if session_ids is None); used after deletes
+    """
+    live = [Conversation.USER_ID == user_id, Conversation.IS_DELETED == "N"]
+    stale = db.query(SessionSummary).filter(SessionSummary.USER_ID == user_id)
+    if session_ids is not None:
+        live.append(Conversation.SESSION_ID.in_(session_ids))
+        stale = stale.filter(SessionSummary.SESSION_ID.in_(session_ids))
+
+    stats = (
+        db.query(
+            Conversation.SESSION_ID,
+            func.count(Conversation.ID).label("message_count"),
+            func.min(Conversation.CREATED_AT).label("created_at"),
+            func.max(Conversation.CREATED_AT).label("last_activity_at"),
+            func.max(Conversation.ID).label("last_message_id"),
+            func.min(
+                case((Conversation.SPEAKER_TYPE == "user-A", Conversation.ID))
+            ).label("preview_id"),
+        )
+        .filter(and_(*live))
+        .group_by(Conversation.SESSION_ID)
+        .all()
+    )
+
+    preview_ids = [row.preview_id for row in stats if row.preview_id is not None]
+    previews = (
+        dict(
+            db.query(Conversation.ID, Conversation.CONTENT)
+            .filter(Conversation.ID.in_(preview_ids))
+            .all()
+        )
+        if preview_ids
+        else {}
+    )
+
+    stale.delete(synchronize_session=False)
+    db.add_all(
+        [
+            SessionSummary(
+                USER_ID=user_id,
+                SESSION_ID=row.SESSION_ID,
+                MESSAGE_COUNT=row.message_count,
+                FIRST_MESSAGE_AT=row.created_at,
+                LAST_ACTIVITY_AT=row.last_activity_at,
+                LAST_MESSAGE_ID=row.last_message_id,
+                PREVIEW=previews.get(row.preview_id),
+            )
+            for row in stats
+        ]
+    )
+
+
+def delete_session_summaries(db: Session, user_id: int, session_ids: List[str]) -> None:
+    db.query(SessionSummary).filter(
+        SessionSummary.USER_ID == user_id,
+        SessionSummary.SESSION_ID.in_(session_ids),
+    ).delete(synchronize_session=False)
+
+
+def backfill_session_summaries(db: Session) -> int:
+    """
+    Build summaries for conversations stored before TB_SESSION_SUMMARY existed
+    (runs only while the summary table is empty)
+
+    Returns:
+        Number of users backfilled
+    """
+    if db.query(SessionSummary.ID).limit(1).first() is not None:
+        return 0
+    user_ids = [
+        row.USER_ID
+        for row in db.query(Conversation.USER_ID)
+        .filter(Conversation.IS_DELETED == "N")
+        .distinct()
+    ]
+    for user_id in user_ids:
+        rebuild_session_summaries(db, user_id)
+    db.commit()
+    return len(user_ids)
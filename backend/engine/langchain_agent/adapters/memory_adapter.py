@@ -16,7 +16,8 @@ from datetime import datetime, timedelta
 from collections import defaultdict
 import re
 
-from app.db.database import SessionLocal
+from app.db.database import SessionLocal, AsyncSessionLocal
+from app.db.async_repository import get_global_memories
 from app.db.models import GlobalMemory, Conversation
 from sqlalchemy import and_, or_, func
 
@@ -78,6 +79,9 @@ class MemoryLayer:
     def _get_db(self):
         return SessionLocal()
     
+    def _get_async_db(self):
+        return AsyncSessionLocal()
+    
     def detect_explicit_memory_request(self, text: str) -> bool:
         """명시적 기억 요청 감지"""
         text_lower = text.lower()
@@ -306,8 +310,6 @@ class MemoryLayer:
         
         db = self._get_db()
         try:
-            memories = []
-            
             # 1. Global Memories (전역 기억) - 중요도 순 정렬
             global_mems = db.query(GlobalMemory).filter(
                 and_(
@@ -316,22 +318,33 @@ class MemoryLayer:
                 )
             ).order_by(GlobalMemory.IMPORTANCE.desc()).all()
             
-            if global_mems:
-                memories.append("=== 사용자 장기 기억 (중요 정보) ===")
-                for mem in global_mems:
-                    importance_marker = "⭐" * min(mem.IMPORTANCE // 2, 5)  # 중요도 시각화
-                    
-                    # 🆕 시간 정보 추가
-                    time_context = self._format_time_context(mem.CREATED_AT)
-                    
-                    memories.append(
-                        f"{importance_marker} [{mem.CATEGORY}] {mem.MEMORY_TEXT} {time_context}"
-                    )
-            
-            return "\n".join(memories)
+            return self._format_memories(global_mems)
         finally:
             db.close()
     
+    async def get_memories_for_prompt_async(self, session_id: str, user_id: int) -> str:
+        """get_memories_for_prompt의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        async with self._get_async_db() as db:
+            global_mems = await get_global_memories(db, user_id)
+        return self._format_memories(global_mems)
+    
+    def _format_memories(self, global_mems: List[GlobalMemory]) -> str:
+        """전역 기억 목록을 프롬프트용 문자열로 변환 (중요도 순으로 정렬된 입력)"""
+        memories = []
+        if global_mems:
+            memories.append("=== 사용자 장기 기억 (중요 정보) ===")
+            for mem in global_mems:
+                importance_marker = "⭐" * min(mem.IMPORTANCE // 2, 5)  # 중요도 시각화
+                
+                # 🆕 시간 정보 추가
+                time_context = self._format_time_context(mem.CREATED_AT)
+                
+                memories.append(
+                    f"{importance_marker} [{mem.CATEGORY}] {mem.MEMORY_TEXT} {time_context}"
+                )
+        
+        return "\n".join(memories)
+    
     def _format_time_context(self, created_at) -> str:
         """
         생성 시간을 사람이 읽기 쉬운 형식으로 변환
@@ -495,6 +508,9 @@ def add_memory(content: str, emotion_result: Dict[str, Any], session_id: str, us
 def get_memories_for_prompt(session_id: str, user_id: int) -> str:
     return _memory_layer.get_memories_for_prompt(session_id, user_id)
 
+async def get_memories_for_prompt_async(session_id: str, user_id: int) -> str:
+    return await _memory_layer.get_memories_for_prompt_async(session_id, user_id)
+
 def promote_memory(
     user_id: int,
     session_id: str,
@@ -848,7 +848,7 @@ async def run_ai_bomi_from_text_v2(
     
     # 1. Save User Message (조건부) - 원본만 저장
     if save_to_db:
-        store.add_message(user_id, session_id, "user", user_text, speaker_id=speaker_id)
+        await store.add_message_async(user_id, session_id, "user", user_text, speaker_id=speaker_id)
     
     
     # ⚡ 2. Lightweight Classifier Only (for Orchestrator hint)
@@ -944,11 +944,11 @@ async def run_ai_bomi_from_text_v2(
     try:
         # Memory Layer
         try:
-            from .adapters.memory_adapter import get_memories_for_prompt
+            from .adapters.memory_adapter import get_memories_for_prompt_async
         except ImportError:
-            from adapters.memory_adapter import get_memories_for_prompt
+            from adapters.memory_adapter import get_memories_for_prompt_async
             
-        memories = get_memories_for_prompt(session_id, user_id)
+        memories = await get_memories_for_prompt_async(session_id, user_id)
         if memories:
             memory_context = f"[기억된 정보]\n{memories}\n"
             
@@ -969,7 +969,7 @@ async def run_ai_bomi_from_text_v2(
         logger.error(f"Context Retrieval Error: {e}")
         
     # 5. Generate Response (Fast Track)
-    conversation_history = store.get_history(user_id, session_id, limit=None)
+    conversation_history = await store.get_history_async(user_id, session_id, limit=None)
     
     # 🆕 Phase 4: LLM 응답 생성 (clean text + audio tags + emotion)
     ai_response_dict = generate_llm_response(
@@ -997,7 +997,7 @@ async def run_ai_bomi_from_text_v2(
     
     # 6. Save AI Response (조건부) - 원본 텍스트만 저장 (audio tag 제거됨)
     if save_to_db:
-        store.add_message(user_id, session_id, "assistant", ai_response_text_clean)
+        await store.add_message_async(user_id, session_id, "assistant", ai_response_text_clean)
     
     # Update RAG with AI response (원본 텍스트만 저장)
     try:
@@ -1080,7 +1080,7 @@ async def run_ai_bomi_from_text_v2(
                 embedding = embedder.encode(user_text).tolist()
                 embedding_json = json.dumps(embedding)
                 
-                analysis_id = store.save_emotion_analysis(
+                analysis_id = await store.save_emotion_analysis_async(
                     user_id, user_text, emotion_result, 
                     check_root="conversation",
                     input_text_embedding=embedding_json
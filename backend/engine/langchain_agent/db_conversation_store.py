@@ -2,13 +2,29 @@
 DB-based Conversation Store
 Replaces InMemoryConversationStore with database persistence
 """
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable, Tuple
+from collections import OrderedDict
 from datetime import datetime
+import threading
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, func
+from sqlalchemy import and_, func
 
-from app.db.database import SessionLocal
-from app.db.models import Conversation, User, EmotionAnalysis, SpeakerProfile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import SessionLocal, AsyncSessionLocal
+from app.db.models import Conversation, User, SpeakerProfile, SessionSummary
+from app.db.async_repository import (
+    add_conversation_message,
+    add_emotion_analysis,
+    build_emotion_analysis,
+    get_history_rows,
+    get_session_summary,
+)
+from app.db.session_summary import (
+    bump_session_summary,
+    delete_session_summaries,
+    rebuild_session_summaries,
+)
 
 # Import vectorstore for RAG sync
 # Note: Using local import inside methods to avoid circular import if necessary, 
@@ -24,14 +40,20 @@ class DBConversationStore:
     Features:
     - User-based data isolation (USER_ID filtering)
     - Soft delete (IS_DELETED = 'Y'/'N')
-    - Automatic session/message limits (LRU/FIFO)
+    - Automatic session/message limits (LRU/FIFO), enforced in amortized batches
+    - Session list served from TB_SESSION_SUMMARY, kept in sync on insert/delete
     - Full audit trail (CREATED_BY, UPDATED_BY)
     """
     
+    # Upper bound on tracked (user, session) retention counters
+    MAX_TRACKED_SESSIONS = 10000
+    
     def __init__(
         self,
         max_sessions_per_user: int = 100,
-        max_messages_per_session: int = 50
+        max_messages_per_session: int = 50,
+        message_cleanup_every: Optional[int] = None,
+        session_cleanup_every: Optional[int] = None
     ):
         """
         Initialize DB conversation store
@@ -39,14 +61,33 @@ class DBConversationStore:
         Args:
             max_sessions_per_user: Maximum sessions per user (default: 100)
             max_messages_per_session: Maximum messages per session (default: 50)
+            message_cleanup_every: Inserts into a session between FIFO cleanups
+                (default: 10% of max_messages_per_session)
+            session_cleanup_every: New sessions of a user between LRU cleanups
+                (default: 10% of max_sessions_per_user)
+        
+        Limits are soft: between cleanups a session may hold up to
+        message_cleanup_every - 1 extra messages (and a user as many extra sessions).
         """
         self.max_sessions = max_sessions_per_user
         self.max_messages = max_messages_per_session
+        self.message_cleanup_every = message_cleanup_every or max(1, max_messages_per_session // 10)
+        self.session_cleanup_every = session_cleanup_every or max(1, max_sessions_per_user // 10)
+        self._speaker_profile_listeners: List[Callable[[int], None]] = []
+        
+        # Retention counters (in memory, reset on restart)
+        self._retention_lock = threading.Lock()
+        self._inserts_since_cleanup: "OrderedDict[Tuple[int, str], int]" = OrderedDict()
+        self._new_sessions_since_cleanup: Dict[int, int] = {}
     
     def _get_db(self) -> Session:
         """Get database session"""
         return SessionLocal()
     
+    def _get_async_db(self) -> AsyncSession:
+        """Get async database session (for the *_async methods)"""
+        return AsyncSessionLocal()
+    
     # def _get_vectorstore(self):
     #     """Get vectorstore instance (lazy import)"""
     #     try:
@@ -79,21 +120,8 @@ class DBConversationStore:
         """
         db = self._get_db()
         try:
-            emotion_analysis = EmotionAnalysis(
-                USER_ID=user_id,
-                CHECK_ROOT=check_root,
-                TEXT=text,
-                INPUT_TEXT_EMBEDDING=input_text_embedding,  # NEW
-                LANGUAGE=emotion_result.get("language", "ko"),
-                RAW_DISTRIBUTION=emotion_result.get("raw_distribution"),
-                PRIMARY_EMOTION=emotion_result.get("primary_emotion"),
-                SECONDARY_EMOTIONS=emotion_result.get("secondary_emotions"),
-                SENTIMENT_OVERALL=emotion_result.get("sentiment_overall", "neutral"),
-                MIXED_EMOTION=emotion_result.get("mixed_emotion"),
-                SERVICE_SIGNALS=emotion_result.get("service_signals"),
-                RECOMMENDED_RESPONSE_STYLE=emotion_result.get("recommended_response_style"),
-                RECOMMENDED_ROUTINE_TAGS=emotion_result.get("recommended_routine_tags"),
-                REPORT_TAGS=emotion_result.get("report_tags")
+            emotion_analysis = build_emotion_analysis(
+                user_id, text, emotion_result, check_root, input_text_embedding
             )
             
             db.add(emotion_analysis)
@@ -107,6 +135,37 @@ class DBConversationStore:
             return -1
         finally:
             db.close()
+    
+    async def save_emotion_analysis_async(
+        self,
+        user_id: int,
+        text: str,
+        emotion_result: Dict[str, Any],
+        check_root: str = "conversation",
+        input_text_embedding: Optional[str] = None
+    ) -> int:
+        """
+        Async version of save_emotion_analysis (does not block the event loop)
+        
+        Returns:
+            ID of created record, or -1 if failed
+        """
+        async with self._get_async_db() as db:
+            try:
+                return await add_emotion_analysis(
+                    db, user_id, text, emotion_result, check_root, input_text_embedding
+                )
+            except Exception as e:
+                print(f"[DBConversationStore] ⚠️ Failed to save emotion analysis: {e}")
+                await db.rollback()
+                return -1
+    
+    @staticmethod
+    def _speaker_type(role: str, speaker_id: Optional[str] = None) -> str:
+        """Map role to SPEAKER_TYPE ("assistant", or the speaker ID defaulting to "user-A")"""
+        if role == "assistant":
+            return "assistant"
+        return speaker_id if speaker_id else "user-A"
 
     def add_message(
         self,
@@ -133,12 +192,7 @@ class DBConversationStore:
         """
         db = self._get_db()
         try:
-            # Map role to SPEAKER_TYPE
-            if role == "assistant":
-                speaker_type = "assistant"
-            else:
-                # Use provided speaker_id or default to "user-A"
-                speaker_type = speaker_id if speaker_id else "user-A"
+            speaker_type = self._speaker_type(role, speaker_id)
             
             # Create conversation record
             conversation = Conversation(
@@ -152,22 +206,109 @@ class DBConversationStore:
             )
             
             db.add(conversation)
+            db.flush()  # INSERT only; the ID comes back with it
+            conversation_id = conversation.ID
+            bump_session_summary(db, user_id, session_id, conversation_id, speaker_type, content)
             db.commit()
-            db.refresh(conversation)  # 🆕 Get ID from database
             
-            conversation_id = conversation.ID
+            trim_messages, trim_sessions = self._count_insert(user_id, session_id)
             
             # Apply message limit (FIFO - delete oldest)
-            self.cleanup_old_messages(user_id, session_id, db)
+            if trim_messages:
+                self.cleanup_old_messages(user_id, session_id, db)
             
             # Apply session limit (LRU - delete least recently used)
-            self.cleanup_old_sessions(user_id, db)
+            if trim_sessions:
+                self.cleanup_old_sessions(user_id, db)
             
             return conversation_id  # 🆕 Return ID for tracking
             
         finally:
             db.close()
     
+    async def add_message_async(
+        self,
+        user_id: int,
+        session_id: str,
+        role: str,
+        content: str,
+        metadata: Optional[Dict] = None,
+        speaker_id: Optional[str] = None
+    ) -> int:
+        """
+        Async version of add_message (same retention rules)
+        
+        Returns:
+            ID of the created conversation record
+        """
+        async with self._get_async_db() as db:
+            conversation_id = await add_conversation_message(
+                db, user_id, session_id, self._speaker_type(role, speaker_id), content
+            )
+            
+            trim_messages, trim_sessions = self._count_insert(user_id, session_id)
+            # Cleanups reuse the sync implementations on the session's sync facade
+            if trim_messages:
+                await db.run_sync(lambda sync_db: self.cleanup_old_messages(user_id, session_id, sync_db))
+            if trim_sessions:
+                await db.run_sync(lambda sync_db: self.cleanup_old_sessions(user_id, sync_db))
+            
+            return conversation_id
+    
+    def _count_insert(self, user_id: int, session_id: str) -> Tuple[bool, bool]:
+        """
+        Update retention counters for one insert
+        
+        Returns:
+            (FIFO cleanup due for the session, LRU cleanup due for the user)
+        """
+        key = (user_id, session_id)
+        with self._retention_lock:
+            is_new_session = key not in self._inserts_since_cleanup
+            inserts = self._inserts_since_cleanup.pop(key, 0) + 1
+            trim_messages = inserts >= self.message_cleanup_every
+            self._inserts_since_cleanup[key] = 0 if trim_messages else inserts
+            if len(self._inserts_since_cleanup) > self.MAX_TRACKED_SESSIONS:
+                self._inserts_since_cleanup.popitem(last=False)
+            
+            trim_sessions = False
+            if is_new_session:
+                new_sessions = self._new_sessions_since_cleanup.get(user_id, 0) + 1
+                trim_sessions = new_sessions >= self.session_cleanup_every
+                self._new_sessions_since_cleanup[user_id] = 0 if trim_sessions else new_sessions
+        return trim_messages, trim_sessions
+    
+    def _history_query(self, db: Session, user_id: int, session_id: str, before_id: Optional[int] = None):
+        """
+        Newest-first keyset query over idx_conv_user_session_live_id
+        (USER_ID, SESSION_ID, IS_DELETED, ID), projecting only the columns
+        the history needs (rows are tuples, not ORM objects)
+        """
+        query = db.query(
+            Conversation.ID,
+            Conversation.SPEAKER_TYPE,
+            Conversation.CONTENT,
+            Conversation.CREATED_AT
+        ).filter(
+            and_(
+                Conversation.USER_ID == user_id,
+                Conversation.SESSION_ID == session_id,
+                Conversation.IS_DELETED == 'N'
+            )
+        )
+        if before_id is not None:
+            query = query.filter(Conversation.ID < before_id)
+        return query.order_by(Conversation.ID.desc())
+    
+    @staticmethod
+    def _history_row_to_dict(row) -> Dict:
+        return {
+            "role": "assistant" if row.SPEAKER_TYPE == "assistant" else "user",
+            "content": row.CONTENT,
+            "timestamp": row.CREATED_AT.isoformat(),
+            "message_id": row.ID
+        }
+    
     def get_history(
         self,
         user_id: int,
@@ -183,39 +324,83 @@ class DBConversationStore:
             limit: Maximum number of messages to return (most recent)
         
         Returns:
-            List of message dictionaries
+            List of message dictionaries (oldest first)
         """
         db = self._get_db()
         try:
-            query = db.query(Conversation).filter(
-                and_(
-                    Conversation.USER_ID == user_id,
-                    Conversation.SESSION_ID == session_id,
-                    Conversation.IS_DELETED == 'N'
-                )
-            ).order_by(Conversation.CREATED_AT.asc())
-            
+            query = self._history_query(db, user_id, session_id)
             if limit:
-                # Get last N messages
-                total = query.count()
-                if total > limit:
-                    query = query.offset(total - limit)
-            
-            messages = query.all()
-            
-            # Convert to dict format
-            return [
-                {
-                    "role": "assistant" if msg.SPEAKER_TYPE == "assistant" else "user",
-                    "content": msg.CONTENT,
-                    "timestamp": msg.CREATED_AT.isoformat(),
-                    "message_id": msg.ID
-                }
-                for msg in messages
-            ]
+                # Last N messages: ORDER BY ID DESC LIMIT N, no COUNT/OFFSET
+                query = query.limit(limit)
+            rows = query.all()
+            rows.reverse()
+            return [self._history_row_to_dict(row) for row in rows]
+        finally:
+            db.close()
+    
+    async def get_history_async(
+        self,
+        user_id: int,
+        session_id: str,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """Async version of get_history (oldest first)"""
+        async with self._get_async_db() as db:
+            rows = await get_history_rows(db, user_id, session_id, limit=limit)
+        rows.reverse()
+        return [self._history_row_to_dict(row) for row in rows]
+    
+    def get_history_page(
+        self,
+        user_id: int,
+        session_id: str,
+        limit: int = 50,
+        before_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get one page of history, paging backwards from the newest message
+        
+        Args:
+            user_id: User ID (for data isolation)
+            session_id: Session identifier
+            limit: Page size
+            before_id: Cursor - only messages with a smaller ID (None: newest page)
+        
+        Returns:
+            {"messages": [...] (oldest first), "has_more": bool,
+             "next_cursor": message ID to pass as before_id for the previous page, or None}
+        """
+        db = self._get_db()
+        try:
+            rows = self._history_query(db, user_id, session_id, before_id).limit(limit + 1).all()
+            return self._history_page(rows, limit)
         finally:
             db.close()
     
+    async def get_history_page_async(
+        self,
+        user_id: int,
+        session_id: str,
+        limit: int = 50,
+        before_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Async version of get_history_page"""
+        async with self._get_async_db() as db:
+            rows = await get_history_rows(db, user_id, session_id, limit=limit + 1, before_id=before_id)
+        return self._history_page(rows, limit)
+    
+    @classmethod
+    def _history_page(cls, rows: List[Any], limit: int) -> Dict[str, Any]:
+        """Page dict from up to limit + 1 newest-first rows"""
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        rows.reverse()
+        return {
+            "messages": [cls._history_row_to_dict(row) for row in rows],
+            "has_more": has_more,
+            "next_cursor": rows[0].ID if has_more and rows else None
+        }
+    
     def get_session_messages(
         self,
         user_id: int,
@@ -235,7 +420,11 @@ class DBConversationStore:
         """
         db = self._get_db()
         try:
-            query = db.query(Conversation).filter(
+            query = db.query(
+                Conversation.SPEAKER_TYPE,
+                Conversation.CONTENT,
+                Conversation.CREATED_AT
+            ).filter(
                 and_(
                     Conversation.USER_ID == user_id,
                     Conversation.SESSION_ID == session_id,
@@ -251,7 +440,7 @@ class DBConversationStore:
                 else:
                     query = query.filter(Conversation.SPEAKER_TYPE == role)
             
-            query = query.order_by(Conversation.CREATED_AT.asc())
+            query = query.order_by(Conversation.ID.asc())
             messages = query.all()
             
             return [
@@ -265,58 +454,66 @@ class DBConversationStore:
         finally:
             db.close()
     
-    def get_user_sessions(self, user_id: int) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _summary_to_dict(summary: SessionSummary) -> Dict[str, Any]:
+        return {
+            "session_id": summary.SESSION_ID,
+            "message_count": summary.MESSAGE_COUNT,
+            "created_at": summary.FIRST_MESSAGE_AT.isoformat(),
+            "last_activity_at": summary.LAST_ACTIVITY_AT.isoformat(),
+            "first_message": summary.PREVIEW or "새로운 대화",
+            "status": "active"
+        }
+    
+    def get_user_sessions_page(
+        self,
+        user_id: int,
+        limit: Optional[int] = 20,
+        before_id: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
-        Get all active sessions for a user
+        Get active sessions for a user, most recent first, from TB_SESSION_SUMMARY
         
         Args:
             user_id: User ID
+            limit: Page size (None for all sessions)
+            before_id: Cursor from a previous page's next_cursor (None: first page)
         
         Returns:
-            List of session metadata dictionaries
+            {"sessions": [...], "has_more": bool, "next_cursor": int or None}
         """
         db = self._get_db()
         try:
-            # Get unique sessions with metadata
-            sessions = db.query(
-                Conversation.SESSION_ID,
-                func.count(Conversation.ID).label('message_count'),
-                func.min(Conversation.CREATED_AT).label('created_at'),
-                func.max(Conversation.CREATED_AT).label('last_activity_at')
-            ).filter(
-                and_(
-                    Conversation.USER_ID == user_id,
-                    Conversation.IS_DELETED == 'N'
-                )
-            ).group_by(Conversation.SESSION_ID).order_by(desc('last_activity_at')).all()
-            
-            result = []
-            for session in sessions:
-                # Get first message for preview (user's first message)
-                first_msg = db.query(Conversation.CONTENT).filter(
-                    and_(
-                        Conversation.USER_ID == user_id,
-                        Conversation.SESSION_ID == session.SESSION_ID,
-                        Conversation.SPEAKER_TYPE == 'user-A',
-                        Conversation.IS_DELETED == 'N'
-                    )
-                ).order_by(Conversation.CREATED_AT.asc()).first()
-                
-                preview = first_msg.CONTENT if first_msg else "새로운 대화"
-                
-                result.append({
-                    "session_id": session.SESSION_ID,
-                    "message_count": session.message_count,
-                    "created_at": session.created_at.isoformat(),
-                    "last_activity_at": session.last_activity_at.isoformat(),
-                    "first_message": preview,
-                    "status": "active"
-                })
+            query = db.query(SessionSummary).filter(SessionSummary.USER_ID == user_id)
+            if before_id is not None:
+                query = query.filter(SessionSummary.LAST_MESSAGE_ID < before_id)
+            query = query.order_by(SessionSummary.LAST_MESSAGE_ID.desc())
+            if limit:
+                query = query.limit(limit + 1)
+            summaries = query.all()
             
-            return result
+            has_more = bool(limit) and len(summaries) > limit
+            summaries = summaries[:limit] if limit else summaries
+            return {
+                "sessions": [self._summary_to_dict(summary) for summary in summaries],
+                "has_more": has_more,
+                "next_cursor": summaries[-1].LAST_MESSAGE_ID if has_more else None
+            }
         finally:
             db.close()
     
+    def get_user_sessions(self, user_id: int) -> List[Dict[str, Any]]:
+        """
+        Get all active sessions for a user
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            List of session metadata dictionaries
+        """
+        return self.get_user_sessions_page(user_id, limit=None)["sessions"]
+    
     def get_session_metadata(self, user_id: int, session_id: str) -> Optional[Dict]:
         """
         Get metadata for a specific session
@@ -328,11 +525,21 @@ class DBConversationStore:
         Returns:
             Session metadata dictionary or None
         """
-        sessions = self.get_user_sessions(user_id)
-        for session in sessions:
-            if session["session_id"] == session_id:
-                return session
-        return None
+        db = self._get_db()
+        try:
+            summary = db.query(SessionSummary).filter(
+                SessionSummary.USER_ID == user_id,
+                SessionSummary.SESSION_ID == session_id
+            ).first()
+            return self._summary_to_dict(summary) if summary else None
+        finally:
+            db.close()
+    
+    async def get_session_metadata_async(self, user_id: int, session_id: str) -> Optional[Dict]:
+        """Async version of get_session_metadata"""
+        async with self._get_async_db() as db:
+            summary = await get_session_summary(db, user_id, session_id)
+        return self._summary_to_dict(summary) if summary else None
     
     def clear_session(self, user_id: int, session_id: str) -> None:
         """
@@ -355,6 +562,7 @@ class DBConversationStore:
                 "UPDATED_BY": user_id,
                 "UPDATED_AT": datetime.now()
             })
+            delete_session_summaries(db, user_id, [session_id])
             db.commit()
             
             # Sync with RAG: Delete session (Legacy V1 제거로 인해 비활성화)
@@ -370,7 +578,7 @@ class DBConversationStore:
         user_id: int,
         session_id: str,
         db: Session = None
-    ) -> None:
+    ) -> int:
         """
         Apply FIFO limit: soft delete oldest messages if exceeds limit
         
@@ -378,6 +586,9 @@ class DBConversationStore:
             user_id: User ID
             session_id: Session identifier
             db: Database session (optional, for transaction)
+        
+        Returns:
+            Number of soft-deleted messages
         """
         close_db = False
         if db is None:
@@ -385,52 +596,52 @@ class DBConversationStore:
             close_db = True
         
         try:
-            # Count active messages
-            count = db.query(Conversation).filter(
-                and_(
-                    Conversation.USER_ID == user_id,
-                    Conversation.SESSION_ID == session_id,
-                    Conversation.IS_DELETED == 'N'
-                )
-            ).count()
+            active = and_(
+                Conversation.USER_ID == user_id,
+                Conversation.SESSION_ID == session_id,
+                Conversation.IS_DELETED == 'N'
+            )
+            # ID of the oldest message to keep (IDs grow with insertion order)
+            oldest_kept = db.query(Conversation.ID).filter(active).order_by(
+                Conversation.ID.desc()
+            ).offset(self.max_messages - 1).limit(1).scalar()
+            if oldest_kept is None:
+                return 0
             
-            if count > self.max_messages:
-                # Get oldest messages to delete
-                messages_to_delete = db.query(Conversation).filter(
-                    and_(
-                        Conversation.USER_ID == user_id,
-                        Conversation.SESSION_ID == session_id,
-                        Conversation.IS_DELETED == 'N'
-                    )
-                ).order_by(Conversation.CREATED_AT.asc()).limit(
-                    count - self.max_messages
-                ).all()
-                
-                # Soft delete
-                for msg in messages_to_delete:
-                    msg.IS_DELETED = 'Y'
-                    msg.UPDATED_BY = user_id
-                    msg.UPDATED_AT = datetime.now()
-                
-                db.commit()
-                print(f"[DBConversationStore] Cleaned up {len(messages_to_delete)} old messages (session: {session_id})")
-                
-                # Sync with RAG: Delete oldest messages (Legacy V1 제거로 인해 비활성화)
-                # vectorstore = self._get_vectorstore()
-                # if vectorstore:
-                #     vectorstore.delete_oldest_messages(user_id, session_id, self.max_messages)
+            # Soft delete everything older in one statement
+            deleted = db.query(Conversation).filter(
+                active, Conversation.ID < oldest_kept
+            ).update({
+                "IS_DELETED": 'Y',
+                "UPDATED_BY": user_id,
+                "UPDATED_AT": datetime.now()
+            }, synchronize_session=False)
+            if deleted:
+                rebuild_session_summaries(db, user_id, [session_id])
+            db.commit()
+            if deleted:
+                print(f"[DBConversationStore] Cleaned up {deleted} old messages (session: {session_id})")
+            
+            # Sync with RAG: Delete oldest messages (Legacy V1 제거로 인해 비활성화)
+            # vectorstore = self._get_vectorstore()
+            # if vectorstore:
+            #     vectorstore.delete_oldest_messages(user_id, session_id, self.max_messages)
+            return deleted
                     
         finally:
             if close_db:
                 db.close()
     
-    def cleanup_old_sessions(self, user_id: int, db: Session = None) -> None:
+    def cleanup_old_sessions(self, user_id: int, db: Session = None) -> int:
         """
         Apply LRU limit: soft delete oldest sessions if exceeds limit
         
         Args:
             user_id: User ID
             db: Database session (optional, for transaction)
+        
+        Returns:
+            Number of soft-deleted sessions
         """
         close_db = False
         if db is None:
@@ -438,48 +649,41 @@ class DBConversationStore:
             close_db = True
         
         try:
-            # Get session last activity times
-            session_activities = db.query(
-                Conversation.SESSION_ID,
-                func.max(Conversation.CREATED_AT).label('last_activity')
-            ).filter(
+            # Sessions past the newest max_sessions (by last message ID)
+            stale = db.query(Conversation.SESSION_ID).filter(
                 and_(
                     Conversation.USER_ID == user_id,
                     Conversation.IS_DELETED == 'N'
                 )
-            ).group_by(Conversation.SESSION_ID).all()
+            ).group_by(Conversation.SESSION_ID).order_by(
+                func.max(Conversation.ID).desc()
+            ).offset(self.max_sessions).all()
+            if not stale:
+                return 0
             
-            if len(session_activities) > self.max_sessions:
-                # Sort by last activity (oldest first)
-                sorted_sessions = sorted(
-                    session_activities,
-                    key=lambda x: x.last_activity
+            sessions_to_delete = [row.SESSION_ID for row in stale]
+            db.query(Conversation).filter(
+                and_(
+                    Conversation.USER_ID == user_id,
+                    Conversation.SESSION_ID.in_(sessions_to_delete),
+                    Conversation.IS_DELETED == 'N'
                 )
+            ).update({
+                "IS_DELETED": 'Y',
+                "UPDATED_BY": user_id,
+                "UPDATED_AT": datetime.now()
+            }, synchronize_session=False)
+            delete_session_summaries(db, user_id, sessions_to_delete)
+            
+            # Sync with RAG: Delete session (Legacy V1 제거로 인해 비활성화)
+            # vectorstore = self._get_vectorstore()
+            # if vectorstore:
+            #     for session_id in sessions_to_delete:
+            #         vectorstore.delete_session(user_id, session_id)
                 
-                # Delete oldest sessions
-                sessions_to_delete = sorted_sessions[:len(session_activities) - self.max_sessions]
-                
-                for session in sessions_to_delete:
-                    # Soft delete all messages in session
-                    db.query(Conversation).filter(
-                        and_(
-                            Conversation.USER_ID == user_id,
-                            Conversation.SESSION_ID == session.SESSION_ID,
-                            Conversation.IS_DELETED == 'N'
-                        )
-                    ).update({
-                        "IS_DELETED": 'Y',
-                        "UPDATED_BY": user_id,
-                        "UPDATED_AT": datetime.now()
-                    })
-                    
-                    # Sync with RAG: Delete session (Legacy V1 제거로 인해 비활성화)
-                    # vectorstore = self._get_vectorstore()
-                    # if vectorstore:
-                    #     vectorstore.delete_session(user_id, session.SESSION_ID)
-                        
-                db.commit()
-                print(f"[DBConversationStore] Cleaned up {len(sessions_to_delete)} old sessions (user: {user_id})")
+            db.commit()
+            print(f"[DBConversationStore] Cleaned up {len(sessions_to_delete)} old sessions (user: {user_id})")
+            return len(sessions_to_delete)
         finally:
             if close_db:
                 db.close()
@@ -499,6 +703,9 @@ class DBConversationStore:
             count = db.query(Conversation).filter(
                 Conversation.USER_ID == user_id
             ).delete()
+            db.query(SessionSummary).filter(
+                SessionSummary.USER_ID == user_id
+            ).delete(synchronize_session=False)
             db.commit()
             return count
         finally:
@@ -508,6 +715,20 @@ class DBConversationStore:
     # Speaker Verification Methods
     # ============================================================================
 
+    def add_speaker_profile_listener(self, callback: Callable[[int], None]) -> None:
+        """
+        Register a callback invoked with user_id after a speaker profile is saved/updated
+        (used by the speaker-ID service to invalidate its voiceprint cache)
+        """
+        self._speaker_profile_listeners.append(callback)
+
+    def _notify_speaker_profile_changed(self, user_id: int) -> None:
+        for callback in self._speaker_profile_listeners:
+            try:
+                callback(user_id)
+            except Exception as e:
+                print(f"[DBConversationStore] ⚠️ Speaker profile listener failed: {e}")
+
     def get_speaker_profiles(self, user_id: int) -> List[Dict[str, Any]]:
         """
         Get all active speaker profiles for a user
@@ -572,6 +793,7 @@ class DBConversationStore:
             db.add(profile)
             db.commit()
             db.refresh(profile)
+            self._notify_speaker_profile_changed(user_id)
             return profile.ID
         except Exception as e:
             print(f"[DBConversationStore] ⚠️ Failed to save speaker profile: {e}")
@@ -611,6 +833,7 @@ class DBConversationStore:
             profile.UPDATED_AT = datetime.now()
             
             db.commit()
+            self._notify_speaker_profile_changed(profile.USER_ID)
             return True
         except Exception as e:
             print(f"[DBConversationStore] ⚠️ Failed to update speaker profile: {e}")
@@ -619,6 +842,58 @@ class DBConversationStore:
         finally:
             db.close()
 
+    def write_speaker_profiles(self, profiles: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """
+        Insert/update several speaker profiles in one transaction
+        
+        Used by the speaker-ID service's write-behind flush; listeners are not
+        notified because the caller's cache already holds these values.
+        
+        Args:
+            profiles: List of dicts with user_id, speaker_type, profile_id
+                (None for a new profile), embedding, score
+            
+        Returns:
+            Profile IDs in input order
+        """
+        if not profiles:
+            return []
+        
+        db = self._get_db()
+        try:
+            now = datetime.now()
+            update_ids = [p["profile_id"] for p in profiles if p["profile_id"] is not None]
+            existing = {}
+            if update_ids:
+                existing = {
+                    row.ID: row
+                    for row in db.query(SpeakerProfile).filter(SpeakerProfile.ID.in_(update_ids)).all()
+                }
+            
+            rows = []
+            for p in profiles:
+                row = existing.get(p["profile_id"]) if p["profile_id"] is not None else None
+                if row is None:
+                    row = SpeakerProfile(
+                        USER_ID=p["user_id"],
+                        SPEAKER_TYPE=p["speaker_type"],
+                        CREATED_BY=p["user_id"],
+                    )
+                    db.add(row)
+                row.EMBEDDING = p["embedding"]
+                row.CURRENT_SCORE = p["score"]
+                row.UPDATED_BY = p["user_id"]
+                row.UPDATED_AT = now
+                rows.append(row)
+            
+            db.commit()
+            return [row.ID for row in rows]
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
     # ============================================================================
     # Phase 3: Temporary Message Management
     # ============================================================================
@@ -652,12 +927,17 @@ class DBConversationStore:
             
         db = self._get_db()
         try:
-            count = db.query(Conversation).filter(
-                and_(
-                    Conversation.USER_ID == user_id,
-                    Conversation.ID.in_(message_ids)
-                )
-            ).delete(synchronize_session=False)
+            messages = and_(
+                Conversation.USER_ID == user_id,
+                Conversation.ID.in_(message_ids)
+            )
+            session_ids = [
+                row.SESSION_ID
+                for row in db.query(Conversation.SESSION_ID).filter(messages).distinct()
+            ]
+            count = db.query(Conversation).filter(messages).delete(synchronize_session=False)
+            if session_ids:
+                rebuild_session_summaries(db, user_id, session_ids)
             db.commit()
             return count
         except Exception as e:
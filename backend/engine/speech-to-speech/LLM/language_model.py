@@ -11,7 +11,8 @@ from LLM.chat import Chat
 from baseHandler import BaseHandler
 from rich.console import Console
 import logging
-from nltk import sent_tokenize
+
+from LLM.sentence_segmenter import SentenceSegmenter
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,8 @@ class LanguageModelHandler(BaseHandler):
     Handles the language model part.
     """
 
+    session_attributes = ("chat",)
+
     def setup(
         self,
         model_name="microsoft/Phi-3-mini-4k-instruct",
@@ -48,8 +51,10 @@ class LanguageModelHandler(BaseHandler):
         chat_size=1,
         init_chat_role=None,
         init_chat_prompt="You are a helpful AI assistant.",
+        min_sentence_chars=6,
     ):
         self.device = device
+        self.min_sentence_chars = min_sentence_chars
         self.torch_dtype = getattr(torch, torch_dtype)
 
         self.tokenizer = AutoTokenizer.from_pretrained(model_name)
@@ -137,16 +142,16 @@ class LanguageModelHandler(BaseHandler):
             printable_text = generated_text
             torch.mps.empty_cache()
         else:
-            generated_text, printable_text = "", ""
+            generated_text = ""
+            segmenter = SentenceSegmenter(self.min_sentence_chars)
             for new_text in self.streamer:
                 generated_text += new_text
-                printable_text += new_text
-                sentences = sent_tokenize(printable_text)
-                if len(sentences) > 1:
-                    yield (sentences[0], language_code)
-                    printable_text = new_text
+                for sentence in segmenter.feed(new_text):
+                    yield (sentence, language_code)
+            printable_text = segmenter.flush()
 
         self.chat.append({"role": "assistant", "content": generated_text})
 
         # don't forget last sentence
-        yield (printable_text, language_code)
+        if printable_text:
+            yield (printable_text, language_code)
@@ -1,5 +1,6 @@
 import logging
 from LLM.chat import Chat
+from LLM.sentence_segmenter import SentenceSegmenter
 from baseHandler import BaseHandler
 from mlx_lm import load, stream_generate, generate
 from rich.console import Console
@@ -29,6 +30,8 @@ class MLXLanguageModelHandler(BaseHandler):
     Handles the language model part.
     """
 
+    session_attributes = ("chat",)
+
     def setup(
         self,
         model_name="microsoft/Phi-3-mini-4k-instruct",
@@ -39,8 +42,10 @@ class MLXLanguageModelHandler(BaseHandler):
         chat_size=1,
         init_chat_role=None,
         init_chat_prompt="You are a helpful AI assistant.",
+        min_sentence_chars=6,
     ):
         self.model_name = model_name
+        self.min_sentence_chars = min_sentence_chars
         self.model, self.tokenizer = load(self.model_name)
         self.gen_kwargs = gen_kwargs
 
@@ -97,7 +102,7 @@ class MLXLanguageModelHandler(BaseHandler):
             chat_messages, tokenize=False, add_generation_prompt=True
         )
         output = ""
-        curr_output = ""
+        segmenter = SentenceSegmenter(self.min_sentence_chars)
         for t in stream_generate(
             self.model,
             self.tokenizer,
@@ -105,10 +110,11 @@ class MLXLanguageModelHandler(BaseHandler):
             max_tokens=self.gen_kwargs["max_new_tokens"],
         ):
             output += t.text
-            curr_output += t.text
-            if curr_output.endswith((".", "?", "!", "<|end|>")):
-                yield (curr_output.replace("<|end|>", ""), language_code)
-                curr_output = ""
+            for sentence in segmenter.feed(t.text.replace("<|end|>", "")):
+                yield (sentence, language_code)
+        last_sentence = segmenter.flush()
+        if last_sentence:
+            yield (last_sentence, language_code)
         generated_text = output.replace("<|end|>", "")
         torch.mps.empty_cache()
 
@@ -1,12 +1,12 @@
 import logging
 import time
 
-from nltk import sent_tokenize
 from rich.console import Console
 from openai import OpenAI
 
 from baseHandler import BaseHandler
 from LLM.chat import Chat
+from LLM.sentence_segmenter import SentenceSegmenter
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +25,9 @@ class OpenApiModelHandler(BaseHandler):
     """
     Handles the language model part.
     """
+
+    session_attributes = ("chat",)
+
     def setup(
         self,
         model_name="deepseek-chat",
@@ -37,9 +40,11 @@ class OpenApiModelHandler(BaseHandler):
         chat_size=1,
         init_chat_role="system",
         init_chat_prompt="You are a helpful AI assistant.",
+        min_sentence_chars=6,
     ):
         self.model_name = model_name
         self.stream = stream
+        self.min_sentence_chars = min_sentence_chars
         self.chat = Chat(chat_size)
         if init_chat_role:
             if not init_chat_prompt:
@@ -85,18 +90,20 @@ class OpenApiModelHandler(BaseHandler):
                 stream=self.stream
             )
             if self.stream:
-                generated_text, printable_text = "", ""
+                generated_text = ""
+                segmenter = SentenceSegmenter(self.min_sentence_chars)
                 for chunk in response:
+                    if not chunk.choices:
+                        continue
                     new_text = chunk.choices[0].delta.content or ""
                     generated_text += new_text
-                    printable_text += new_text
-                    sentences = sent_tokenize(printable_text)
-                    if len(sentences) > 1:
-                        yield sentences[0], language_code
-                        printable_text = new_text
+                    for sentence in segmenter.feed(new_text):
+                        yield sentence, language_code
                 self.chat.append({"role": "assistant", "content": generated_text})
                 # don't forget last sentence
-                yield printable_text, language_code
+                last_sentence = segmenter.flush()
+                if last_sentence:
+                    yield last_sentence, language_code
             else:
                 generated_text = response.choices[0].message.content
                 self.chat.append({"role": "assistant", "content": generated_text})
@@ -0,0 +1,95 @@
+import re
+
+TERMINALS = ".?!…。？！~"
+CLOSERS = "\"'”’)]}」』"
+SOFT_BREAKS = ",;:、，"
+
+# English abbreviations that end with a period but rarely end a sentence
+ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "e.g", "i.e", "no", "approx",
+}
+
+_TERMINAL_RUN = re.compile(rf"[{re.escape(TERMINALS)}]+[{re.escape(CLOSERS)}]*")
+_HANGUL = re.compile(r"[가-힣]")
+
+
+class SentenceSegmenter:
+    """
+    Incremental Korean/English sentence splitter for streamed LLM output.
+
+    `feed` takes the newly generated text and returns the sentences it completes, so the
+    first sentence can be synthesized while the rest is still being generated; `flush`
+    returns what is left once generation ends.
+
+    - A run of terminal punctuation (`다.`, `요?`, `...`, plus closing quotes/brackets)
+      ends a sentence once the next character is whitespace, or Hangul directly after a
+      Hangul sentence (`했어요.그래서`). The run is only judged after that next character
+      arrives, so "..." or a closing quote is never cut off.
+    - Decimals and English abbreviations ("3.5", "Dr.") are not boundaries.
+    - Sentences shorter than `min_chars` are merged with the next one so the TTS is not
+      called on fragments like "네.".
+    - Past `max_chars` without a boundary, the text is split at the last clause
+      punctuation or space (0 disables).
+    """
+
+    def __init__(self, min_chars=6, max_chars=150):
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self.buffer = ""
+
+    def feed(self, text):
+        self.buffer += text
+        sentences = []
+        start = 0
+        for match in _TERMINAL_RUN.finditer(self.buffer):
+            end = match.end()
+            if not self._is_boundary(match, start):
+                continue
+            candidate = self.buffer[start:end].strip()
+            if len(candidate) < self.min_chars:
+                continue
+            sentences.append(candidate)
+            start = end
+        self.buffer = self.buffer[start:]
+        if self.max_chars and len(self.buffer) > self.max_chars:
+            sentences.extend(self._split_long())
+        return sentences
+
+    def flush(self):
+        rest, self.buffer = self.buffer.strip(), ""
+        return rest
+
+    def _is_boundary(self, match, start):
+        end = match.end()
+        text = self.buffer
+        if end == len(text):
+            # End of what has been generated so far: wait for the next token
+            return False
+        if not text[end].isspace() and not self._joins_korean_sentences(match):
+            return False
+        if text[match.start()] == ".":
+            word = text[start:match.start()].split()[-1:] or [""]
+            word = word[0].lower().lstrip("\"'“(")
+            if word in ABBREVIATIONS or (len(word) == 1 and word.isascii() and word.isalpha()):
+                return False
+        return True
+
+    def _joins_korean_sentences(self, match):
+        """`다.그리고` (no space between Hangul sentences), but not `요."라고`."""
+        text = self.buffer
+        return (
+            match.start() > 0
+            and _HANGUL.match(text[match.start() - 1])
+            and _HANGUL.match(text[match.end()])
+            and not any(char in CLOSERS for char in match.group())
+        )
+
+    def _split_long(self):
+        window = self.buffer[: self.max_chars]
+        cut = max(window.rfind(char) for char in SOFT_BREAKS)
+        if cut < self.min_chars:
+            cut = window.rfind(" ")
+        if cut < self.min_chars:
+            return []
+        head, self.buffer = self.buffer[: cut + 1].strip(), self.buffer[cut + 1 :]
+        return [head]
@@ -32,6 +32,8 @@ class LightningWhisperSTTHandler(BaseHandler):
     Handles the Speech To Text generation using a Whisper model.
     """
 
+    session_attributes = ("last_language",)
+
     def setup(
         self,
         model_name="distil-large-v3",
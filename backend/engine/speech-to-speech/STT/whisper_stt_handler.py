@@ -33,6 +33,8 @@ class WhisperSTTHandler(BaseHandler):
     Handles the Speech To Text generation using a Whisper model.
     """
 
+    session_attributes = ("last_language",)
+
     def setup(
         self,
         model_name="distil-whisper/distil-large-v3",
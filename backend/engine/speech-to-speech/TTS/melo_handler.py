@@ -1,4 +1,5 @@
 from .api import TTS
+from collections import OrderedDict
 import logging
 from baseHandler import BaseHandler
 import librosa
@@ -29,6 +30,44 @@ WHISPER_LANGUAGE_TO_MELO_SPEAKER = {
 }
 
 
+class MeloModelCache:
+    """
+    LRU cache of loaded Melo models keyed by (Melo language, device).
+    Switching back to a cached language reuses its weights instead of reloading the checkpoint.
+    """
+
+    def __init__(self, capacity=2):
+        self.capacity = max(1, capacity)
+        self.models = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, language, device):
+        key = (language, device)
+        model = self.models.get(key)
+        if model is not None:
+            self.models.move_to_end(key)
+            self.hits += 1
+            return model
+
+        self.misses += 1
+        logger.info(f"Loading Melo model for {language} on {device}")
+        model = TTS(language=language, device=device)
+        self.models[key] = model
+        while len(self.models) > self.capacity:
+            (evicted, _), _ = self.models.popitem(last=False)
+            logger.info(f"Evicted Melo model for {evicted}")
+            if str(device).startswith("cuda"):
+                torch.cuda.empty_cache()
+        return model
+
+    def __contains__(self, key):
+        return key in self.models
+
+    def __len__(self):
+        return len(self.models)
+
+
 class MeloTTSHandler(BaseHandler):
     def setup(
         self,
@@ -38,22 +77,38 @@ class MeloTTSHandler(BaseHandler):
         speaker_to_id="en",
         gen_kwargs={},  # Unused
         blocksize=512,
+        model_cache_size=2,
+        preload_languages="",
     ):
         self.should_listen = should_listen
         self.device = device
         self.language = language
-        self.model = TTS(
-            language=WHISPER_LANGUAGE_TO_MELO_LANGUAGE[self.language], device=device
-        )
+        preload = []
+        for code in (code.strip() for code in preload_languages.split(",")):
+            if not code or code == language or code in preload:
+                continue
+            if code not in WHISPER_LANGUAGE_TO_MELO_LANGUAGE:
+                logger.warning(f"Language {code} not supported by Melo, not preloading it")
+                continue
+            preload.append(code)
+        # Every declared language must fit, otherwise preloading would evict itself
+        self.models = MeloModelCache(max(model_cache_size, len(preload) + 1))
+        for code in preload:
+            self.warmup(self.models.get(WHISPER_LANGUAGE_TO_MELO_LANGUAGE[code], device), code)
+        self.model = self.models.get(WHISPER_LANGUAGE_TO_MELO_LANGUAGE[self.language], device)
         self.speaker_id = self.model.hps.data.spk2id[
             WHISPER_LANGUAGE_TO_MELO_SPEAKER[speaker_to_id]
         ]
         self.blocksize = blocksize
         self.warmup()
 
-    def warmup(self):
+    def warmup(self, model=None, language_code=None):
         logger.info(f"Warming up {self.__class__.__name__}")
-        _ = self.model.tts_to_file("text", self.speaker_id, quiet=True)
+        if model is None:
+            model, speaker_id = self.model, self.speaker_id
+        else:
+            speaker_id = model.hps.data.spk2id[WHISPER_LANGUAGE_TO_MELO_SPEAKER[language_code]]
+        _ = model.tts_to_file("text", speaker_id, quiet=True)
 
     def process(self, llm_sentence):
         language_code = None
@@ -65,9 +120,8 @@ class MeloTTSHandler(BaseHandler):
 
         if language_code is not None and self.language != language_code:
             try:
-                self.model = TTS(
-                    language=WHISPER_LANGUAGE_TO_MELO_LANGUAGE[language_code],
-                    device=self.device,
+                self.model = self.models.get(
+                    WHISPER_LANGUAGE_TO_MELO_LANGUAGE[language_code], self.device
                 )
                 self.speaker_id = self.model.hps.data.spk2id[
                     WHISPER_LANGUAGE_TO_MELO_SPEAKER[language_code]
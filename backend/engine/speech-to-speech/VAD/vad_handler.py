@@ -20,6 +20,9 @@ class VADHandler(BaseHandler):
     to the following part.
     """
 
+    # Each client gets its own iterator (and silero model state)
+    session_attributes = ("iterator",)
+
     def setup(
         self,
         should_listen,
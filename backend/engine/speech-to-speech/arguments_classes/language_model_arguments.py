@@ -69,3 +69,9 @@ class LanguageModelHandlerArguments:
             "help": "Number of interactions assitant-user to keep for the chat. None for no limitations."
         },
     )
+    lm_min_sentence_chars: int = field(
+        default=6,
+        metadata={
+            "help": "Minimum length of a streamed sentence sent to the TTS; shorter fragments are merged with the next sentence. Default is 6."
+        },
+    )
@@ -21,3 +21,15 @@ class MeloTTSHandlerArguments:
             "help": "Mapping of speaker names to speaker IDs. Default is ['EN-Newest']."
         },
     )
+    melo_model_cache_size: int = field(
+        default=2,
+        metadata={
+            "help": "Number of Melo models (one per language) kept loaded for language switches. Default is 2."
+        },
+    )
+    melo_preload_languages: str = field(
+        default="",
+        metadata={
+            "help": "Comma-separated language codes (e.g. 'ko,en') to load and warm up during setup. Default is ''."
+        },
+    )
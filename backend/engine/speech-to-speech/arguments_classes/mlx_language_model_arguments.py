@@ -63,3 +63,9 @@ class MLXLanguageModelHandlerArguments:
             "help": "Number of interactions assitant-user to keep for the chat. None for no limitations."
         },
     )
+    mlx_lm_min_sentence_chars: int = field(
+        default=6,
+        metadata={
+            "help": "Minimum length of a streamed sentence sent to the TTS; shorter fragments are merged with the next sentence. Default is 6."
+        },
+    )
@@ -11,7 +11,13 @@ class ModuleArguments:
     mode: Optional[str] = field(
         default="socket",
         metadata={
-            "help": "The mode to run the pipeline in. Either 'local' or 'socket'. Default is 'socket'."
+            "help": "The mode to run the pipeline in. Either 'local', 'socket' or 'server' (multi-client asyncio server). Default is 'socket'."
+        },
+    )
+    max_clients: int = field(
+        default=8,
+        metadata={
+            "help": "Maximum number of concurrent clients in 'server' mode. Default is 8."
         },
     )
     local_mac_optimal_settings: bool = field(
@@ -44,3 +50,33 @@ class ModuleArguments:
             "help": "Provide logging level. Example --log_level debug, default=info."
         },
     )
+    queue_maxsize: int = field(
+        default=64,
+        metadata={
+            "help": "Maximum number of items in each inter-stage queue (0 means unbounded). The outgoing audio queue is always unbounded. Default is 64."
+        },
+    )
+    queue_policy: str = field(
+        default="block",
+        metadata={
+            "help": "What a producer does when a queue is full: 'block', 'drop_oldest' or 'drop_newest'. Default is 'block'."
+        },
+    )
+    recv_queue_policy: str = field(
+        default="drop_oldest",
+        metadata={
+            "help": "Full-queue policy for incoming audio chunks. Default is 'drop_oldest' so the receiver never blocks."
+        },
+    )
+    process_handlers: str = field(
+        default="",
+        metadata={
+            "help": "Comma-separated pipeline stages to run in their own process instead of a thread: any of 'vad', 'stt', 'llm', 'tts'. Audio is passed through shared memory. Default is '' (all threads)."
+        },
+    )
+    metrics_report_interval: float = field(
+        default=60.0,
+        metadata={
+            "help": "Seconds between pipeline latency reports in the log (0 disables). Default is 60."
+        },
+    )
@@ -49,9 +49,15 @@ class OpenApiLanguageModelHandlerArguments:
         },
     )
     open_api_stream: bool = field(
-        default=False,
+        default=True,
         metadata={
             "help": "The stream parameter typically indicates whether data should be transmitted in a continuous flow rather"
-                    " than in a single, complete response, often used for handling large or real-time data.Default is False"
+                    " than in a single, complete response, often used for handling large or real-time data. Sentences are sent to the TTS as soon as they are complete. Default is True"
         },
-    )
\ No newline at end of file
+    )
+    open_api_min_sentence_chars: int = field(
+        default=6,
+        metadata={
+            "help": "Minimum length of a streamed sentence sent to the TTS; shorter fragments are merged with the next sentence. Default is 6."
+        },
+    )
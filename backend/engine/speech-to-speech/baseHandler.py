@@ -1,6 +1,10 @@
+from copy import deepcopy
 from time import perf_counter
 import logging
 
+from utils.latency_histogram import HandlerMetrics
+from utils.sessions import SessionItem
+
 logger = logging.getLogger(__name__)
 
 
@@ -11,14 +15,24 @@ class BaseHandler:
     To stop a handler properly, set the stop_event and, to avoid queue deadlocks, place b"END" in the input queue.
     Objects placed in the input queue will be processed by the `process` method, and the yielded results will be placed in the output queue.
     The cleanup method handles stopping the handler, and b"END" is placed in the output queue.
+    Queue wait and per-output service times are recorded in fixed-size histograms (`metrics`).
+    In server mode, items arrive wrapped in a `SessionItem`: the attributes listed in
+    `session_attributes` are swapped to the item's session before `process` is called and
+    outputs are tagged with the same session. A session's b"END" releases its state.
     """
 
+    # Attributes holding per-client state, copied from the post-setup values for each new session
+    session_attributes = ()
+
     def __init__(self, stop_event, queue_in, queue_out, setup_args=(), setup_kwargs={}):
         self.stop_event = stop_event
         self.queue_in = queue_in
         self.queue_out = queue_out
+        self.metrics = HandlerMetrics(self.__class__.__name__)
+        self._last_time = 0.0
+        self._session = None
+        self._session_template = None
         self.setup(*setup_args, **setup_kwargs)
-        self._times = []
 
     def setup(self):
         pass
@@ -28,25 +42,75 @@ class BaseHandler:
 
     def run(self):
         while not self.stop_event.is_set():
-            input = self.queue_in.get()
+            if hasattr(self.queue_in, "get_timed"):
+                input, queue_wait = self.queue_in.get_timed()
+            else:
+                input, queue_wait = self.queue_in.get(), None
             if isinstance(input, bytes) and input == b"END":
                 # sentinelle signal to avoid queue deadlock
                 logger.debug("Stopping thread")
                 break
+            session = None
+            if isinstance(input, SessionItem):
+                session = input.session
+                if input.is_end:
+                    self.end_session(session)
+                    self.queue_out.put(input)
+                    continue
+                self.enter_session(session)
+                input = input.payload
+            if queue_wait is not None:
+                self.metrics.queue_wait.record(queue_wait)
             start_time = perf_counter()
             for output in self.process(input):
-                self._times.append(perf_counter() - start_time)
+                self._last_time = perf_counter() - start_time
+                self.metrics.service.record(self._last_time)
                 if self.last_time > self.min_time_to_debug:
                     logger.debug(f"{self.__class__.__name__}: {self.last_time: .3f} s")
-                self.queue_out.put(output)
+                self.queue_out.put(output if session is None else SessionItem(session, output))
                 start_time = perf_counter()
 
         self.cleanup()
         self.queue_out.put(b"END")
 
+    def _state_key(self):
+        return id(self)
+
+    def enter_session(self, session):
+        """Swap in the per-session attributes of `session` (created on first use)."""
+        if session is self._session:
+            return
+        if self._session_template is None:
+            self._session_template = {
+                name: deepcopy(getattr(self, name)) for name in self.session_attributes
+            }
+        if self._session is not None and not self._session.closed:
+            self._session.state[self._state_key()] = {
+                name: getattr(self, name) for name in self.session_attributes
+            }
+        state = session.state.get(self._state_key())
+        if state is None:
+            self.init_session(session)
+        else:
+            for name, value in state.items():
+                setattr(self, name, value)
+        if hasattr(self, "should_listen"):
+            self.should_listen = session.should_listen
+        self._session = session
+
+    def init_session(self, session):
+        """Fresh per-session values, by default copies of the state right after `setup`."""
+        for name, value in self._session_template.items():
+            setattr(self, name, deepcopy(value))
+
+    def end_session(self, session):
+        session.state.pop(self._state_key(), None)
+        if session is self._session:
+            self._session = None
+
     @property
     def last_time(self):
-        return self._times[-1]
+        return self._last_time
     
     @property
     def min_time_to_debug(self):
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import threading
+from queue import Full
+
+from utils.pipeline_queue import is_sentinel
+from utils.sessions import ClientSession, SessionItem
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSessionServer:
+    """
+    Multi-client asyncio transport.
+
+    Every TCP connection is a bidirectional audio stream with its own `ClientSession`:
+    incoming chunks of `chunk_size` bytes are tagged with the session and put on the shared
+    pipeline queue, and synthesized audio coming back from the pipeline is routed to the
+    connection it belongs to. Slow clients only back up their own outbox.
+    """
+
+    def __init__(
+        self,
+        stop_event,
+        queue_out,
+        queue_in,
+        host="0.0.0.0",
+        port=12345,
+        chunk_size=1024,
+        max_clients=8,
+        outbox_size=256,
+    ):
+        self.stop_event = stop_event
+        self.queue_out = queue_out
+        self.queue_in = queue_in
+        self.host = host
+        self.port = port
+        self.chunk_size = chunk_size
+        self.max_clients = max_clients
+        self.outbox_size = outbox_size
+        self.sessions = {}
+        self.outboxes = {}
+        self.loop = None
+        self.ready = threading.Event()
+
+    def run(self):
+        dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        dispatcher.start()
+        asyncio.run(self._serve())
+        # Release the handlers downstream, like SocketReceiver on disconnect
+        self.queue_out.put(b"END")
+        logger.info("Server closed")
+
+    async def _serve(self):
+        self.loop = asyncio.get_running_loop()
+        server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        logger.info(f"Server listening on {self.host}:{self.port} (max {self.max_clients} clients)")
+        self.ready.set()
+        async with server:
+            while not self.stop_event.is_set():
+                await asyncio.sleep(0.1)
+            for session in list(self.sessions.values()):
+                session.close()
+            server.close()
+
+    async def _handle_client(self, reader, writer):
+        if len(self.sessions) >= self.max_clients:
+            logger.warning("Refusing client: max_clients reached")
+            writer.close()
+            return
+
+        session = ClientSession(peer=writer.get_extra_info("peername"))
+        outbox = asyncio.Queue(maxsize=self.outbox_size)
+        self.sessions[session.id] = session
+        self.outboxes[session.id] = outbox
+        sender = asyncio.create_task(self._send_loop(outbox, writer))
+        logger.info(f"{session} connected ({len(self.sessions)} active)")
+        try:
+            while not session.closed:
+                chunk = await reader.readexactly(self.chunk_size)
+                if session.should_listen.is_set():
+                    try:
+                        self.queue_out.put(SessionItem(session, chunk), block=False)
+                    except Full:
+                        logger.debug(f"{session}: input queue full, dropping chunk")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            session.close()
+            del self.sessions[session.id]
+            del self.outboxes[session.id]
+            sender.cancel()
+            writer.close()
+            # Let every handler drop this session's state
+            await self.loop.run_in_executor(None, self.queue_out.put, SessionItem(session, b"END"))
+            logger.info(f"{session} disconnected ({len(self.sessions)} active)")
+
+    async def _send_loop(self, outbox, writer):
+        try:
+            while True:
+                chunk = await outbox.get()
+                writer.write(chunk if isinstance(chunk, bytes) else chunk.tobytes())
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+    def _deliver(self, session_id, chunk):
+        outbox = self.outboxes.get(session_id)
+        if outbox is None:
+            return
+        if outbox.full():
+            # Client is not reading fast enough: drop its oldest audio
+            outbox.get_nowait()
+        outbox.put_nowait(chunk)
+
+    def _dispatch(self):
+        """Route pipeline output to the outbox of the session it belongs to."""
+        while True:
+            item = self.queue_in.get()
+            if isinstance(item, bytes) and item == b"END":
+                break
+            if not isinstance(item, SessionItem) or is_sentinel(item):
+                continue
+            if item.session.closed or self.loop is None:
+                continue
+            self.loop.call_soon_threadsafe(self._deliver, item.session_id, item.payload)
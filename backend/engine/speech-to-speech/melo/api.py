@@ -27,7 +27,13 @@ class TTS(nn.Module):
         use_hf: bool = True,
         config_path: str | None = None,
         ckpt_path: str | None = None,
+        cpu_optimize: bool | None = None,
     ):
+        """
+        cpu_optimize: CPU 추론 최적화 적용 여부 (None이면 MELO_CPU_OPTIMIZE=1 일 때 적용)
+            - MELO_QUANTIZE=0 으로 int8 양자화 끄기
+            - MELO_COMPILE=compile|trace 로 torch.compile / 디코더 TorchScript 사용
+        """
         super().__init__()
 
         # ---------------------------------
@@ -75,6 +81,19 @@ class TTS(nn.Module):
         )
         self.model.load_state_dict(checkpoint_dict["model"], strict=True)
 
+        # CPU 전용 추론 최적화 (양자화 / 컴파일 / 스레드 수)
+        if cpu_optimize is None:
+            cpu_optimize = os.getenv("MELO_CPU_OPTIMIZE", "0") == "1"
+        self.cpu_optimization = None
+        if cpu_optimize and device == "cpu":
+            from .cpu_optim import optimize_for_cpu
+
+            self.cpu_optimization = optimize_for_cpu(
+                self.model,
+                quantize=os.getenv("MELO_QUANTIZE", "1") != "0",
+                compile_mode=os.getenv("MELO_COMPILE", ""),
+            )
+
         language = language.split("_")[0]
         # 중국어는 ZH_MIX_EN 모델 사용
         self.language = "ZH_MIX_EN" if language == "ZH" else language
@@ -86,13 +105,15 @@ class TTS(nn.Module):
     def audio_numpy_concat(
         segment_data_list: List[np.ndarray], sr: int, speed: float = 1.0
     ) -> np.ndarray:
-        audio_segments = []
-        for segment_data in segment_data_list:
-            audio_segments += segment_data.reshape(-1).tolist()
-            # 문장 사이에 약간의 공백 추가
-            audio_segments += [0] * int((sr * 0.05) / speed)
-        audio_segments = np.array(audio_segments).astype(np.float32)
-        return audio_segments
+        # 문장 사이에 약간의 공백 추가 (미리 할당한 float32 배열에 바로 기록)
+        gap = int((sr * 0.05) / speed)
+        segments = [segment.reshape(-1) for segment in segment_data_list]
+        out = np.zeros(sum(len(seg) for seg in segments) + gap * len(segments), dtype=np.float32)
+        offset = 0
+        for segment in segments:
+            out[offset:offset + len(segment)] = segment
+            offset += len(segment) + gap
+        return out
 
     @staticmethod
     def split_sentences_into_pieces(text: str, language: str, quiet: bool = False):
@@ -103,6 +124,66 @@ class TTS(nn.Module):
             print(" > ===========================")
         return texts
 
+    # ------------------------------------------------------------------
+    # 배치 추론
+    # ------------------------------------------------------------------
+    @torch.inference_mode()
+    def _infer_batch(
+        self,
+        features: list,
+        speaker_id: int,
+        sdp_ratio: float,
+        noise_scale: float,
+        noise_scale_w: float,
+        speed: float,
+    ) -> List[np.ndarray]:
+        """
+        여러 문장을 0으로 패딩해 SynthesizerTrn.infer 한 번에 합성하고,
+        예측된 길이(y_mask)로 문장별 오디오를 잘라 반환
+        """
+        device = self.device
+        batch = len(features)
+        lengths = [phones.size(0) for _, _, phones, _, _ in features]
+        max_len = max(lengths)
+
+        bert_dim = features[0][0].size(0)
+        ja_bert_dim = features[0][1].size(0)
+        x_tst = torch.zeros(batch, max_len, dtype=torch.long)
+        tones = torch.zeros(batch, max_len, dtype=torch.long)
+        lang_ids = torch.zeros(batch, max_len, dtype=torch.long)
+        bert = torch.zeros(batch, bert_dim, max_len)
+        ja_bert = torch.zeros(batch, ja_bert_dim, max_len)
+        for i, (b, jb, phones, tone, lang) in enumerate(features):
+            n = lengths[i]
+            x_tst[i, :n] = phones
+            tones[i, :n] = tone
+            lang_ids[i, :n] = lang
+            bert[i, :, :n] = b
+            ja_bert[i, :, :n] = jb
+
+        x_tst_lengths = torch.LongTensor(lengths).to(device)
+        speakers = torch.full((batch,), int(speaker_id), dtype=torch.long, device=device)
+
+        o, _, y_mask, _ = self.model.infer(
+            x_tst.to(device),
+            x_tst_lengths,
+            speakers,
+            tones.to(device),
+            lang_ids.to(device),
+            bert.to(device),
+            ja_bert.to(device),
+            sdp_ratio=sdp_ratio,
+            noise_scale=noise_scale,
+            noise_scale_w=noise_scale_w,
+            length_scale=1.0 / speed,
+        )
+
+        # 프레임 길이 -> 샘플 길이 (디코더 업샘플 배수)
+        upsample = o.size(-1) // y_mask.size(-1)
+        frame_lengths = y_mask.sum(dim=(1, 2)).long().tolist()
+        audio = o[:, 0].float().cpu().numpy()
+        return [audio[i, : frame_lengths[i] * upsample] for i in range(batch)]
+
     # ------------------------------------------------------------------
     # 메인 추론 함수
     # ------------------------------------------------------------------
@@ -119,10 +200,15 @@ class TTS(nn.Module):
         format: str | None = None,
         position: int | None = None,
         quiet: bool = False,
+        batch_size: int = 8,
     ):
+        """
+        텍스트 -> 음성 (output_path가 없으면 float32 numpy 배열 반환)
+
+        batch_size: 한 번의 model.infer에 묶을 문장 수 (1이면 문장별 추론)
+        """
         language = self.language
         texts = self.split_sentences_into_pieces(text, language, quiet)
-        audio_list: list[np.ndarray] = []
 
         if pbar:
             tx = pbar(texts)
@@ -134,50 +220,35 @@ class TTS(nn.Module):
             else:
                 tx = tqdm(texts)
 
+        # 1) 문장별 텍스트 전처리 (phone/tone), BERT 특징은 문장들을 묶어 한 번에 계산
+        sentences = []
         for t in tx:
             if language in ["EN", "ZH_MIX_EN"]:
                 t = re.sub(r"([a-z])([A-Z])", r"\1 \2", t)
+            sentences.append(t)
+        features = utils.get_texts_for_tts_infer(
+            sentences, language, self.hps, self.device, self.symbol_to_id
+        )
 
-            device = self.device
-            bert, ja_bert, phones, tones, lang_ids = utils.get_text_for_tts_infer(
-                t, language, self.hps, device, self.symbol_to_id
+        # 2) 길이가 비슷한 문장끼리 묶어 배치 추론 (패딩 최소화)
+        order = sorted(range(len(features)), key=lambda i: features[i][2].size(0))
+        audio_list: list[np.ndarray | None] = [None] * len(features)
+        batch_size = max(1, batch_size)
+        for start in range(0, len(order), batch_size):
+            batch_ids = order[start:start + batch_size]
+            batch_audio = self._infer_batch(
+                [features[i] for i in batch_ids],
+                speaker_id,
+                sdp_ratio=sdp_ratio,
+                noise_scale=noise_scale,
+                noise_scale_w=noise_scale_w,
+                speed=speed,
             )
+            for i, audio in zip(batch_ids, batch_audio):
+                audio_list[i] = audio
 
-            with torch.no_grad():
-                x_tst = phones.to(device).unsqueeze(0)
-                tones = tones.to(device).unsqueeze(0)
-                lang_ids = lang_ids.to(device).unsqueeze(0)
-                bert = bert.to(device).unsqueeze(0)
-                ja_bert = ja_bert.to(device).unsqueeze(0)
-                x_tst_lengths = torch.LongTensor([phones.size(0)]).to(device)
-                del phones
-
-                speakers = torch.LongTensor([speaker_id]).to(device)
-
-                audio = (
-                    self.model.infer(
-                        x_tst,
-                        x_tst_lengths,
-                        speakers,
-                        tones,
-                        lang_ids,
-                        bert,
-                        ja_bert,
-                        sdp_ratio=sdp_ratio,
-                        noise_scale=noise_scale,
-                        noise_scale_w=noise_scale_w,
-                        length_scale=1.0 / speed,
-                    )[0][0, 0]
-                    .data.cpu()
-                    .float()
-                    .numpy()
-                )
-
-                del x_tst, tones, lang_ids, bert, ja_bert, x_tst_lengths, speakers
-
-            audio_list.append(audio)
-
-        torch.cuda.empty_cache()
+        if "cuda" in str(self.device):
+            torch.cuda.empty_cache()
         audio = self.audio_numpy_concat(
             audio_list, sr=self.hps.data.sampling_rate, speed=speed
         )
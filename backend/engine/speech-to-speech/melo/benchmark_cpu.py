@@ -0,0 +1,82 @@
+"""
+CPU 추론 최적화 벤치마크 / 품질 확인.
+
+float32 eager 모델과 최적화 모델(int8 양자화, 선택적 컴파일)로 같은 문장을
+같은 시드로 합성해 실시간 배율(RTF)과 log-mel L1 거리를 비교한다.
+
+사용 예 (backend/engine/speech-to-speech 에서):
+    python -m melo.benchmark_cpu --compile trace --threads 4
+"""
+
+import sys
+import time
+
+import click
+import torch
+
+SAMPLE_TEXTS = [
+    "안녕하세요, 오늘 하루는 어떠셨어요?",
+    "요즘 잠은 잘 주무시나요? 피곤하시면 잠깐 쉬어 가도 괜찮아요.",
+    "제가 옆에서 이야기 들어 드릴게요. 천천히 말씀해 주세요.",
+]
+
+
+def _run(tts, speaker_id, texts, seed, repeats):
+    """문장별 (오디오, 평균 합성 시간) 반환 (첫 실행은 예열로 제외)"""
+    results = []
+    for text in texts:
+        torch.manual_seed(seed)
+        tts.tts_to_file(text, speaker_id, quiet=True)
+        elapsed = 0.0
+        for _ in range(repeats):
+            torch.manual_seed(seed)
+            started = time.perf_counter()
+            audio = tts.tts_to_file(text, speaker_id, quiet=True)
+            elapsed += time.perf_counter() - started
+        results.append((audio, elapsed / repeats))
+    return results
+
+
+@click.command()
+@click.option("--language", default="KR")
+@click.option("--compile", "compile_mode", type=click.Choice(["", "compile", "trace"]), default="")
+@click.option("--quantize/--no-quantize", default=True)
+@click.option("--threads", type=int, default=None)
+@click.option("--repeats", default=3)
+@click.option("--seed", default=1234)
+@click.option("--max-mel-distance", default=0.35, help="허용 log-mel L1 거리 (초과 시 종료 코드 1)")
+def main(language, compile_mode, quantize, threads, repeats, seed, max_mel_distance):
+    from melo.api import TTS
+    from melo.cpu_optim import mel_distance, optimize_for_cpu, real_time_factor
+
+    baseline = TTS(language=language, device="cpu", cpu_optimize=False)
+    optimized = TTS(language=language, device="cpu", cpu_optimize=False)
+    optimize_for_cpu(
+        optimized.model, quantize=quantize, compile_mode=compile_mode, num_threads=threads
+    )
+    if threads:
+        torch.set_num_threads(threads)
+    speaker_id = next(iter(baseline.hps.data.spk2id.values()))
+    sr = baseline.hps.data.sampling_rate
+
+    base_results = _run(baseline, speaker_id, SAMPLE_TEXTS, seed, repeats)
+    opt_results = _run(optimized, speaker_id, SAMPLE_TEXTS, seed, repeats)
+
+    worst = 0.0
+    print(f"{'text':<24} {'RTF fp32':>9} {'RTF opt':>9} {'speedup':>8} {'mel L1':>7}")
+    for text, (ref, ref_t), (cand, cand_t) in zip(SAMPLE_TEXTS, base_results, opt_results):
+        distance = mel_distance(ref, cand, baseline.hps)
+        worst = max(worst, distance)
+        print(
+            f"{text[:22]:<24} {real_time_factor(ref_t, len(ref), sr):>9.3f} "
+            f"{real_time_factor(cand_t, len(cand), sr):>9.3f} {ref_t / cand_t:>7.2f}x {distance:>7.3f}"
+        )
+
+    if worst > max_mel_distance:
+        print(f"❌ mel 거리 {worst:.3f} > {max_mel_distance} - 양자화 대상 모듈을 줄이세요")
+        sys.exit(1)
+    print(f"✅ 품질 기준 통과 (최대 mel 거리 {worst:.3f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# backend/melo/cpu_optim.py
+"""
+SynthesizerTrn CPU 추론 최적화.
+
+- 스레드 수 조정 (MELO_NUM_THREADS)
+- 디코더 weight norm 제거 (추론 시 매 forward마다 가중치를 다시 계산하지 않도록)
+- 동적 int8 양자화: 모델에 nn.Linear가 없으므로 1x1 Conv1d(= 채널 방향 Linear)를
+  Linear로 바꾼 뒤 quantize_dynamic 적용 (어텐션 q/k/v/o, flow pre/post 등)
+- 선택적 컴파일: torch.compile(infer) 또는 디코더 TorchScript trace
+- 품질 확인용 mel 거리 계산
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Iterable, Optional
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+# 양자화 대상 서브모듈 (디코더는 음질에 민감해 기본 제외)
+DEFAULT_QUANT_MODULES = ("enc_p", "dp", "sdp", "flow")
+
+
+class PointwiseLinear(nn.Module):
+    """kernel_size=1 Conv1d와 같은 연산을 nn.Linear로 수행 ([B, C, T] 입출력)"""
+
+    def __init__(self, conv: nn.Conv1d):
+        super().__init__()
+        self.linear = nn.Linear(conv.in_channels, conv.out_channels, bias=conv.bias is not None)
+        with torch.no_grad():
+            self.linear.weight.copy_(conv.weight[:, :, 0])
+            if conv.bias is not None:
+                self.linear.bias.copy_(conv.bias)
+
+    def forward(self, x):
+        return self.linear(x.transpose(1, 2)).transpose(1, 2)
+
+
+def _is_pointwise(module: nn.Module) -> bool:
+    return (
+        type(module) is nn.Conv1d
+        and module.kernel_size == (1,)
+        and module.stride == (1,)
+        and module.padding in ((0,), "valid")
+        and module.groups == 1
+    )
+
+
+def convert_pointwise_convs(model: nn.Module, prefixes: Iterable[str]) -> int:
+    """prefixes 아래의 1x1 Conv1d를 PointwiseLinear로 교체하고 교체 수 반환"""
+    prefixes = tuple(prefixes)
+    targets = [
+        (name, module)
+        for name, module in model.named_modules()
+        if _is_pointwise(module) and name.split(".")[0] in prefixes
+    ]
+    for name, conv in targets:
+        if hasattr(conv, "weight_g"):
+            torch.nn.utils.remove_weight_norm(conv)
+        parent_name, _, attr = name.rpartition(".")
+        parent = model.get_submodule(parent_name) if parent_name else model
+        setattr(parent, attr, PointwiseLinear(conv))
+    return len(targets)
+
+
+def quantize_dynamic_int8(model: nn.Module, prefixes: Iterable[str] = DEFAULT_QUANT_MODULES) -> int:
+    """1x1 Conv1d → Linear 변환 후 Linear 가중치를 int8로 동적 양자화"""
+    converted = convert_pointwise_convs(model, prefixes)
+    prefixes = tuple(prefixes)
+    for name in prefixes:
+        if hasattr(model, name):
+            setattr(
+                model,
+                name,
+                torch.ao.quantization.quantize_dynamic(
+                    getattr(model, name), {nn.Linear}, dtype=torch.qint8
+                ),
+            )
+    return converted
+
+
+def configure_cpu_threads(num_threads: Optional[int] = None) -> int:
+    """intra-op 스레드 수 설정 (기본: MELO_NUM_THREADS 또는 CPU 코어 수)"""
+    if num_threads is None:
+        num_threads = int(os.getenv("MELO_NUM_THREADS", "0")) or (os.cpu_count() or 1)
+    torch.set_num_threads(max(1, num_threads))
+    try:
+        # 프로세스에서 병렬 작업이 시작되기 전 한 번만 설정 가능
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass
+    return torch.get_num_threads()
+
+
+def trace_decoder(model: nn.Module, device: str = "cpu") -> None:
+    """HiFi-GAN 디코더를 TorchScript로 trace (입력 길이와 무관한 conv 연산만 사용)"""
+    dec = model.dec
+    gin = getattr(dec, "cond", None)
+    x = torch.randn(1, dec.conv_pre.in_channels, 32, device=device)
+    g = torch.randn(1, gin.in_channels, 1, device=device) if gin is not None else None
+    with torch.inference_mode():
+        model.dec = torch.jit.trace(dec, (x, g) if g is not None else (x,), check_trace=False)
+
+
+def optimize_for_cpu(
+    model: nn.Module,
+    quantize: bool = True,
+    compile_mode: str = "",
+    num_threads: Optional[int] = None,
+    quant_modules: Iterable[str] = DEFAULT_QUANT_MODULES,
+) -> dict:
+    """
+    SynthesizerTrn을 CPU 추론용으로 최적화 (in-place)
+
+    Args:
+        quantize: 동적 int8 양자화 적용 여부
+        compile_mode: "" | "compile" (torch.compile) | "trace" (디코더 TorchScript)
+        num_threads: intra-op 스레드 수 (None이면 환경 변수/코어 수)
+        quant_modules: 양자화할 최상위 서브모듈 이름
+
+    Returns:
+        적용된 최적화 요약
+    """
+    summary = {"threads": configure_cpu_threads(num_threads), "quantized_layers": 0, "compile": ""}
+    model.eval()
+
+    if hasattr(model.dec, "remove_weight_norm"):
+        model.dec.remove_weight_norm()
+
+    if quantize:
+        summary["quantized_layers"] = quantize_dynamic_int8(model, quant_modules)
+
+    try:
+        if compile_mode == "compile":
+            model.infer = torch.compile(model.infer, dynamic=True)
+            summary["compile"] = "compile"
+        elif compile_mode == "trace":
+            trace_decoder(model)
+            summary["compile"] = "trace"
+    except Exception as e:  # 컴파일 실패 시 eager로 계속
+        print(f"[MeloTTS] ⚠️ {compile_mode} 실패, eager 모드 사용: {e}")
+
+    print(
+        f"[MeloTTS] ⚙️ CPU 최적화: threads={summary['threads']}, "
+        f"int8 layers={summary['quantized_layers']}, compile={summary['compile'] or 'off'}"
+    )
+    return summary
+
+
+# ----------------------------------------------------------------------
+# 품질 / 속도 측정
+# ----------------------------------------------------------------------
+def _log_mel(audio: np.ndarray, hps) -> torch.Tensor:
+    from .mel_processing import mel_spectrogram_torch
+
+    y = torch.as_tensor(np.asarray(audio, dtype=np.float32)).unsqueeze(0)
+    mel = mel_spectrogram_torch(
+        y,
+        hps.data.filter_length,
+        hps.data.n_mel_channels,
+        hps.data.sampling_rate,
+        hps.data.hop_length,
+        hps.data.win_length,
+        hps.data.mel_fmin,
+        hps.data.mel_fmax,
+    )
+    return mel[0]  # [n_mels, frames], log 압축 적용됨
+
+
+def mel_distance(reference: np.ndarray, candidate: np.ndarray, hps) -> float:
+    """
+    두 오디오의 평균 log-mel L1 거리
+
+    양자화로 음소 길이가 조금 달라질 수 있으므로 candidate를 reference 프레임 수에
+    맞춰 시간축 보간한 뒤 비교한다.
+    """
+    ref = _log_mel(reference, hps)
+    cand = _log_mel(candidate, hps)
+    if cand.shape[-1] != ref.shape[-1]:
+        cand = torch.nn.functional.interpolate(
+            cand.unsqueeze(0), size=ref.shape[-1], mode="linear", align_corners=False
+        )[0]
+    return float(torch.mean(torch.abs(ref - cand)))
+
+
+def real_time_factor(elapsed_sec: float, num_samples: int, sample_rate: int) -> float:
+    """합성 시간 / 오디오 길이 (1보다 작으면 실시간보다 빠름)"""
+    return elapsed_sec / max(num_samples / sample_rate, 1e-9)
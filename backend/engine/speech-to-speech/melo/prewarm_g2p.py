@@ -0,0 +1,86 @@
+"""
+G2P 발음 사전 사전 채우기 도구.
+
+대화 기록(TB_CONVERSATIONS)이나 텍스트 파일의 문장을 미리 g2p 변환해
+영구 발음 사전(MELO_G2P_LEXICON)에 저장한다. 첫 응답부터 캐시 적중.
+
+사용 예 (backend/engine/speech-to-speech 에서):
+    python -m melo.prewarm_g2p --db --limit 20000
+    python -m melo.prewarm_g2p replies.txt
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import click
+
+BACKEND_ROOT = Path(__file__).resolve().parents[3]
+
+
+def iter_conversation_texts(speaker_type: str, limit: int) -> Iterator[str]:
+    """DB 대화 기록에서 최근 메시지 본문을 읽음"""
+    if str(BACKEND_ROOT) not in sys.path:
+        sys.path.insert(0, str(BACKEND_ROOT))
+    from app.db.database import SessionLocal
+    from app.db.models import Conversation
+
+    db = SessionLocal()
+    try:
+        query = db.query(Conversation.CONTENT).filter(Conversation.IS_DELETED == "N")
+        if speaker_type != "all":
+            query = query.filter(Conversation.SPEAKER_TYPE == speaker_type)
+        query = query.order_by(Conversation.ID.desc()).limit(limit)
+        for (content,) in query.yield_per(1000):
+            yield content
+    finally:
+        db.close()
+
+
+def iter_file_texts(paths: Iterable[str]) -> Iterator[str]:
+    """텍스트 파일에서 한 줄씩 읽음"""
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                yield line
+
+
+@click.command()
+@click.argument("files", nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.option("--db", "use_db", is_flag=True, help="TB_CONVERSATIONS 대화 기록 사용")
+@click.option("--speaker-type", default="assistant", help="읽을 SPEAKER_TYPE (all = 전체)")
+@click.option("--limit", default=10000, help="DB에서 읽을 최대 메시지 수")
+def main(files, use_db, speaker_type, limit):
+    from melo.split_utils import split_sentence
+    from melo.text import korean
+
+    sources = [iter_file_texts(files)]
+    if use_db:
+        sources.append(iter_conversation_texts(speaker_type, limit))
+
+    before = len(korean.lexicon)
+    started = time.perf_counter()
+    sentences = 0
+    for source in sources:
+        for text in source:
+            text = str(text or "").strip()
+            if not text:
+                continue
+            for sentence in split_sentence(text, language_str="KR"):
+                try:
+                    korean.g2p(korean.text_normalize(sentence))
+                    sentences += 1
+                except Exception as e:  # 일부 문장 실패는 건너뜀
+                    print(f"[G2P Prewarm] ⚠️ 변환 실패: {sentence[:30]!r} ({e})")
+
+    korean.lexicon.flush()
+    stats = korean.lexicon.stats()
+    print(
+        f"[G2P Prewarm] ✅ {sentences}개 문장 처리, 새 단어 {stats['entries'] - before}개 "
+        f"(총 {stats['entries']}개, {time.perf_counter() - started:.1f}초) → {korean.lexicon.path}"
+    )
+
+
+if __name__ == "__main__":
+    main()
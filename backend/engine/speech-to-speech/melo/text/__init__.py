@@ -47,3 +47,12 @@ def get_bert(norm_text, word2ph, language, device):
 
     # language 인자는 더 이상 분기용으로 쓰지 않고, 한국어만 처리
     return kr_bert(norm_text, word2ph, device)
+
+
+def get_bert_batch(norm_texts, word2phs, language, device):
+    """
+    여러 문장의 BERT 임베딩을 한 번의 배치 추론으로 얻는 함수 (한국어 전용).
+    """
+    from .korean import get_bert_features as kr_bert_batch
+
+    return kr_bert_batch(norm_texts, word2phs, device)
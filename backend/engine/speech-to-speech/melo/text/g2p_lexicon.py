@@ -0,0 +1,169 @@
+# backend/melo/text/g2p_lexicon.py
+"""
+단어 단위 발음(G2P) 캐시 + 영구 발음 사전.
+
+- g2pkk 변환 결과(자모 문자열)를 단어별로 기억해 같은 단어는 다시 변환하지 않음
+- 메모리: 용량 제한 LRU
+- 디스크: TSV(단어<TAB>자모) 추가 기록 방식, 시작 시 로드
+- 새 단어는 모아 두었다가 일정 개수/시간마다 한 번에 기록 (종료 시에도 기록)
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_LEXICON_PATH = Path(__file__).resolve().parents[1] / "cache" / "g2p_lexicon.tsv"
+
+
+class PronunciationLexicon:
+    """g2p 결과를 보관하는 LRU + 영구 사전"""
+
+    def __init__(
+        self,
+        path: Optional[str | Path] = DEFAULT_LEXICON_PATH,
+        max_entries: int = 50000,
+        flush_every: int = 64,
+        flush_interval: float = 30.0,
+    ):
+        """
+        Args:
+            path: 사전 파일 경로 (None이면 메모리만 사용)
+            max_entries: 메모리 LRU 최대 단어 수
+            flush_every: 새 단어가 이 개수만큼 쌓이면 파일에 기록
+            flush_interval: 마지막 기록 후 이 시간(초)이 지나면 기록
+        """
+        self.path = Path(path) if path else None
+        self.max_entries = max(1, max_entries)
+        self.flush_every = max(1, flush_every)
+        self.flush_interval = flush_interval
+
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._pending: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+        self.hits = 0
+        self.misses = 0
+
+        if self.path is not None:
+            self.load()
+            atexit.register(self.flush)
+
+    @classmethod
+    def from_env(cls) -> "PronunciationLexicon":
+        """MELO_G2P_* 환경 변수로 생성 (MELO_G2P_LEXICON=off 이면 메모리만 사용)"""
+        path = os.getenv("MELO_G2P_LEXICON", str(DEFAULT_LEXICON_PATH))
+        return cls(
+            path=None if path.lower() in ("", "off", "none") else path,
+            max_entries=int(os.getenv("MELO_G2P_CACHE_SIZE", "50000")),
+            flush_every=int(os.getenv("MELO_G2P_FLUSH_EVERY", "64")),
+            flush_interval=float(os.getenv("MELO_G2P_FLUSH_INTERVAL", "30")),
+        )
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+
+    def get(self, word: str) -> Optional[str]:
+        with self._lock:
+            phonemes = self._entries.get(word)
+            if phonemes is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(word)
+            self.hits += 1
+            return phonemes
+
+    def put(self, word: str, phonemes: str):
+        # 탭/줄바꿈이 들어간 단어는 TSV에 기록할 수 없으므로 메모리에만 보관
+        persist = not any(c in word or c in phonemes for c in "\t\r\n")
+        with self._lock:
+            is_new = word not in self._entries
+            self._set(word, phonemes)
+            if persist and is_new and self.path is not None:
+                self._pending.append((word, phonemes))
+            due = len(self._pending) >= self.flush_every or bool(
+                self._pending and time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def _set(self, word: str, phonemes: str):
+        self._entries[word] = phonemes
+        self._entries.move_to_end(word)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # 파일
+    # ------------------------------------------------------------------
+
+    def load(self) -> int:
+        """사전 파일 로드 (뒤쪽 줄이 최신) 후 메모리 단어 수 반환"""
+        if self.path is None or not self.path.exists():
+            return 0
+        lines = 0
+        with self._lock:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    word, sep, phonemes = line.rstrip("\n").partition("\t")
+                    if sep and word:
+                        self._set(word, phonemes)
+                        lines += 1
+            loaded = len(self._entries)
+        # 중복 줄이 많이 쌓였으면 파일 정리
+        if lines > 2 * max(loaded, 1):
+            self.compact()
+        return loaded
+
+    def flush(self) -> int:
+        """새 단어를 사전 파일에 추가 기록하고 기록한 개수 반환"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+        if not pending or self.path is None:
+            return 0
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(f"{word}\t{phonemes}\n" for word, phonemes in pending)
+        except OSError as e:
+            print(f"[G2P Lexicon] ⚠️ 사전 저장 실패: {e}")
+            with self._lock:
+                self._pending = pending + self._pending
+            return 0
+        return len(pending)
+
+    def compact(self):
+        """메모리에 있는 단어만 남기도록 사전 파일을 다시 작성"""
+        if self.path is None:
+            return
+        self.flush()
+        with self._lock:
+            entries = list(self._entries.items())
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(f"{word}\t{phonemes}\n" for word, phonemes in entries)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[G2P Lexicon] ⚠️ 사전 정리 실패: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "pending": len(self._pending),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
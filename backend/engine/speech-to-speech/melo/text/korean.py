@@ -4,17 +4,22 @@ Korean text processing & BERT features for MeloTTS.
 
 - 한글 → 음소(g2pkk + jamo) 변환
 - kyKim 한국어 BERT(kykim/bert-kor-base)로 phone-level feature 추출
+  (문장 단위 LRU 캐시 + 여러 문장 배치 추론)
 """
 
+import os
 import re
 import sys
-from typing import List
+import threading
+from collections import OrderedDict
+from typing import List, Sequence
 
 import torch
 from transformers import AutoTokenizer, AutoModelForMaskedLM
 
 from . import punctuation, symbols
 from melo.text.ko_dictionary import english_dictionary, etc_dictionary
+from melo.text.g2p_lexicon import PronunciationLexicon
 from jamo import hangul_to_jamo
 
 
@@ -56,6 +61,9 @@ def normalize_english(text: str) -> str:
 # ----------------------------------------------------------------------
 g2p_kr = None
 
+# 단어별 발음 캐시 (시작 시 영구 사전 로드)
+lexicon = PronunciationLexicon.from_env()
+
 
 def korean_text_to_phonemes(text: str) -> str:
     """
@@ -64,16 +72,21 @@ def korean_text_to_phonemes(text: str) -> str:
         input  = '하늘'
         output = '하늘' (ᄒ + ᅡ + ᄂ + ᅳ + ᆯ)
     """
+    cached = lexicon.get(text)
+    if cached is not None:
+        return cached
+
     global g2p_kr  # pylint: disable=global-statement
     if g2p_kr is None:
         from g2pkk import G2p
 
         g2p_kr = G2p()
 
-    text = normalize(text)
-    text = g2p_kr(text)
-    text = list(hangul_to_jamo(text))  # '하늘' -> ['ᄒ','ᅡ','ᄂ','ᅳ','ᆯ']
-    return "".join(text)
+    phonemes = normalize(text)
+    phonemes = g2p_kr(phonemes)
+    phonemes = "".join(hangul_to_jamo(phonemes))  # '하늘' -> ['ᄒ','ᅡ','ᄂ','ᅳ','ᆯ']
+    lexicon.put(text, phonemes)
+    return phonemes
 
 
 def text_normalize(text: str) -> str:
@@ -83,13 +96,12 @@ def text_normalize(text: str) -> str:
 def distribute_phone(n_phone: int, n_word: int) -> List[int]:
     """
     한 단어에 몇 개의 음소를 배분할지 결정하는 helper.
+
+    앞 단어부터 하나씩 돌아가며 배분하는 것과 같으므로 닫힌 형태로 계산:
+    모든 단어에 n_phone // n_word 개, 앞의 n_phone % n_word 개 단어에 1개씩 추가.
     """
-    phones_per_word = [0] * n_word
-    for _ in range(n_phone):
-        min_tasks = min(phones_per_word)
-        min_index = phones_per_word.index(min_tasks)
-        phones_per_word[min_index] += 1
-    return phones_per_word
+    base, extra = divmod(n_phone, n_word)
+    return [base + 1] * extra + [base] * (n_word - extra)
 
 
 # ----------------------------------------------------------------------
@@ -100,6 +112,12 @@ tokenizer = AutoTokenizer.from_pretrained(model_id)
 
 _bert_models: dict[str, AutoModelForMaskedLM] = {}  # device별 캐시
 
+# 문장 단위 BERT hidden state 캐시 (정규화 텍스트 -> [n_token, hidden], CPU)
+BERT_CACHE_SIZE = int(os.getenv("MELO_BERT_CACHE_SIZE", "512"))
+_bert_cache: "OrderedDict[str, torch.Tensor]" = OrderedDict()
+_bert_cache_lock = threading.Lock()
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def g2p(norm_text: str):
     """
@@ -154,13 +172,34 @@ def g2p(norm_text: str):
     return phones, tones, word2ph
 
 
-def get_bert_feature(text: str, word2ph, device: str = "cuda"):
-    """
-    text, word2ph 를 받아서 phone-level BERT feature 를 반환.
+def _cache_key(text: str) -> str:
+    return _WHITESPACE_RE.sub(" ", text).strip()
 
-    반환 형태: [hidden_dim, phone_len]
-    """
 
+def _cache_get(key: str):
+    with _bert_cache_lock:
+        res = _bert_cache.get(key)
+        if res is not None:
+            _bert_cache.move_to_end(key)
+        return res
+
+
+def _cache_put(key: str, res: torch.Tensor):
+    if BERT_CACHE_SIZE <= 0:
+        return
+    with _bert_cache_lock:
+        _bert_cache[key] = res
+        _bert_cache.move_to_end(key)
+        while len(_bert_cache) > BERT_CACHE_SIZE:
+            _bert_cache.popitem(last=False)
+
+
+def clear_bert_cache():
+    with _bert_cache_lock:
+        _bert_cache.clear()
+
+
+def _resolve_device(device: str) -> str:
     # Mac + MPS 환경 보정 (원본 japanese_bert 로직과 유사)
     if (
         sys.platform == "darwin"
@@ -171,36 +210,72 @@ def get_bert_feature(text: str, word2ph, device: str = "cuda"):
 
     if not device:
         device = "cuda" if torch.cuda.is_available() else "cpu"
+    return device
 
+
+def _get_bert_model(device: str):
     # 디바이스별 BERT 모델 캐시
     if device not in _bert_models:
-        model = AutoModelForMaskedLM.from_pretrained(model_id).to(device)
-        _bert_models[device] = model
-    else:
-        model = _bert_models[device]
+        _bert_models[device] = AutoModelForMaskedLM.from_pretrained(model_id).to(device)
+    return _bert_models[device]
+
 
+def _token_hidden_states(texts: Sequence[str], device: str) -> List[torch.Tensor]:
+    """
+    여러 문장을 패딩해 BERT 1회 실행 후 문장별 토큰 hidden state([n_token, hidden]) 반환
+    """
+    model = _get_bert_model(device)
     with torch.no_grad():
-        inputs = tokenizer(text, return_tensors="pt")
+        inputs = tokenizer(list(texts), return_tensors="pt", padding=True)
+        lengths = inputs["attention_mask"].sum(dim=1).tolist()
         for k in inputs:
             inputs[k] = inputs[k].to(device)
 
         res = model(**inputs, output_hidden_states=True)
         # 마지막 몇 개 레이어를 concat (원본과 비슷한 방식)
-        res = torch.cat(res["hidden_states"][-3:-2], -1)[0].cpu()
+        res = torch.cat(res["hidden_states"][-3:-2], -1).cpu()
+
+    return [res[i, : lengths[i]] for i in range(len(texts))]
+
+
+def _expand_to_phones(res: torch.Tensor, word2ph) -> torch.Tensor:
+    """토큰 feature를 word2ph만큼 반복해 phone-level feature([hidden, T])로 확장"""
+    assert res.shape[0] == len(word2ph), f"{res.shape[0]}/{len(word2ph)}"
+    repeats = torch.as_tensor(word2ph, dtype=torch.long)
+    return torch.repeat_interleave(res, repeats, dim=0).T
+
+
+def get_bert_features(texts: Sequence[str], word2phs: Sequence, device: str = "cuda"):
+    """
+    여러 문장의 phone-level BERT feature를 한 번에 계산.
 
-    assert (
-        inputs["input_ids"].shape[-1] == len(word2ph)
-    ), f"{inputs['input_ids'].shape[-1]}/{len(word2ph)}"
+    캐시에 없는 문장만 모아 배치로 BERT를 실행한다.
+    반환 형태: [[hidden_dim, phone_len], ...]
+    """
+    device = _resolve_device(device)
+    keys = [_cache_key(t) for t in texts]
+    token_states = [_cache_get(key) for key in keys]
+
+    # 캐시 미스 문장만 중복 없이 배치 추론
+    missing = list(dict.fromkeys(key for key, res in zip(keys, token_states) if res is None))
+    if missing:
+        computed = dict(zip(missing, _token_hidden_states(missing, device)))
+        for key, res in computed.items():
+            _cache_put(key, res)
+        token_states = [
+            res if res is not None else computed[key] for key, res in zip(keys, token_states)
+        ]
 
-    word2phone = word2ph
-    phone_level_feature = []
+    return [_expand_to_phones(res, w2p) for res, w2p in zip(token_states, word2phs)]
 
-    for i in range(len(word2phone)):
-        repeat_feature = res[i].repeat(word2phone[i], 1)
-        phone_level_feature.append(repeat_feature)
 
-    phone_level_feature = torch.cat(phone_level_feature, dim=0)  # [T, hidden]
-    return phone_level_feature.T  # [hidden, T]
+def get_bert_feature(text: str, word2ph, device: str = "cuda"):
+    """
+    text, word2ph 를 받아서 phone-level BERT feature 를 반환.
+
+    반환 형태: [hidden_dim, phone_len]
+    """
+    return get_bert_features([text], [word2ph], device)[0]
 
 
 if __name__ == "__main__":
@@ -9,7 +9,7 @@ from scipy.io.wavfile import read
 import torch
 import torchaudio
 import librosa
-from melo.text import cleaned_text_to_sequence, get_bert
+from melo.text import cleaned_text_to_sequence, get_bert_batch
 from melo.text.cleaner import clean_text
 from melo import commons
 
@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 
 
 
-def get_text_for_tts_infer(text, language_str, hps, device, symbol_to_id=None):
+def _prepare_text_for_tts_infer(text, language_str, hps, symbol_to_id=None):
     norm_text, phone, tone, word2ph = clean_text(text, language_str)
     phone, tone, language = cleaned_text_to_sequence(phone, tone, language_str, symbol_to_id)
 
@@ -30,13 +30,14 @@ def get_text_for_tts_infer(text, language_str, hps, device, symbol_to_id=None):
         for i in range(len(word2ph)):
             word2ph[i] = word2ph[i] * 2
         word2ph[0] += 1
+    return norm_text, phone, tone, language, word2ph
+
 
-    if getattr(hps.data, "disable_bert", False):
+def _finalize_text_for_tts_infer(bert, phone, tone, language, language_str):
+    if bert is None:
         bert = torch.zeros(1024, len(phone))
         ja_bert = torch.zeros(768, len(phone))
     else:
-        bert = get_bert(norm_text, word2ph, language_str, device)
-        del word2ph
         assert bert.shape[-1] == len(phone), phone
 
         if language_str == "ZH":
@@ -57,6 +58,29 @@ def get_text_for_tts_infer(text, language_str, hps, device, symbol_to_id=None):
     language = torch.LongTensor(language)
     return bert, ja_bert, phone, tone, language
 
+
+def get_text_for_tts_infer(text, language_str, hps, device, symbol_to_id=None):
+    return get_texts_for_tts_infer([text], language_str, hps, device, symbol_to_id)[0]
+
+
+def get_texts_for_tts_infer(texts, language_str, hps, device, symbol_to_id=None):
+    """여러 문장의 추론 입력을 만들고, BERT 특징은 한 번의 배치로 계산"""
+    prepared = [
+        _prepare_text_for_tts_infer(text, language_str, hps, symbol_to_id) for text in texts
+    ]
+
+    if getattr(hps.data, "disable_bert", False) or not prepared:
+        berts = [None] * len(prepared)
+    else:
+        berts = get_bert_batch(
+            [p[0] for p in prepared], [p[4] for p in prepared], language_str, device
+        )
+
+    return [
+        _finalize_text_for_tts_infer(bert, phone, tone, language, language_str)
+        for bert, (_, phone, tone, language, _) in zip(berts, prepared)
+    ]
+
 def load_checkpoint(checkpoint_path, model, optimizer=None, skip_optimizer=False):
     assert os.path.isfile(checkpoint_path)
     checkpoint_dict = torch.load(checkpoint_path, map_location="cpu")
@@ -1,9 +1,9 @@
 import logging
+import multiprocessing
 import os
 import sys
 from copy import copy
 from pathlib import Path
-from queue import Queue
 from threading import Event
 from typing import Optional
 from sys import platform
@@ -33,6 +33,8 @@ from transformers import (
     HfArgumentParser,
 )
 
+from utils.pipeline_queue import FairPipelineQueue, PipelineQueue
+from utils.process_handler import ProcessHandler
 from utils.thread_manager import ThreadManager
 
 # Ensure that the necessary NLTK resources are available
@@ -204,16 +206,91 @@ def prepare_all_args(
     rename_args(facebook_mms_tts_handler_kwargs, "facebook_mms")
 
 
-def initialize_queues_and_events():
-    return {
-        "stop_event": Event(),
-        "should_listen": Event(),
-        "recv_audio_chunks_queue": Queue(),
-        "send_audio_chunks_queue": Queue(),
-        "spoken_prompt_queue": Queue(),
-        "text_prompt_queue": Queue(),
-        "lm_response_queue": Queue(),
+PROCESS_HANDLER_STAGES = ("vad", "stt", "llm", "tts")
+
+
+def get_process_handlers(module_kwargs):
+    """Pipeline stages that should run in their own process (`--process_handlers vad,tts`)."""
+    value = getattr(module_kwargs, "process_handlers", "") or ""
+    stages = {stage.strip() for stage in value.split(",") if stage.strip()}
+    unknown = stages - set(PROCESS_HANDLER_STAGES)
+    if unknown:
+        raise ValueError(
+            f"Unknown process handlers: {sorted(unknown)} (expected any of {PROCESS_HANDLER_STAGES})"
+        )
+    if stages and getattr(module_kwargs, "mode", None) == "server":
+        raise ValueError("process_handlers is not supported in 'server' mode")
+    return stages
+
+
+def create_handler(
+    handler_class,
+    stop_event,
+    queue_in,
+    queue_out,
+    setup_args=(),
+    setup_kwargs={},
+    in_process=False,
+):
+    if in_process:
+        return ProcessHandler(
+            handler_class, stop_event, queue_in, queue_out, setup_args, setup_kwargs
+        )
+    return handler_class(
+        stop_event,
+        queue_in=queue_in,
+        queue_out=queue_out,
+        setup_args=setup_args,
+        setup_kwargs=setup_kwargs,
+    )
+
+
+QUEUE_NAMES = (
+    "recv_audio_chunks_queue",
+    "send_audio_chunks_queue",
+    "spoken_prompt_queue",
+    "text_prompt_queue",
+    "lm_response_queue",
+)
+
+
+def initialize_queues_and_events(module_kwargs=None):
+    maxsize = getattr(module_kwargs, "queue_maxsize", 0)
+    policy = getattr(module_kwargs, "queue_policy", "block")
+    # Incoming microphone audio must never block the socket/audio callback
+    recv_policy = getattr(module_kwargs, "recv_queue_policy", "drop_oldest")
+    # Shared workers serve the server's client sessions round-robin
+    queue_class = (
+        FairPipelineQueue if getattr(module_kwargs, "mode", None) == "server" else PipelineQueue
+    )
+
+    # Events shared with handler processes must be multiprocessing events
+    event_class = (
+        multiprocessing.get_context("spawn").Event
+        if get_process_handlers(module_kwargs)
+        else Event
+    )
+    stop_event = event_class()
+    queues_and_events = {
+        "stop_event": stop_event,
+        "should_listen": event_class(),
     }
+    for name in QUEUE_NAMES:
+        if name == "send_audio_chunks_queue":
+            # Outgoing audio is bounded by what TTS produces: a slow client must not
+            # stall synthesis, so the send queue stays unbounded
+            queue_maxsize, queue_policy = 0, policy
+        elif name == "recv_audio_chunks_queue":
+            queue_maxsize, queue_policy = maxsize, recv_policy
+        else:
+            queue_maxsize, queue_policy = maxsize, policy
+        queues_and_events[name] = queue_class(
+            maxsize=queue_maxsize,
+            policy=queue_policy,
+            name=name,
+            stop_event=stop_event,
+        )
+    return queues_and_events
 
 
 def build_pipeline(
@@ -248,6 +325,21 @@ def build_pipeline(
         )
         comms_handlers = [local_audio_streamer]
         should_listen.set()
+    elif module_kwargs.mode == "server":
+        from connections.async_server import AsyncSessionServer
+
+        # One bidirectional connection per client on the receiver address
+        comms_handlers = [
+            AsyncSessionServer(
+                stop_event,
+                queue_out=recv_audio_chunks_queue,
+                queue_in=send_audio_chunks_queue,
+                host=socket_receiver_kwargs.recv_host,
+                port=socket_receiver_kwargs.recv_port,
+                chunk_size=socket_receiver_kwargs.chunk_size,
+                max_clients=module_kwargs.max_clients,
+            )
+        ]
     else:
         from connections.socket_receiver import SocketReceiver
         from connections.socket_sender import SocketSender
@@ -269,61 +361,77 @@ def build_pipeline(
             ),
         ]
 
-    vad = VADHandler(
+    vad = create_handler(
+        VADHandler,
         stop_event,
         queue_in=recv_audio_chunks_queue,
         queue_out=spoken_prompt_queue,
         setup_args=(should_listen,),
         setup_kwargs=vars(vad_handler_kwargs),
+        in_process="vad" in get_process_handlers(module_kwargs),
     )
 
     stt = get_stt_handler(module_kwargs, stop_event, spoken_prompt_queue, text_prompt_queue, whisper_stt_handler_kwargs, faster_whisper_stt_handler_kwargs, paraformer_stt_handler_kwargs)
     lm = get_llm_handler(module_kwargs, stop_event, text_prompt_queue, lm_response_queue, language_model_handler_kwargs, open_api_language_model_handler_kwargs, mlx_language_model_handler_kwargs)
     tts = get_tts_handler(module_kwargs, stop_event, lm_response_queue, send_audio_chunks_queue, should_listen, parler_tts_handler_kwargs, melo_tts_handler_kwargs, chat_tts_handler_kwargs, facebook_mms_tts_handler_kwargs)
 
-    return ThreadManager([*comms_handlers, vad, stt, lm, tts])
+    return ThreadManager(
+        [*comms_handlers, vad, stt, lm, tts],
+        queues={name: queues_and_events[name] for name in QUEUE_NAMES},
+        report_interval=module_kwargs.metrics_report_interval,
+    )
 
 
 def get_stt_handler(module_kwargs, stop_event, spoken_prompt_queue, text_prompt_queue, whisper_stt_handler_kwargs, faster_whisper_stt_handler_kwargs, paraformer_stt_handler_kwargs):
     if module_kwargs.stt == "moonshine":
         from STT.moonshine_handler import MoonshineSTTHandler
-        return MoonshineSTTHandler(
+        return create_handler(
+            MoonshineSTTHandler,
             stop_event,
             queue_in=spoken_prompt_queue,
             queue_out=text_prompt_queue,
+            in_process="stt" in get_process_handlers(module_kwargs),
         )
     if module_kwargs.stt == "whisper":
         from STT.whisper_stt_handler import WhisperSTTHandler
-        return WhisperSTTHandler(
+        return create_handler(
+            WhisperSTTHandler,
             stop_event,
             queue_in=spoken_prompt_queue,
             queue_out=text_prompt_queue,
             setup_kwargs=vars(whisper_stt_handler_kwargs),
+            in_process="stt" in get_process_handlers(module_kwargs),
         )
     elif module_kwargs.stt == "whisper-mlx":
         from STT.lightning_whisper_mlx_handler import LightningWhisperSTTHandler
-        return LightningWhisperSTTHandler(
+        return create_handler(
+            LightningWhisperSTTHandler,
             stop_event,
             queue_in=spoken_prompt_queue,
             queue_out=text_prompt_queue,
             setup_kwargs=vars(whisper_stt_handler_kwargs),
+            in_process="stt" in get_process_handlers(module_kwargs),
         )
     elif module_kwargs.stt == "paraformer":
         from STT.paraformer_handler import ParaformerSTTHandler
-        return ParaformerSTTHandler(
+        return create_handler(
+            ParaformerSTTHandler,
             stop_event,
             queue_in=spoken_prompt_queue,
             queue_out=text_prompt_queue,
             setup_kwargs=vars(paraformer_stt_handler_kwargs),
+            in_process="stt" in get_process_handlers(module_kwargs),
         )
     elif module_kwargs.stt == "faster-whisper":
         from STT.faster_whisper_handler import FasterWhisperSTTHandler
 
-        return FasterWhisperSTTHandler(
+        return create_handler(
+            FasterWhisperSTTHandler,
             stop_event,
             queue_in=spoken_prompt_queue,
             queue_out=text_prompt_queue,
             setup_kwargs=vars(faster_whisper_stt_handler_kwargs),
+            in_process="stt" in get_process_handlers(module_kwargs),
         )
     else:
         raise ValueError("The STT should be either whisper, whisper-mlx, or paraformer.")
@@ -340,28 +448,34 @@ def get_llm_handler(
 ):
     if module_kwargs.llm == "transformers":
         from LLM.language_model import LanguageModelHandler
-        return LanguageModelHandler(
+        return create_handler(
+            LanguageModelHandler,
             stop_event,
             queue_in=text_prompt_queue,
             queue_out=lm_response_queue,
             setup_kwargs=vars(language_model_handler_kwargs),
+            in_process="llm" in get_process_handlers(module_kwargs),
         )
     elif module_kwargs.llm == "open_api":
         from LLM.openai_api_language_model import OpenApiModelHandler
-        return OpenApiModelHandler(
+        return create_handler(
+            OpenApiModelHandler,
             stop_event,
             queue_in=text_prompt_queue,
             queue_out=lm_response_queue,
             setup_kwargs=vars(open_api_language_model_handler_kwargs),
+            in_process="llm" in get_process_handlers(module_kwargs),
         )
 
     elif module_kwargs.llm == "mlx-lm":
         from LLM.mlx_language_model import MLXLanguageModelHandler
-        return MLXLanguageModelHandler(
+        return create_handler(
+            MLXLanguageModelHandler,
             stop_event,
             queue_in=text_prompt_queue,
             queue_out=lm_response_queue,
             setup_kwargs=vars(mlx_language_model_handler_kwargs),
+            in_process="llm" in get_process_handlers(module_kwargs),
         )
 
     else:
@@ -371,12 +485,14 @@ def get_llm_handler(
 def get_tts_handler(module_kwargs, stop_event, lm_response_queue, send_audio_chunks_queue, should_listen, parler_tts_handler_kwargs, melo_tts_handler_kwargs, chat_tts_handler_kwargs, facebook_mms_tts_handler_kwargs):
     if module_kwargs.tts == "parler":
         from TTS.parler_handler import ParlerTTSHandler
-        return ParlerTTSHandler(
+        return create_handler(
+            ParlerTTSHandler,
             stop_event,
             queue_in=lm_response_queue,
             queue_out=send_audio_chunks_queue,
             setup_args=(should_listen,),
             setup_kwargs=vars(parler_tts_handler_kwargs),
+            in_process="tts" in get_process_handlers(module_kwargs),
         )
     elif module_kwargs.tts == "melo":
         try:
@@ -386,12 +502,14 @@ def get_tts_handler(module_kwargs, stop_event, lm_response_queue, send_audio_chu
                 "Error importing MeloTTSHandler. You might need to run: python -m unidic download"
             )
             raise e
-        return MeloTTSHandler(
+        return create_handler(
+            MeloTTSHandler,
             stop_event,
             queue_in=lm_response_queue,
             queue_out=send_audio_chunks_queue,
             setup_args=(should_listen,),
             setup_kwargs=vars(melo_tts_handler_kwargs),
+            in_process="tts" in get_process_handlers(module_kwargs),
         )
     elif module_kwargs.tts == "chatTTS":
         try:
@@ -399,21 +517,25 @@ def get_tts_handler(module_kwargs, stop_event, lm_response_queue, send_audio_chu
         except RuntimeError as e:
             logger.error("Error importing ChatTTSHandler")
             raise e
-        return ChatTTSHandler(
+        return create_handler(
+            ChatTTSHandler,
             stop_event,
             queue_in=lm_response_queue,
             queue_out=send_audio_chunks_queue,
             setup_args=(should_listen,),
             setup_kwargs=vars(chat_tts_handler_kwargs),
+            in_process="tts" in get_process_handlers(module_kwargs),
         )
     elif module_kwargs.tts == "facebookMMS":
         from TTS.facebookmms_handler import FacebookMMSTTSHandler
-        return FacebookMMSTTSHandler(
+        return create_handler(
+            FacebookMMSTTSHandler,
             stop_event,
             queue_in=lm_response_queue,
             queue_out=send_audio_chunks_queue,
             setup_args=(should_listen,),
             setup_kwargs=vars(facebook_mms_tts_handler_kwargs),
+            in_process="tts" in get_process_handlers(module_kwargs),
         )
     else:
         raise ValueError("The TTS should be either parler, melo, chatTTS or facebookMMS")
@@ -453,7 +575,7 @@ def main():
         facebook_mms_tts_handler_kwargs,
     )
 
-    queues_and_events = initialize_queues_and_events()
+    queues_and_events = initialize_queues_and_events(module_kwargs)
 
     pipeline_manager = build_pipeline(
         module_kwargs,
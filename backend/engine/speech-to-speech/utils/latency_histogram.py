@@ -0,0 +1,100 @@
+import math
+import threading
+
+
+class LatencyHistogram:
+    """
+    Fixed-memory latency histogram with log-spaced buckets.
+
+    Buckets grow geometrically from `min_latency` to `max_latency` seconds, so percentiles
+    are accurate to within one bucket (~`growth` relative error) however many samples
+    are recorded.
+    """
+
+    def __init__(self, min_latency=1e-4, max_latency=120.0, growth=1.15):
+        self.min_latency = min_latency
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        n_buckets = int(math.ceil(math.log(max_latency / min_latency) / self._log_growth)) + 1
+        # bucket 0: < min_latency, last bucket: >= max_latency
+        self._counts = [0] * (n_buckets + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def _bucket(self, seconds):
+        if seconds < self.min_latency:
+            return 0
+        index = int(math.log(seconds / self.min_latency) / self._log_growth) + 1
+        return min(index, len(self._counts) - 1)
+
+    def _upper_bound(self, bucket):
+        return self.min_latency * self.growth ** bucket
+
+    def record(self, seconds):
+        seconds = max(0.0, seconds)
+        bucket = self._bucket(seconds)
+        with self._lock:
+            self._counts[bucket] += 1
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile (0 if empty)."""
+        with self._lock:
+            if self.count == 0:
+                return 0.0
+            rank = max(1, int(math.ceil(self.count * p / 100.0)))
+            seen = 0
+            for bucket, n in enumerate(self._counts):
+                seen += n
+                if seen >= rank:
+                    return min(self._upper_bound(bucket), self.max)
+            return self.max
+
+    def snapshot(self):
+        p50, p95, p99 = (self.percentile(p) for p in (50, 95, 99))
+        with self._lock:
+            return {
+                "count": self.count,
+                "mean": self.total / self.count if self.count else 0.0,
+                "p50": p50,
+                "p95": p95,
+                "p99": p99,
+                "max": self.max,
+            }
+
+
+class HandlerMetrics:
+    """Queue wait and service time histograms for one pipeline handler."""
+
+    def __init__(self, name):
+        self.name = name
+        self.queue_wait = LatencyHistogram()
+        self.service = LatencyHistogram()
+
+    def snapshot(self):
+        return {
+            "queue_wait": self.queue_wait.snapshot(),
+            "service": self.service.snapshot(),
+        }
+
+
+def format_report(snapshot):
+    """Render a pipeline metrics snapshot as log lines (times in ms)."""
+    lines = []
+    for name, metrics in snapshot.get("handlers", {}).items():
+        wait, service = metrics["queue_wait"], metrics["service"]
+        lines.append(
+            f"{name:<28} n={service['count']:<6} "
+            f"service p50/p95/p99={service['p50'] * 1000:.0f}/{service['p95'] * 1000:.0f}/{service['p99'] * 1000:.0f}ms "
+            f"wait p50/p95/p99={wait['p50'] * 1000:.0f}/{wait['p95'] * 1000:.0f}/{wait['p99'] * 1000:.0f}ms"
+        )
+    for name, queue in snapshot.get("queues", {}).items():
+        lines.append(
+            f"{name:<28} size={queue['size']}/{queue['maxsize'] or 'inf'} "
+            f"high={queue['high_watermark']} dropped={queue['dropped']} ({queue['policy']})"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,176 @@
+from collections import deque
+from queue import Full, Queue
+from time import perf_counter
+
+# What to do when a bounded queue is full
+QUEUE_POLICIES = ("block", "drop_oldest", "drop_newest")
+# How often a producer blocked on a full queue re-checks the stop event (seconds)
+PUT_POLL_INTERVAL = 0.1
+
+
+def is_sentinel(item):
+    """b"END", bare or closing a client session (see utils.sessions.SessionItem)."""
+    item = getattr(item, "payload", item)
+    return isinstance(item, bytes) and item == b"END"
+
+
+class PipelineQueue(Queue):
+    """
+    Bounded queue between pipeline stages.
+
+    - `policy` decides what happens when the queue is full: "block" applies backpressure
+      to the producer, "drop_oldest"/"drop_newest" discard an item and count it in `dropped`.
+    - A producer blocked on a full queue gives up (and drops the item) once `stop_event` is
+      set, so it is not stuck forever behind a consumer that already stopped.
+    - The b"END" sentinel is never dropped and never waits for room, so handlers can always
+      shut down.
+    - Items are timestamped on put so consumers can measure queue wait with `get_timed`.
+    """
+
+    def __init__(self, maxsize=0, policy="block", name="", stop_event=None):
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Unknown queue policy: {policy} (expected one of {QUEUE_POLICIES})")
+        super().__init__(maxsize)
+        self.policy = policy
+        self.name = name
+        self.stop_event = stop_event
+        self.dropped = 0
+        self.high_watermark = 0
+
+    def _put(self, item):
+        self.queue.append((perf_counter(), item))
+        self.high_watermark = max(self.high_watermark, self._qsize())
+
+    def _evict(self):
+        """Remove the oldest regular item; return False if only sentinels are queued."""
+        victim = next(
+            (i for i, (_, queued) in enumerate(self.queue) if not is_sentinel(queued)),
+            None,
+        )
+        if victim is None:
+            return False
+        del self.queue[victim]
+        return True
+
+    def _put_now(self, item):
+        self._put(item)
+        self.unfinished_tasks += 1
+        self.not_empty.notify()
+
+    def _put_blocking(self, item):
+        """Wait for room, polling `stop_event`; drop the item once the pipeline stops."""
+        while True:
+            try:
+                return super().put(item, timeout=PUT_POLL_INTERVAL)
+            except Full:
+                if self.stop_event.is_set():
+                    with self.mutex:
+                        self.dropped += 1
+                    return
+
+    def put(self, item, block=True, timeout=None):
+        if self.maxsize <= 0:
+            return super().put(item, block, timeout)
+
+        if is_sentinel(item):
+            # The sentinel bypasses the bound: a full queue must not keep a stage from ending
+            with self.not_full:
+                self._put_now(item)
+            return
+
+        if self.policy == "block":
+            if block and timeout is None and self.stop_event is not None:
+                return self._put_blocking(item)
+            return super().put(item, block, timeout)
+
+        with self.not_full:
+            if self._qsize() >= self.maxsize:
+                if self.policy == "drop_newest":
+                    self.dropped += 1
+                    return
+                # drop_oldest: evict the oldest regular item
+                if self._evict():
+                    self.unfinished_tasks -= 1
+                    self.dropped += 1
+            self._put_now(item)
+
+    def get(self, block=True, timeout=None):
+        return self.get_timed(block, timeout)[0]
+
+    def get_timed(self, block=True, timeout=None):
+        """Return (item, seconds spent waiting in the queue)."""
+        enqueued_at, item = super().get(block, timeout)
+        return item, perf_counter() - enqueued_at
+
+    def snapshot(self):
+        return {
+            "size": self.qsize(),
+            "maxsize": self.maxsize,
+            "policy": self.policy,
+            "dropped": self.dropped,
+            "high_watermark": self.high_watermark,
+        }
+
+
+class FairPipelineQueue(PipelineQueue):
+    """
+    PipelineQueue that serves client sessions round-robin.
+
+    Items are kept in one FIFO lane per session (`item.session_id`, None for untagged items
+    such as the b"END" sentinel) and `get` takes one item from each non-empty lane in turn,
+    so a client sending long utterances cannot starve the others on a shared worker.
+    Untagged items are only served once the session lanes are empty.
+    When a drop policy evicts, it evicts from the longest lane.
+    """
+
+    def _init(self, maxsize):
+        self.lanes = {}
+        self._turns = deque()
+        self._size = 0
+
+    def _qsize(self):
+        return self._size
+
+    def _put(self, item):
+        key = getattr(item, "session_id", None)
+        lane = self.lanes.get(key)
+        if lane is None:
+            lane = self.lanes[key] = deque()
+            self._turns.append(key)
+        lane.append((perf_counter(), item))
+        self._size += 1
+        self.high_watermark = max(self.high_watermark, self._size)
+
+    def _get(self):
+        if self._turns[0] is None and len(self._turns) > 1:
+            # Untagged items (the shutdown sentinel) wait until the session lanes drain
+            self._turns.rotate(-1)
+        key = self._turns.popleft()
+        lane = self.lanes[key]
+        entry = lane.popleft()
+        if lane:
+            self._turns.append(key)
+        else:
+            del self.lanes[key]
+        self._size -= 1
+        return entry
+
+    def _evict(self):
+        for key, lane in sorted(self.lanes.items(), key=lambda kv: len(kv[1]), reverse=True):
+            victim = next(
+                (i for i, (_, queued) in enumerate(lane) if not is_sentinel(queued)), None
+            )
+            if victim is None:
+                continue
+            del lane[victim]
+            self._size -= 1
+            if not lane:
+                del self.lanes[key]
+                self._turns.remove(key)
+            return True
+        return False
+
+    def snapshot(self):
+        snapshot = super().snapshot()
+        snapshot["sessions"] = sum(1 for key in self.lanes if key is not None)
+        return snapshot
@@ -0,0 +1,117 @@
+import logging
+import multiprocessing
+import threading
+from queue import Empty, Full
+
+from utils.shared_audio import SharedAudioQueue
+
+logger = logging.getLogger(__name__)
+
+
+def _is_end(item):
+    return isinstance(item, bytes) and item == b"END"
+
+
+def _run_handler(handler_class, stop_event, queue_in, queue_out, setup_args, setup_kwargs, log_level):
+    logging.basicConfig(
+        level=log_level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    queue_out = SharedAudioQueue(queue_out)
+    try:
+        handler = handler_class(
+            stop_event,
+            queue_in=SharedAudioQueue(queue_in),
+            queue_out=queue_out,
+            setup_args=setup_args,
+            setup_kwargs=setup_kwargs,
+        )
+    except Exception:
+        logger.exception(f"{handler_class.__name__} failed to start")
+        queue_out.put(b"END")
+        return
+    handler.run()
+
+
+class ProcessHandler:
+    """
+    Runs a pipeline handler in its own process, outside the main interpreter's GIL.
+
+    The handler is constructed (and its models loaded) in the child process. Two bridge
+    threads connect the regular pipeline queues to small inter-process queues; numpy audio
+    crosses through shared memory (see `utils.shared_audio`), so only handles and text are
+    pickled. Lifecycle matches a threaded handler: `run` blocks until the handler has
+    stopped, b"END" stops it and is forwarded downstream, and `stop_event` is shared (it
+    must be a multiprocessing event, as must any event passed in `setup_args`).
+    """
+
+    def __init__(
+        self,
+        handler_class,
+        stop_event,
+        queue_in,
+        queue_out,
+        setup_args=(),
+        setup_kwargs={},
+        ipc_queue_size=8,
+        start_method="spawn",
+    ):
+        context = multiprocessing.get_context(start_method)
+        self.name = handler_class.__name__
+        self.stop_event = stop_event
+        self.queue_in = queue_in
+        self.queue_out = queue_out
+        self._ipc_in = SharedAudioQueue(context.Queue(ipc_queue_size))
+        self._ipc_out = SharedAudioQueue(context.Queue(ipc_queue_size))
+        self.process = context.Process(
+            target=_run_handler,
+            args=(
+                handler_class,
+                stop_event,
+                self._ipc_in.queue,
+                self._ipc_out.queue,
+                setup_args,
+                setup_kwargs,
+                logging.getLogger().level,
+            ),
+            name=self.name,
+            daemon=True,
+        )
+
+    def run(self):
+        self.process.start()
+        logger.info(f"{self.name} running in process {self.process.pid}")
+        feeder = threading.Thread(target=self._feed, daemon=True)
+        feeder.start()
+        self._collect()
+        self.process.join()
+        feeder.join(timeout=1)
+        # Free shared blocks the child will never consume
+        self._ipc_in.drain()
+
+    def _feed(self):
+        while True:
+            item = self.queue_in.get()
+            while True:
+                if not self.process.is_alive():
+                    return
+                try:
+                    self._ipc_in.put(item, timeout=0.5)
+                    break
+                except Full:
+                    continue
+            if _is_end(item):
+                return
+
+    def _collect(self):
+        while True:
+            try:
+                item = self._ipc_out.get(timeout=0.5)
+            except Empty:
+                if self.process.is_alive():
+                    continue
+                logger.error(f"{self.name} process exited with code {self.process.exitcode}")
+                item = b"END"
+            self.queue_out.put(item)
+            if _is_end(item):
+                return
@@ -0,0 +1,46 @@
+import itertools
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+_session_ids = itertools.count(1)
+
+
+class ClientSession:
+    """
+    Per-client state for the multi-client server.
+
+    Handlers shared by all clients keep their per-client attributes (VAD iterator, chat
+    history, ...) in `state`, keyed by handler, and swap them in when serving this session.
+    """
+
+    def __init__(self, peer=None):
+        self.id = next(_session_ids)
+        self.peer = peer
+        # Set while the client may speak (cleared by the VAD, set again by the TTS)
+        self.should_listen = threading.Event()
+        self.should_listen.set()
+        self.state = {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def __repr__(self):
+        return f"ClientSession(id={self.id}, peer={self.peer})"
+
+
+@dataclass(frozen=True)
+class SessionItem:
+    """A pipeline item tagged with the client session it belongs to."""
+
+    session: ClientSession
+    payload: Any
+
+    @property
+    def session_id(self):
+        return self.session.id
+
+    @property
+    def is_end(self):
+        return isinstance(self.payload, bytes) and self.payload == b"END"
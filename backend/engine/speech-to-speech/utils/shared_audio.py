@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from queue import Empty, Full
+
+import numpy as np
+
+# Arrays smaller than this are cheaper to pickle than to map
+MIN_SHARED_BYTES = 4096
+
+
+@dataclass(frozen=True)
+class SharedAudio:
+    """Small handle to a numpy array parked in a shared memory block."""
+
+    name: str
+    shape: tuple
+    dtype: str
+
+
+def to_shared(obj, min_bytes=MIN_SHARED_BYTES):
+    """
+    Move large numpy arrays in `obj` (also inside tuples/lists) to shared memory and
+    return the same structure with `SharedAudio` handles in their place.
+    Ownership passes to the receiver, which must call `from_shared` exactly once.
+    """
+    if isinstance(obj, np.ndarray) and obj.nbytes >= min_bytes:
+        shm = shared_memory.SharedMemory(create=True, size=obj.nbytes)
+        np.ndarray(obj.shape, dtype=obj.dtype, buffer=shm.buf)[...] = obj
+        handle = SharedAudio(shm.name, obj.shape, obj.dtype.str)
+        # The receiver unlinks the block; stop this process' tracker from reclaiming it
+        resource_tracker.unregister(shm._name, "shared_memory")
+        shm.close()
+        return handle
+    if isinstance(obj, (tuple, list)):
+        return type(obj)(to_shared(item, min_bytes) for item in obj)
+    return obj
+
+
+def from_shared(obj):
+    """Copy arrays referenced by `SharedAudio` handles out and release their blocks."""
+    if isinstance(obj, SharedAudio):
+        shm = shared_memory.SharedMemory(name=obj.name)
+        try:
+            return np.ndarray(obj.shape, dtype=np.dtype(obj.dtype), buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+    if isinstance(obj, (tuple, list)):
+        return type(obj)(from_shared(item) for item in obj)
+    return obj
+
+
+class SharedAudioQueue:
+    """
+    Queue adapter passing numpy payloads through shared memory.
+
+    Wraps a `multiprocessing` queue; only handles and small control messages (text,
+    b"END") are pickled through the underlying pipe.
+    """
+
+    def __init__(self, queue, min_bytes=MIN_SHARED_BYTES):
+        self.queue = queue
+        self.min_bytes = min_bytes
+
+    def put(self, item, block=True, timeout=None):
+        shared = to_shared(item, self.min_bytes)
+        try:
+            self.queue.put(shared, block, timeout)
+        except Full:
+            from_shared(shared)  # not enqueued: release the blocks again
+            raise
+
+    def get(self, block=True, timeout=None):
+        return from_shared(self.queue.get(block, timeout))
+
+    def drain(self):
+        """Release whatever is still queued (used after the consumer has exited)."""
+        drained = 0
+        while True:
+            try:
+                self.get(block=False)
+            except Empty:
+                return drained
+            drained += 1
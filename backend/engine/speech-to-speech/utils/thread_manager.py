@@ -1,23 +1,57 @@
+import logging
 import threading
 
+from utils.latency_histogram import format_report
+
+logger = logging.getLogger(__name__)
+
 
 class ThreadManager:
     """
     Manages multiple threads used to execute given handler tasks.
+    Exposes a metrics `snapshot()` of handler latencies and queue depths, and
+    optionally logs it every `report_interval` seconds.
     """
 
-    def __init__(self, handlers):
+    def __init__(self, handlers, queues=None, report_interval=0.0):
         self.handlers = handlers
+        self.queues = queues or {}
+        self.report_interval = report_interval
         self.threads = []
+        self._report_stop = threading.Event()
+        self._report_thread = None
 
     def start(self):
         for handler in self.handlers:
             thread = threading.Thread(target=handler.run)
             self.threads.append(thread)
             thread.start()
+        if self.report_interval > 0:
+            self._report_thread = threading.Thread(target=self._report_loop, daemon=True)
+            self._report_thread.start()
 
     def stop(self):
+        self._report_stop.set()
         for handler in self.handlers:
             handler.stop_event.set()
         for thread in self.threads:
             thread.join()
+
+    def snapshot(self):
+        """Latency histograms per handler and depth/drop counters per queue."""
+        return {
+            "handlers": {
+                handler.metrics.name: handler.metrics.snapshot()
+                for handler in self.handlers
+                if hasattr(handler, "metrics")
+            },
+            "queues": {
+                name: queue.snapshot()
+                for name, queue in self.queues.items()
+                if hasattr(queue, "snapshot")
+            },
+        }
+
+    def _report_loop(self):
+        while not self._report_stop.wait(self.report_interval):
+            logger.info("Pipeline metrics:\n" + format_report(self.snapshot()))
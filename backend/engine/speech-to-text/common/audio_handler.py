@@ -9,6 +9,8 @@ from typing import Callable, Optional
 import threading
 import queue
 
+from .ring_buffer import AudioRingBuffer
+
 
 class AudioHandler:
     """마이크 오디오 입력을 처리하는 클래스"""
@@ -129,7 +131,7 @@ class AudioHandler:
 
 
 class AudioBuffer:
-    """오디오 데이터를 버퍼링하는 클래스"""
+    """오디오 데이터를 버퍼링하는 클래스 (고정 용량 링 버퍼 기반)"""
     
     def __init__(self, max_duration: float = 30.0, sample_rate: int = 16000):
         """
@@ -140,7 +142,7 @@ class AudioBuffer:
         self.max_duration = max_duration
         self.sample_rate = sample_rate
         self.max_samples = int(max_duration * sample_rate)
-        self.buffer = []
+        self.buffer = AudioRingBuffer(self.max_samples)
         self.lock = threading.Lock()
         
     def append(self, audio_data: np.ndarray):
@@ -151,29 +153,23 @@ class AudioBuffer:
             audio_data: numpy 배열
         """
         with self.lock:
+            # 최대 길이 초과 시 가장 오래된 샘플부터 덮어씀
             self.buffer.append(audio_data)
-            # 최대 길이 초과 시 앞부분 제거
-            total_samples = sum(len(chunk) for chunk in self.buffer)
-            while total_samples > self.max_samples and len(self.buffer) > 1:
-                removed = self.buffer.pop(0)
-                total_samples -= len(removed)
                 
     def get_all(self) -> np.ndarray:
         """
         버퍼의 모든 데이터를 반환
         
         Returns:
-            연결된 numpy 배열
+            버퍼 내용의 복사본 (다른 스레드의 append/clear와 무관하게 유효)
         """
         with self.lock:
-            if not self.buffer:
-                return np.array([], dtype=np.float32)
-            return np.concatenate(self.buffer)
+            return self.buffer.view().copy()
             
     def clear(self):
         """버퍼 초기화"""
         with self.lock:
-            self.buffer = []
+            self.buffer.clear()
             
     def get_duration(self) -> float:
         """
@@ -183,6 +179,4 @@ class AudioBuffer:
             오디오 길이 (초)
         """
         with self.lock:
-            total_samples = sum(len(chunk) for chunk in self.buffer)
-            return total_samples / self.sample_rate
-
+            return len(self.buffer) / self.sample_rate
@@ -0,0 +1,208 @@
+"""
+마음봄 - 오디오 입력 재조립
+웹소켓으로 들어오는 임의 크기 패킷(raw PCM 또는 Opus)을 VAD 프레임 단위로 다시 잘라 전달합니다.
+"""
+
+import numpy as np
+from typing import List, Optional
+
+
+# 샘플 포맷별 (dtype, float32 변환 스케일)
+SAMPLE_FORMATS = {
+    "int16": (np.dtype("<i2"), np.float32(1.0 / 32768.0)),
+    "float32": (np.dtype("<f4"), None),
+}
+
+# 지원 코덱: raw PCM 또는 Opus 패킷 (웹소켓 메시지 1개 = Opus 패킷 1개)
+CODECS = ("pcm", "opus")
+# Opus 패킷 최대 길이 120ms
+OPUS_MAX_FRAME_MS = 120
+# 손상된 Opus 패킷 경고 로그 간격 (첫 패킷, 이후 N개마다)
+OPUS_DROP_LOG_EVERY = 50
+
+
+class AudioFrameAssembler:
+    """
+    바이트 스트림 -> VAD 프레임 재조립기
+
+    - 패킷 크기와 무관하게 바이트를 누적 (샘플 경계가 잘린 바이트도 보존)
+    - int16/float32 입력을 미리 할당된 float32 버퍼에 바로 변환 (임시 astype 복사 없음)
+    - 협상된 샘플레이트가 다르면 soxr 스트리밍 리샘플러로 target_sample_rate로 변환
+    - codec="opus"이면 각 패킷을 로컬 libopus 디코더로 target_sample_rate에 바로 디코딩
+      (디코딩 실패한 패킷은 세션을 끊지 않고 버림, dropped_packets로 집계)
+    - frame_samples 배수 단위로, 한 번에 최대 max_chunk_samples까지 잘라서 반환
+    """
+
+    def __init__(
+        self,
+        sample_format: str = "float32",
+        sample_rate: int = 16000,
+        target_sample_rate: int = 16000,
+        frame_samples: int = 512,
+        max_chunk_samples: int = 4096,
+        codec: str = "pcm",
+    ):
+        """
+        Args:
+            sample_format: 클라이언트 샘플 포맷 ("int16" | "float32", PCM일 때만 사용)
+            sample_rate: 클라이언트 샘플레이트 (PCM일 때만 사용)
+            target_sample_rate: VAD/STT가 기대하는 샘플레이트
+            frame_samples: VAD 프레임 크기 (반환 청크는 이 값의 배수)
+            max_chunk_samples: 반환 청크 최대 크기
+            codec: 전송 코덱 ("pcm" | "opus")
+        """
+        self.target_sample_rate = target_sample_rate
+        self.frame_samples = frame_samples
+        self.max_chunk_samples = max(frame_samples, max_chunk_samples - max_chunk_samples % frame_samples)
+
+        self._buffer = np.zeros(self.max_chunk_samples * 2, dtype=np.float32)
+        self._start = 0  # 아직 반환하지 않은 샘플 시작 위치
+        self._end = 0
+        self._pending_bytes = b""
+        self._resampler = None
+        self._opus_decoder = None
+        self._opus_error = Exception
+        self.dropped_packets = 0
+
+        self.codec = None
+        self.sample_format = None
+        self.sample_rate = None
+        self.configure(sample_format=sample_format, sample_rate=sample_rate, codec=codec)
+
+    def configure(
+        self,
+        sample_format: Optional[str] = None,
+        sample_rate: Optional[int] = None,
+        codec: Optional[str] = None,
+    ):
+        """
+        클라이언트 오디오 포맷 설정 (연결 시 협상)
+
+        Raises:
+            ValueError: 지원하지 않는 코덱/포맷/샘플레이트
+        """
+        if codec is not None:
+            if codec not in CODECS:
+                raise ValueError(f"지원하지 않는 코덱: {codec} (지원: {list(CODECS)})")
+            self.codec = codec
+        if sample_format is not None:
+            if sample_format not in SAMPLE_FORMATS:
+                raise ValueError(
+                    f"지원하지 않는 오디오 포맷: {sample_format} (지원: {list(SAMPLE_FORMATS)})"
+                )
+            self.sample_format = sample_format
+        if sample_rate is not None:
+            sample_rate = int(sample_rate)
+            if sample_rate <= 0:
+                raise ValueError(f"잘못된 샘플레이트: {sample_rate}")
+            self.sample_rate = sample_rate
+
+        self._dtype, self._scale = SAMPLE_FORMATS[self.sample_format]
+        self._resampler = None
+        self._opus_decoder = None
+        if self.codec == "opus":
+            # Opus는 디코더 출력 샘플레이트를 직접 지정하므로 리샘플링 불필요
+            import opuslib
+
+            self._opus_decoder = opuslib.Decoder(self.target_sample_rate, 1)
+            self._opus_error = getattr(opuslib, "OpusError", Exception)
+            self._opus_frame_size = self.target_sample_rate * OPUS_MAX_FRAME_MS // 1000
+        elif self.sample_rate != self.target_sample_rate:
+            import soxr
+
+            self._resampler = soxr.ResampleStream(
+                self.sample_rate, self.target_sample_rate, 1, dtype="float32"
+            )
+        self.reset()
+
+    def reset(self):
+        """누적된 오디오 버리기"""
+        self._start = 0
+        self._end = 0
+        self._pending_bytes = b""
+        if self._resampler is not None:
+            self._resampler.clear()
+        if self._opus_decoder is not None:
+            self._opus_decoder.reset_state()
+
+    @property
+    def pending_samples(self) -> int:
+        """아직 프레임으로 반환되지 않은 샘플 수"""
+        return self._end - self._start
+
+    def _reserve(self, num_samples: int) -> np.ndarray:
+        """버퍼 끝에 num_samples 만큼 쓸 공간 확보 후 해당 구간 반환"""
+        pending = self._end - self._start
+        if self._start > 0:
+            # 이전에 반환한 프레임 이후의 자투리를 앞으로 당김
+            self._buffer[:pending] = self._buffer[self._start:self._end]
+            self._start, self._end = 0, pending
+        if pending + num_samples > len(self._buffer):
+            grown = np.zeros(pending + num_samples + self.max_chunk_samples, dtype=np.float32)
+            grown[:pending] = self._buffer[:pending]
+            self._buffer = grown
+        return self._buffer[self._end:self._end + num_samples]
+
+    def _append_pcm(self, samples: np.ndarray, scale: Optional[np.float32]):
+        """PCM 샘플을 float32로 변환하며 버퍼 끝에 바로 기록"""
+        out = self._reserve(len(samples))
+        if scale is None:
+            out[:] = samples
+        else:
+            np.multiply(samples, scale, out=out, casting="unsafe")
+        self._end += len(samples)
+
+    def feed(self, data: bytes) -> List[np.ndarray]:
+        """
+        수신한 바이트를 누적하고 완성된 VAD 청크 반환
+
+        Args:
+            data: 클라이언트가 보낸 raw PCM 바이트 (크기 무관) 또는 Opus 패킷 1개
+
+        Returns:
+            float32 청크 목록 (버퍼의 뷰이므로 다음 feed 호출 전까지만 유효)
+        """
+        if self._opus_decoder is not None:
+            # Opus 패킷 -> int16 PCM (target_sample_rate)
+            try:
+                pcm = self._opus_decoder.decode(bytes(data), self._opus_frame_size)
+            except self._opus_error as e:
+                # 잘리거나 손상된 패킷 하나 때문에 세션 전체를 끊지 않음
+                self.dropped_packets += 1
+                if self.dropped_packets % OPUS_DROP_LOG_EVERY == 1:
+                    print(f"[오디오] ⚠️ Opus 패킷 디코딩 실패, 버림 (누적 {self.dropped_packets}개): {e}")
+                return []
+            int16_dtype, int16_scale = SAMPLE_FORMATS["int16"]
+            self._append_pcm(np.frombuffer(pcm, dtype=int16_dtype), int16_scale)
+            return self._take_chunks()
+
+        itemsize = self._dtype.itemsize
+        if self._pending_bytes:
+            data = self._pending_bytes + data
+        usable = len(data) - len(data) % itemsize
+        self._pending_bytes = bytes(data[usable:])
+
+        if usable:
+            samples = np.frombuffer(data, dtype=self._dtype, count=usable // itemsize)
+            if self._resampler is None:
+                self._append_pcm(samples, self._scale)
+            else:
+                if self._scale is None:
+                    converted = samples.astype(np.float32, copy=False)
+                else:
+                    converted = samples * self._scale
+                resampled = self._resampler.resample_chunk(converted)
+                self._reserve(len(resampled))[:] = resampled
+                self._end += len(resampled)
+
+        return self._take_chunks()
+
+    def _take_chunks(self) -> List[np.ndarray]:
+        """프레임 배수 단위로 잘라서 반환"""
+        chunks = []
+        while self._end - self._start >= self.frame_samples:
+            size = min(self.max_chunk_samples, self._end - self._start)
+            size -= size % self.frame_samples
+            chunks.append(self._buffer[self._start:self._start + size])
+            self._start += size
+        return chunks
@@ -0,0 +1,114 @@
+"""
+마음봄 - 고정 용량 오디오 링 버퍼
+발화 누적/프리롤 버퍼를 미리 할당해 스트림당 메모리 할당을 없앱니다.
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+class AudioRingBuffer:
+    """
+    고정 용량 float32 링 버퍼
+
+    - append: 용량을 넘으면 가장 오래된 샘플을 덮어씀
+    - view: 연속 구간이면 복사 없이 뷰 반환
+    - detach: 현재 내용을 뷰로 넘기고 예비 배열로 교체 (더블 버퍼링)
+
+    반환된 뷰는 버퍼 메모리를 그대로 가리키므로,
+    view()는 다음 clear/덮어쓰기 전까지, detach()는 다음 detach/compact 전까지만 유효합니다.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float32):
+        """
+        Args:
+            capacity: 최대 샘플 수
+            dtype: 샘플 타입
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = int(capacity)
+        self._data = np.zeros(self.capacity, dtype=dtype)
+        self._spare = np.zeros(self.capacity, dtype=dtype)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def is_wrapped(self) -> bool:
+        """내용이 배열 끝을 넘어 앞쪽으로 이어지는지 여부"""
+        return self._start + self._size > self.capacity
+
+    def clear(self):
+        """버퍼 비우기 (메모리는 유지)"""
+        self._start = 0
+        self._size = 0
+
+    def append(self, samples: np.ndarray) -> int:
+        """
+        샘플 추가
+
+        Args:
+            samples: 1차원 오디오 배열
+
+        Returns:
+            용량 초과로 버려진 (가장 오래된) 샘플 수
+        """
+        n = len(samples)
+        if n == 0:
+            return 0
+
+        if n >= self.capacity:
+            dropped = self._size + n - self.capacity
+            self._data[:] = samples[n - self.capacity:]
+            self._start = 0
+            self._size = self.capacity
+            return dropped
+
+        end = (self._start + self._size) % self.capacity
+        first = min(n, self.capacity - end)
+        self._data[end:end + first] = samples[:first]
+        if first < n:
+            self._data[:n - first] = samples[first:]
+
+        dropped = max(0, self._size + n - self.capacity)
+        if dropped:
+            self._start = (self._start + dropped) % self.capacity
+        self._size += n - dropped
+        return dropped
+
+    def segments(self) -> Tuple[np.ndarray, ...]:
+        """내용을 순서대로 1~2개의 뷰로 반환 (복사 없음)"""
+        end = self._start + self._size
+        if end <= self.capacity:
+            return (self._data[self._start:end],)
+        return (self._data[self._start:], self._data[:end - self.capacity])
+
+    def compact(self):
+        """내용을 예비 배열의 앞쪽으로 옮겨 연속 구간으로 만듦"""
+        offset = 0
+        for segment in self.segments():
+            self._spare[offset:offset + len(segment)] = segment
+            offset += len(segment)
+        self._data, self._spare = self._spare, self._data
+        self._start = 0
+
+    def view(self) -> np.ndarray:
+        """전체 내용을 연속 뷰로 반환 (감겨 있을 때만 한 번 정렬)"""
+        if self.is_wrapped:
+            self.compact()
+        return self._data[self._start:self._start + self._size]
+
+    def tail(self, n: int) -> np.ndarray:
+        """마지막 n 샘플의 연속 뷰"""
+        n = min(n, self._size)
+        return self.view()[self._size - n:]
+
+    def detach(self) -> np.ndarray:
+        """현재 내용을 뷰로 넘기고, 이후 쓰기는 예비 배열에서 시작"""
+        audio = self.view()
+        self._data, self._spare = self._spare, self._data
+        self.clear()
+        return audio
@@ -0,0 +1,328 @@
+"""
+Speaker Identification Service
+화자 식별 싱글톤 서비스 - 인코더 1개, 사용자별 정규화 보이스프린트 행렬 캐시, DB 일괄 쓰기
+"""
+
+import threading
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from speaker_verifier import SpeakerVerifier
+
+
+class VoiceprintIndex:
+    """
+    사용자 1명의 화자 프로필 캐시
+
+    - matrix: 행마다 L2 정규화된 임베딩 (n, dim) float32
+    - embeddings: 점진적 업데이트용 원본 임베딩
+    """
+
+    def __init__(self):
+        self.speaker_ids: List[str] = []
+        self.profile_ids: List[Optional[int]] = []  # 아직 DB에 쓰이지 않았으면 None
+        self.scores: List[float] = []
+        self.embeddings: List[Optional[np.ndarray]] = []
+        self.matrix = np.zeros((0, 0), dtype=np.float32)
+        self.row_speakers: List[int] = []  # matrix 행 -> speaker 인덱스 (임베딩 없는 프로필 제외)
+
+    def __len__(self) -> int:
+        return len(self.speaker_ids)
+
+    def index_of(self, speaker_id: str) -> Optional[int]:
+        try:
+            return self.speaker_ids.index(speaker_id)
+        except ValueError:
+            return None
+
+    def upsert(self, speaker_id: str, embedding: Optional[np.ndarray], score: float,
+               profile_id: Optional[int] = None):
+        """프로필 추가/갱신 후 행렬 재구성"""
+        idx = self.index_of(speaker_id)
+        if idx is None:
+            self.speaker_ids.append(speaker_id)
+            self.profile_ids.append(profile_id)
+            self.scores.append(score)
+            self.embeddings.append(embedding)
+        else:
+            if profile_id is not None:
+                self.profile_ids[idx] = profile_id
+            self.scores[idx] = score
+            self.embeddings[idx] = embedding
+        self._rebuild()
+
+    def _rebuild(self):
+        rows = [i for i, emb in enumerate(self.embeddings) if emb is not None]
+        self.row_speakers = rows
+        if not rows:
+            self.matrix = np.zeros((0, 0), dtype=np.float32)
+            return
+        matrix = np.stack([self.embeddings[i] for i in rows]).astype(np.float32)
+        self.matrix = SpeakerVerifier.normalize_rows(matrix)
+
+
+class SpeakerIdService:
+    """
+    장기 실행 화자 식별 서비스
+
+    주요 기능:
+    - Resemblyzer 인코더 1개 공유 (SpeakerVerifier, 설정은 한 번만 로드)
+    - 사용자별 보이스프린트 행렬 캐시 (save/update_speaker_profile 시 무효화)
+    - 화자 식별 = 행렬-벡터 곱 1회
+    - DB 쓰기는 모아서 주기적으로 한 트랜잭션에 반영 (write-behind)
+    """
+
+    def __init__(
+        self,
+        store,
+        verifier: Optional[SpeakerVerifier] = None,
+        config_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            store: 화자 프로필 저장소 (DBConversationStore)
+            verifier: SpeakerVerifier (없으면 config_path로 생성)
+            config_path: config.yaml 경로 (선택)
+        """
+        self.store = store
+        self.verifier = verifier or SpeakerVerifier(config_path=config_path)
+        self.flush_interval = float(self.verifier.config.get("db_flush_interval_sec", 2.0))
+        self.flush_batch_size = int(self.verifier.config.get("db_flush_batch_size", 16))
+
+        self._indexes: Dict[int, VoiceprintIndex] = {}
+        self._lock = threading.RLock()
+        self._encoder_lock = threading.Lock()
+
+        # (user_id, speaker_type) -> 대기 중인 쓰기
+        self._pending: Dict[Tuple[int, str], dict] = {}
+        self._inflight: List[dict] = []  # flush 중인 쓰기 (캐시 재로드 시 덮어쓰기용)
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+        add_listener = getattr(store, "add_speaker_profile_listener", None)
+        if add_listener is not None:
+            add_listener(self.invalidate)
+
+    @property
+    def enabled(self) -> bool:
+        return self.verifier.enabled
+
+    # ------------------------------------------------------------------
+    # 임베딩 / 식별
+    # ------------------------------------------------------------------
+
+    def extract_embedding(self, audio: np.ndarray) -> Optional[np.ndarray]:
+        """공유 인코더로 임베딩 추출 (여러 연결에서 동시에 호출돼도 안전)"""
+        if not self.verifier.enabled:
+            return None
+        with self._encoder_lock:
+            return self.verifier.extract_embedding(audio)
+
+    def get_index(self, user_id: int) -> VoiceprintIndex:
+        """사용자 캐시 조회 (없으면 DB에서 한 번 로드)"""
+        with self._lock:
+            index = self._indexes.get(user_id)
+            if index is not None:
+                return index
+
+        index = VoiceprintIndex()
+        for p in self.store.get_speaker_profiles(user_id):
+            embedding = p.get("embedding")
+            index.upsert(
+                p["speaker_type"],
+                np.asarray(embedding, dtype=np.float32) if embedding is not None else None,
+                p.get("current_score") or 0.0,
+                profile_id=p["id"],
+            )
+
+        with self._lock:
+            # 아직 DB에 반영되지 않은 쓰기를 덮어씀
+            for entry in self._inflight + list(self._pending.values()):
+                if entry["user_id"] == user_id:
+                    index.upsert(entry["speaker_type"], entry["embedding"], entry["score"], entry["profile_id"])
+            return self._indexes.setdefault(user_id, index)
+
+    def identify(self, user_id: int, embedding: np.ndarray) -> Tuple[Optional[str], float]:
+        """
+        화자 식별 (SpeakerVerifier.identify_speaker와 동일한 규칙)
+
+        Returns:
+            (화자 ID, 유사도) - 매칭 실패 시 새 ID와 0.0
+        """
+        if embedding is None:
+            return None, 0.0
+
+        index = self.get_index(user_id)
+        with self._lock:
+            if len(index) == 0:
+                return "user-A", 0.0
+
+            best_row, best_similarity = self.verifier.best_match(embedding, index.matrix)
+            if best_row is not None and best_similarity >= self.verifier.similarity_threshold:
+                speaker_id = index.speaker_ids[index.row_speakers[best_row]]
+                print(f"[Speaker Debug] ✅ 기존 화자 매칭: {speaker_id} (유사도: {best_similarity:.3f})")
+                return speaker_id, best_similarity
+
+            new_id = f"user-{chr(65 + len(index))}"
+            print(
+                f"[Speaker Debug] 🆕 새 화자 감지: {new_id} "
+                f"(최고 유사도: {best_similarity:.3f} < {self.verifier.similarity_threshold})"
+            )
+            return new_id, 0.0
+
+    def register(self, user_id: int, speaker_id: str, embedding: np.ndarray, similarity: float) -> bool:
+        """
+        식별 결과 반영 - 신규 화자는 등록, 기존 화자는 점수가 오를 때만 가중 평균 업데이트
+
+        Returns:
+            캐시/DB 쓰기가 발생했는지 여부
+        """
+        index = self.get_index(user_id)
+        with self._lock:
+            idx = index.index_of(speaker_id)
+            if idx is None:
+                index.upsert(speaker_id, np.asarray(embedding, dtype=np.float32), similarity)
+                self._enqueue(user_id, speaker_id, None, embedding, similarity)
+                print(f"[Speaker] 신규 등록: {speaker_id}")
+                return True
+
+            current_score = index.scores[idx]
+            if similarity <= current_score:
+                print(
+                    f"[Speaker] ✓ 기존 사용자: {speaker_id} "
+                    f"(업데이트 불필요, Score: {current_score:.3f} >= {similarity:.3f})"
+                )
+                return False
+
+            updated = self.verifier.update_embedding(index.embeddings[idx], embedding, speaker_id=speaker_id)
+            updated = np.asarray(updated, dtype=np.float32)
+            index.upsert(speaker_id, updated, similarity)
+            self._enqueue(user_id, speaker_id, index.profile_ids[idx], updated, similarity)
+            print(f"[Speaker] 🔄 프로필 업데이트: {speaker_id} (Score: {current_score:.3f} -> {similarity:.3f})")
+            return True
+
+    def identify_and_register(self, user_id: int, embedding: np.ndarray) -> Tuple[Optional[str], float]:
+        """식별 + 프로필 반영"""
+        speaker_id, similarity = self.identify(user_id, embedding)
+        if speaker_id is not None:
+            self.register(user_id, speaker_id, embedding, similarity)
+        return speaker_id, similarity
+
+    def speaker_ids(self, user_id: int) -> List[str]:
+        """등록된 화자 ID 목록 (캐시 기준)"""
+        index = self.get_index(user_id)
+        with self._lock:
+            return list(index.speaker_ids)
+
+    def invalidate(self, user_id: Optional[int] = None):
+        """캐시 무효화 (user_id가 없으면 전체)"""
+        with self._lock:
+            if user_id is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(user_id, None)
+
+    # ------------------------------------------------------------------
+    # DB 일괄 쓰기
+    # ------------------------------------------------------------------
+
+    def _enqueue(self, user_id: int, speaker_id: str, profile_id: Optional[int],
+                 embedding: np.ndarray, score: float):
+        key = (user_id, speaker_id)
+        previous = self._pending.get(key)
+        if profile_id is None and previous is not None:
+            profile_id = previous["profile_id"]
+        self._pending[key] = {
+            "user_id": user_id,
+            "speaker_type": speaker_id,
+            "profile_id": profile_id,
+            "embedding": np.asarray(embedding, dtype=np.float32),
+            "score": float(score),
+        }
+        self._ensure_flush_thread()
+        if len(self._pending) >= self.flush_batch_size:
+            self._wake.set()
+
+    @property
+    def pending_writes(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        대기 중인 프로필 쓰기를 한 트랜잭션으로 DB에 반영
+
+        Returns:
+            반영된 프로필 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch = list(self._pending.values())
+                self._pending = {}
+                self._inflight = batch
+
+            rows = [
+                {
+                    "user_id": entry["user_id"],
+                    "speaker_type": entry["speaker_type"],
+                    "profile_id": entry["profile_id"],
+                    "embedding": entry["embedding"].tolist(),
+                    "score": entry["score"],
+                }
+                for entry in batch
+            ]
+            try:
+                profile_ids = self.store.write_speaker_profiles(rows)
+            except Exception as e:
+                print(f"[Speaker] ⚠️ 프로필 일괄 저장 실패 ({len(rows)}건): {e}")
+                with self._lock:
+                    self._inflight = []
+                    # 실패분은 더 새로운 쓰기가 없을 때만 다시 대기열에
+                    for entry in batch:
+                        self._pending.setdefault((entry["user_id"], entry["speaker_type"]), entry)
+                return 0
+
+            with self._lock:
+                self._inflight = []
+                for entry, profile_id in zip(batch, profile_ids):
+                    if entry["profile_id"] is not None or profile_id is None:
+                        continue
+                    key = (entry["user_id"], entry["speaker_type"])
+                    index = self._indexes.get(entry["user_id"])
+                    if index is not None:
+                        idx = index.index_of(entry["speaker_type"])
+                        if idx is not None:
+                            index.profile_ids[idx] = profile_id
+                    # flush 중에 들어온 후속 업데이트가 중복 INSERT 되지 않도록 ID 연결
+                    if key in self._pending and self._pending[key]["profile_id"] is None:
+                        self._pending[key]["profile_id"] = profile_id
+
+            print(f"[Speaker] 💾 프로필 {len(rows)}건 일괄 저장")
+            return len(rows)
+
+    def _ensure_flush_thread(self):
+        if self._flush_thread is not None or self._stopped.is_set():
+            return
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop, name="speaker-profile-flush", daemon=True
+        )
+        self._flush_thread.start()
+
+    def _flush_loop(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self):
+        """플러시 스레드 종료 + 남은 쓰기 반영 (앱 종료 시)"""
+        self._stopped.set()
+        self._wake.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join(timeout=5)
+            self._flush_thread = None
+        self.flush()
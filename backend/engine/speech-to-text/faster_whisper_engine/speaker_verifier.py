@@ -107,6 +107,40 @@ class SpeakerVerifier:
         similarity = np.dot(emb1, emb2) / (np.linalg.norm(emb1) * np.linalg.norm(emb2))
         return float(similarity)
     
+    @staticmethod
+    def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """행 단위 L2 정규화 (코사인 유사도를 내적 1회로 계산하기 위함)"""
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+    
+    def best_match(
+        self,
+        embedding: np.ndarray,
+        normalized_matrix: np.ndarray
+    ) -> Tuple[Optional[int], float]:
+        """
+        정규화된 보이스프린트 행렬에서 가장 유사한 행 찾기
+        
+        Args:
+            embedding: 현재 임베딩
+            normalized_matrix: 행마다 정규화된 임베딩 (n, dim)
+            
+        Returns:
+            (행 인덱스, 코사인 유사도) - 행렬이 비어 있으면 (None, 0.0)
+        """
+        if embedding is None or len(normalized_matrix) == 0:
+            return None, 0.0
+        
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return None, 0.0
+        
+        similarities = normalized_matrix @ (query / norm)
+        best_row = int(np.argmax(similarities))
+        return best_row, float(similarities[best_row])
+    
     def identify_speaker(
         self, 
         current_embedding: np.ndarray, 
@@ -132,21 +166,21 @@ class SpeakerVerifier:
             # 첫 번째 사용자
             return "user-A", 0.0
         
-        # 모든 기존 프로필과 비교
+        # 모든 기존 프로필과 한 번에 비교 (정규화 행렬 x 벡터)
+        profile_ids = [
+            speaker_id for speaker_id, profile in existing_profiles.items()
+            if profile.get("embedding") is not None
+        ]
         best_match_id = None
         best_similarity = 0.0
-        
-        for speaker_id, profile in existing_profiles.items():
-            existing_embedding = profile.get("embedding")
-            if existing_embedding is None:
-                continue
-            
-            similarity = self.compare_speakers(current_embedding, existing_embedding)
-            print(f"[Speaker Debug] {speaker_id} 유사도: {similarity:.3f}")
-            
-            if similarity > best_similarity:
+        if profile_ids:
+            matrix = self.normalize_rows(
+                np.stack([np.asarray(existing_profiles[sid]["embedding"], dtype=np.float32) for sid in profile_ids])
+            )
+            best_row, similarity = self.best_match(current_embedding, matrix)
+            if best_row is not None and similarity > best_similarity:
                 best_similarity = similarity
-                best_match_id = speaker_id
+                best_match_id = profile_ids[best_row]
         
         # 임계값 이상이면 기존 화자로 인식
         if best_similarity >= self.similarity_threshold:
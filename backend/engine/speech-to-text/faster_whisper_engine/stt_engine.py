@@ -61,6 +61,8 @@ class MaumBomSTT:
             short_silence_duration_ms=vad_config.get("short_silence_duration_ms", 500),
             speech_pad_ms=vad_config["speech_pad_ms"],
             sample_rate=audio_config["sample_rate"],
+            backend=vad_config.get("backend", "onnx"),
+            onnx_model_path=vad_config.get("onnx_model_path"),
         )
 
         # Whisper STT
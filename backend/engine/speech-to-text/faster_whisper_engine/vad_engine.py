@@ -3,15 +3,138 @@
 음성 활동 감지 (Voice Activity Detection)
 """
 
-import torch
+import importlib.util
+import sys
 import numpy as np
-from typing import Optional, Tuple
+from pathlib import Path
+from typing import List, Optional, Tuple
 import time
 
+# speech-to-text 디렉토리 (common 모듈)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from common.ring_buffer import AudioRingBuffer
+
+try:
+    import torch
+except ImportError:  # ONNX 백엔드만 사용하는 환경
+    torch = None
+
+
+# Silero VAD는 16kHz에서 512 샘플 프레임 + 직전 64 샘플 컨텍스트를 입력으로 사용
+VAD_FRAME_SIZE = 512
+VAD_CONTEXT_SIZE = 64
+VAD_STATE_SHAPE = (1, 1, 128)
+SEQUENCE_MODEL_NAME = "silero_vad_16k_sequence.onnx"
+
+
+def _find_sequence_model() -> Optional[Path]:
+    """설치된 silero-vad 패키지에서 시퀀스 ONNX 모델 경로 탐색 (torch import 없이)"""
+    spec = importlib.util.find_spec("silero_vad")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    for location in spec.submodule_search_locations:
+        candidate = Path(location) / "data" / SEQUENCE_MODEL_NAME
+        if candidate.exists():
+            return candidate
+    return None
+
+
+class SileroOnnxScorer:
+    """
+    Silero VAD 시퀀스 ONNX 모델 래퍼
+
+    청크 하나의 모든 프레임을 ONNX 호출 한 번으로 점수화합니다.
+    LSTM 상태(h, c)와 프레임 컨텍스트를 명시적으로 들고 있어 청크 간 스트리밍이 이어집니다.
+    """
+
+    def __init__(self, model_path: Optional[str] = None, num_threads: int = 1):
+        """
+        Args:
+            model_path: 시퀀스 ONNX 모델 경로 (None이면 silero-vad 패키지 내장 모델 사용)
+            num_threads: ONNX Runtime intra-op 스레드 수
+        """
+        import onnxruntime as ort
+
+        path = Path(model_path) if model_path else _find_sequence_model()
+        if path is None or not path.exists():
+            raise FileNotFoundError(
+                f"Silero VAD 시퀀스 모델을 찾을 수 없습니다: {model_path or SEQUENCE_MODEL_NAME}"
+            )
+
+        options = ort.SessionOptions()
+        options.inter_op_num_threads = 1
+        options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(
+            str(path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self._block = np.zeros((0, VAD_CONTEXT_SIZE + VAD_FRAME_SIZE), dtype=np.float32)
+        self.reset_states()
+
+    def reset_states(self):
+        """LSTM 상태 및 컨텍스트 초기화"""
+        self._h = np.zeros(VAD_STATE_SHAPE, dtype=np.float32)
+        self._c = np.zeros(VAD_STATE_SHAPE, dtype=np.float32)
+        self._context = np.zeros(VAD_CONTEXT_SIZE, dtype=np.float32)
+
+    def predict_frames(self, frames: np.ndarray) -> np.ndarray:
+        """
+        프레임 배열의 음성 확률 계산
+
+        Args:
+            frames: (n_frames, 512) float32 배열
+
+        Returns:
+            (n_frames,) 음성 확률 벡터
+        """
+        n_frames = frames.shape[0]
+        if n_frames == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        # 입력 블록 재사용 (청크 크기가 같으면 재할당 없음)
+        if self._block.shape[0] != n_frames:
+            self._block = np.empty(
+                (n_frames, VAD_CONTEXT_SIZE + VAD_FRAME_SIZE), dtype=np.float32
+            )
+        block = self._block
+        block[:, VAD_CONTEXT_SIZE:] = frames
+        block[0, :VAD_CONTEXT_SIZE] = self._context
+        if n_frames > 1:
+            block[1:, :VAD_CONTEXT_SIZE] = frames[:-1, -VAD_CONTEXT_SIZE:]
+        self._context = frames[-1, -VAD_CONTEXT_SIZE:].copy()
+
+        probs, self._h, self._c = self.session.run(
+            ["speech_probs", "hn", "cn"],
+            {"input": block, "h": self._h, "c": self._c},
+        )
+        return probs.reshape(-1)
+
+
+class SileroTorchScorer:
+    """torch.hub Silero VAD 모델 래퍼 (프레임 단위 호출, ONNX 불가 시 대체용)"""
+
+    def __init__(self, sample_rate: int = 16000):
+        self.sample_rate = sample_rate
+        self.model, _ = torch.hub.load(
+            repo_or_dir='snakers4/silero-vad',
+            model='silero_vad',
+            force_reload=False,
+            onnx=False
+        )
+
+    def reset_states(self):
+        self.model.reset_states()
+
+    def predict_frames(self, frames: np.ndarray) -> np.ndarray:
+        probs = np.empty(frames.shape[0], dtype=np.float32)
+        with torch.no_grad():
+            for i, frame in enumerate(frames):
+                probs[i] = self.model(torch.from_numpy(frame), self.sample_rate).item()
+        return probs
+
 
 class SileroVAD:
     """Silero VAD 모델을 사용한 음성 활동 감지"""
-    
+
     def __init__(
         self,
         threshold: float = 0.5,
@@ -20,7 +143,9 @@ class SileroVAD:
         min_silence_duration_ms: int = 2000,
         short_silence_duration_ms: int = 500,  # 짧은 침묵 감지 (문장 구분용)
         speech_pad_ms: int = 300,
-        sample_rate: int = 16000
+        sample_rate: int = 16000,
+        backend: str = "onnx",
+        onnx_model_path: Optional[str] = None,
     ):
         """
         Args:
@@ -31,6 +156,8 @@ class SileroVAD:
             short_silence_duration_ms: 짧은 무음 감지 시간 (ms) - 문장 구분/확정
             speech_pad_ms: 발화 앞뒤 패딩 (ms)
             sample_rate: 샘플링 레이트
+            backend: "onnx" (청크 단위 일괄 추론) 또는 "torch" (프레임 단위 추론)
+            onnx_model_path: 시퀀스 ONNX 모델 경로 (None이면 패키지 내장 모델)
         """
         self.threshold = threshold
         self.min_speech_duration_ms = min_speech_duration_ms
@@ -39,48 +166,90 @@ class SileroVAD:
         self.short_silence_duration_ms = short_silence_duration_ms
         self.speech_pad_ms = speech_pad_ms
         self.sample_rate = sample_rate
-        
+
         # 샘플 단위로 변환
         self.min_speech_samples = int(sample_rate * min_speech_duration_ms / 1000)
         self.max_speech_samples = int(sample_rate * max_speech_duration_s)
         self.min_silence_samples = int(sample_rate * min_silence_duration_ms / 1000)
         self.short_silence_samples = int(sample_rate * short_silence_duration_ms / 1000)
         self.speech_pad_samples = int(sample_rate * speech_pad_ms / 1000)
-        
+
         # Silero VAD 모델 로드
-        print("📥 Silero VAD 모델 로딩 중...")
-        try:
-            self.model, utils = torch.hub.load(
-                repo_or_dir='snakers4/silero-vad',
-                model='silero_vad',
-                force_reload=False,
-                onnx=False
-            )
-            self.get_speech_timestamps = utils[0]
-            print("✅ Silero VAD 모델 로드 완료")
-        except Exception as e:
-            print(f"❌ Silero VAD 모델 로드 실패: {e}")
-            raise
-            
+        print(f"📥 Silero VAD 모델 로딩 중... (backend={backend})")
+        self.scorer = None
+        if backend == "onnx" and sample_rate == 16000:
+            try:
+                self.scorer = SileroOnnxScorer(model_path=onnx_model_path)
+                self.backend = "onnx"
+            except Exception as e:
+                print(f"⚠️ ONNX VAD 로드 실패, torch 백엔드로 전환: {e}")
+        if self.scorer is None:
+            try:
+                self.scorer = SileroTorchScorer(sample_rate=sample_rate)
+                self.backend = "torch"
+            except Exception as e:
+                print(f"❌ Silero VAD 모델 로드 실패: {e}")
+                raise
+        print(f"✅ Silero VAD 모델 로드 완료 ({self.backend})")
+
+        # 발화 버퍼 (미리 할당): 프리롤 + 최대 발화 길이 + 이벤트 프레임 여유분
+        self.speech_buffer = AudioRingBuffer(
+            self.max_speech_samples + self.speech_pad_samples + 2 * VAD_FRAME_SIZE
+        )
+        # 발화 시작 전 패딩용 프리롤 (최근 speech_pad_ms 만큼만 유지)
+        self.preroll_buffer = AudioRingBuffer(max(self.speech_pad_samples, 1))
+
         # 상태
         self.is_speaking = False
         self.speech_start_sample = 0
         self.silence_start_sample = 0
         self.current_sample = 0
-        self.speech_buffer = []
         self.last_was_speech = False  # 이전 청크가 음성이었는지 추적
         self.short_pause_triggered = False  # 짧은 침묵 이미 감지됨
-        
+
     def reset(self):
         """상태 초기화"""
         self.is_speaking = False
         self.speech_start_sample = 0
         self.silence_start_sample = 0
         self.current_sample = 0
-        self.speech_buffer = []
+        # 배열 교체(detach)는 _emit_speech 에서만: 여기서 교체하면 직전에 반환된
+        # 발화 뷰가 담긴 예비 배열이 다시 쓰이게 됨
+        self.speech_buffer.clear()
+        self.preroll_buffer.clear()
         self.last_was_speech = False
         self.short_pause_triggered = False
-        
+
+    def _emit_speech(self) -> np.ndarray:
+        """
+        누적된 발화를 반환하고 상태 초기화
+
+        반환값은 발화 버퍼의 뷰이며, 버퍼는 예비 배열로 교체되므로
+        다음 발화가 끝날 때까지 덮어써지지 않습니다.
+        """
+        speech_audio = self.speech_buffer.detach()
+        self.reset()
+        return speech_audio
+
+    def _score_chunk(self, audio_chunk: np.ndarray) -> Tuple[np.ndarray, int]:
+        """
+        청크를 512 샘플 프레임으로 나눠 한 번에 점수화
+
+        Returns:
+            (프레임별 음성 확률, 프레임 길이)
+        """
+        audio_chunk = np.ascontiguousarray(audio_chunk, dtype=np.float32)
+
+        # 512보다 작은 청크는 0으로 패딩해 한 프레임으로 처리
+        if len(audio_chunk) < VAD_FRAME_SIZE:
+            frame = np.zeros((1, VAD_FRAME_SIZE), dtype=np.float32)
+            frame[0, :len(audio_chunk)] = audio_chunk
+            return self.scorer.predict_frames(frame), len(audio_chunk)
+
+        num_frames = len(audio_chunk) // VAD_FRAME_SIZE
+        frames = audio_chunk[:num_frames * VAD_FRAME_SIZE].reshape(num_frames, VAD_FRAME_SIZE)
+        return self.scorer.predict_frames(frames), VAD_FRAME_SIZE
+
     def process_chunk(
         self,
         audio_chunk: np.ndarray,
@@ -88,42 +257,29 @@ class SileroVAD:
     ) -> Tuple[bool, Optional[np.ndarray], bool]:
         """
         오디오 청크 처리 (임의 크기 지원 - 내부에서 512로 분할)
-        
+
         Args:
             audio_chunk: 오디오 데이터 (numpy array, float32, any size)
             on_speech_end_callback: 긴 침묵 감지 시 호출될 콜백 함수 (optional)
-            
+
         Returns:
             (발화 완료 여부, 발화 오디오 데이터, 짧은 침묵 감지 여부)
         """
         if len(audio_chunk) == 0:
             return False, None, False
-        
-        # 🆕 Silero VAD는 16kHz에서 512 샘플만 처리 가능
-        # 큰 청크는 512 샘플씩 분할하여 순차 처리
-        VAD_CHUNK_SIZE = 512
-        
-        # 청크가 512보다 작으면 그대로 처리
-        if len(audio_chunk) <= VAD_CHUNK_SIZE:
-            return self._process_single_chunk(audio_chunk, on_speech_end_callback)
-        
-        # 청크가 512보다 크면 분할 처리
+
+        # 🆕 청크의 모든 프레임을 한 번에 점수화한 뒤, 확률 벡터 위에서 상태 머신 실행
+        speech_probs, frame_len = self._score_chunk(audio_chunk)
+        events = self._process_frames(
+            audio_chunk, speech_probs, frame_len, on_speech_end_callback
+        )
+
+        # 결과 누적 (마지막 유효한 결과 사용)
         final_is_speech_end = False
         final_speech_audio = None
         final_is_short_pause = False
-        
-        num_segments = len(audio_chunk) // VAD_CHUNK_SIZE
-        
-        for i in range(num_segments):
-            start_idx = i * VAD_CHUNK_SIZE
-            end_idx = start_idx + VAD_CHUNK_SIZE
-            segment = audio_chunk[start_idx:end_idx]
-            
-            is_speech_end, speech_audio, is_short_pause = self._process_single_chunk(
-                segment, on_speech_end_callback
-            )
-            
-            # 결과 누적 (마지막 유효한 결과 사용)
+
+        for is_speech_end, speech_audio, is_short_pause in events:
             if is_speech_end:
                 final_is_speech_end = True
                 final_speech_audio = speech_audio
@@ -132,169 +288,238 @@ class SileroVAD:
                 final_is_short_pause = True
                 if speech_audio is not None:
                     final_speech_audio = speech_audio
-        
+
         return final_is_speech_end, final_speech_audio, final_is_short_pause
-    
-    def _process_single_chunk(
+
+    def _process_frames(
         self,
         audio_chunk: np.ndarray,
+        speech_probs: np.ndarray,
+        frame_len: int,
         on_speech_end_callback=None
-    ) -> Tuple[bool, Optional[np.ndarray], bool]:
+    ) -> List[Tuple[bool, Optional[np.ndarray], bool]]:
         """
-        단일 512-sample 청크 처리 (내부 메서드)
-        
-        Args:
-            audio_chunk: 오디오 데이터 (numpy array, float32, 512 samples)
-            on_speech_end_callback: 긴 침묵 감지 시 호출될 콜백 함수 (optional)
-            
+        프레임별 음성 확률에 대해 발화/침묵 상태 머신 실행 (run-length 방식)
+
+        연속된 음성/무음 프레임 구간(run)을 한 번에 처리하고,
+        무음 구간에서는 짧은 침묵/긴 침묵/최대 길이 이벤트가 발생하는 프레임을 계산으로 바로 찾습니다.
+
         Returns:
-            (발화 완료 여부, 발화 오디오 데이터, 짧은 침묵 감지 여부)
+            발생한 이벤트 목록 [(발화 완료 여부, 발화 오디오 데이터, 짧은 침묵 감지 여부), ...]
         """
-        # Tensor로 변환
-        audio_tensor = torch.from_numpy(audio_chunk).float()
-        
-        # VAD 확률 계산
-        with torch.no_grad():
-            speech_prob = self.model(audio_tensor, self.sample_rate).item()
-        
-        is_short_pause = False  # 짧은 침묵 감지 플래그
-        current_is_speech = speech_prob >= self.threshold
-        
-        # 음성 감지
-        if current_is_speech:
+        events = []
+        is_speech = speech_probs >= self.threshold
+        num_frames = len(is_speech)
+
+        # 음성/무음 run 경계
+        boundaries = np.flatnonzero(is_speech[1:] != is_speech[:-1]) + 1
+        run_starts = np.concatenate(([0], boundaries))
+        run_ends = np.concatenate((boundaries, [num_frames]))
+
+        for run_start, run_end in zip(run_starts.tolist(), run_ends.tolist()):
+            if is_speech[run_start]:
+                self._consume_speech_run(
+                    audio_chunk[run_start * frame_len:run_end * frame_len],
+                    float(speech_probs[run_start]),
+                    events,
+                )
+            else:
+                self._consume_silence_run(
+                    audio_chunk, run_start, run_end, frame_len,
+                    on_speech_end_callback, events,
+                )
+
+        return events
+
+    def _consume_speech_run(self, segment: np.ndarray, first_prob: float, events: list):
+        """연속된 음성 프레임 구간 처리"""
+        while True:
             if not self.is_speaking:
-                # 발화 시작
-                print(f"[VAD] 🎤 발화 시작 감지! (prob={speech_prob:.3f})", flush=True)
+                # 발화 시작 - 프리롤(발화 직전 패딩)부터 버퍼에 채움
+                print(f"[VAD] 🎤 발화 시작 감지! (prob={first_prob:.3f})", flush=True)
                 self.is_speaking = True
                 self.speech_start_sample = self.current_sample
-                self.speech_buffer = []
+                self.speech_buffer.clear()
+                for preroll in self.preroll_buffer.segments():
+                    self.speech_buffer.append(preroll)
+                self.preroll_buffer.clear()
                 self.silence_start_sample = self.current_sample
                 self.short_pause_triggered = False
-                
-            # 버퍼에 추가
-            self.speech_buffer.append(audio_chunk)
-            
+
             # ⭐ 이전에 무음이었다가 지금 음성이면 침묵 종료
             if not self.last_was_speech:
-                # 침묵에서 음성으로 전환 - 침묵 시작점 리셋
                 self.silence_start_sample = self.current_sample
-                # 짧은 침묵 플래그도 리셋 (다음 침묵을 위해)
                 self.short_pause_triggered = False
-            
-        else:
-            # 무음 감지
-            if self.is_speaking:
-                # ⭐ 음성에서 무음으로 전환되는 순간 - 침묵 시작!
-                if self.last_was_speech:
-                    self.silence_start_sample = self.current_sample
-                
-                # 버퍼에 추가 (무음도 포함)
-                self.speech_buffer.append(audio_chunk)
-                
-                # 무음 지속 시간 확인
-                silence_duration = self.current_sample - self.silence_start_sample
-                
+
+            # 버퍼에 추가 (최대 발화 길이까지만)
+            room = max(0, self.max_speech_samples - (self.current_sample - self.speech_start_sample))
+            head = segment[:room]
+            self.speech_buffer.append(head)
+            self.last_was_speech = True
+            self.current_sample += len(head)
+            if len(head) == len(segment):
+                return
+
+            # 쉬지 않고 최대 발화 길이를 넘긴 경우 - 여기서 끊고 나머지는 새 발화로
+            print(f"[VAD 디버그] 최대 발화 길이 도달 -> 발화 분할", flush=True)
+            events.append((True, self._emit_speech(), False))
+            segment = segment[room:]
+
+    @staticmethod
+    def _frames_until(remaining_samples: int, frame_len: int) -> int:
+        """프레임 시작 시점 기준 누적 길이가 remaining_samples에 도달하는 첫 프레임 인덱스"""
+        if remaining_samples <= 0:
+            return 0
+        return -(-remaining_samples // frame_len)
+
+    def _consume_silence_run(
+        self,
+        audio_chunk: np.ndarray,
+        run_start: int,
+        run_end: int,
+        frame_len: int,
+        on_speech_end_callback,
+        events: list,
+    ):
+        """연속된 무음 프레임 구간 처리"""
+        i = run_start
+        while i < run_end:
+            remaining = run_end - i
+
+            if not self.is_speaking:
+                # 발화 중이 아니면 프리롤만 갱신하고 위치 진행
+                if self.speech_pad_samples > 0:
+                    self.preroll_buffer.append(audio_chunk[i * frame_len:run_end * frame_len])
+                self.current_sample += remaining * frame_len
+                self.last_was_speech = False
+                return
+
+            # ⭐ 음성에서 무음으로 전환되는 순간 - 침묵 시작!
+            if self.last_was_speech:
+                self.silence_start_sample = self.current_sample
+
+            # 이번 구간에서 이벤트가 발생하는 첫 프레임 (프레임 k의 침묵 길이 = base + k * frame_len)
+            silence_base = self.current_sample - self.silence_start_sample
+            speech_base = self.current_sample - self.speech_start_sample
+            k_short = (
+                remaining if self.short_pause_triggered
+                else self._frames_until(self.short_silence_samples - silence_base, frame_len)
+            )
+            k_long = self._frames_until(self.min_silence_samples - silence_base, frame_len)
+            k_max = self._frames_until(self.max_speech_samples - speech_base, frame_len)
+            k = min(k_short, k_long, k_max, remaining)
+
+            # 이벤트 직전 프레임까지 일괄 누적 (무음도 포함)
+            if k > 0:
+                self.speech_buffer.append(audio_chunk[i * frame_len:(i + k) * frame_len])
+                self.current_sample += k * frame_len
+                self.last_was_speech = False
+                i += k
+            if k == remaining:
+                return
+
+            # 이벤트 프레임
+            self.speech_buffer.append(audio_chunk[i * frame_len:(i + 1) * frame_len])
+            silence_duration = self.current_sample - self.silence_start_sample
+            i += 1
+
+            if not self.short_pause_triggered and k == k_short:
                 # ⭐ 짧은 침묵 감지 (문장 구분용) - 한 번만!
-                if not self.short_pause_triggered and silence_duration >= self.short_silence_samples:
-                    self.short_pause_triggered = True  # 플래그 설정
-                    silence_ms = silence_duration / self.sample_rate * 1000
-                    print(f"[VAD 디버그] 짧은 침묵 감지됨! ({silence_ms:.0f}ms)", flush=True)
-                    
-                    # ✅ CRITICAL: Short pause 시 즉시 speech_audio 반환!
-                    if len(self.speech_buffer) > 0:
-                        speech_audio = np.concatenate(self.speech_buffer)
-                        # ⚠️ 버퍼는 초기화하지 않음! (계속 누적)
-                        print(f"[VAD 디버그] Short pause - speech_audio 반환: {len(speech_audio)} samples", flush=True)
-                        # 이전 상태 업데이트
-                        self.last_was_speech = current_is_speech
-                        self.current_sample += len(audio_chunk)
-                        return False, speech_audio, True
-                
-                if silence_duration >= self.min_silence_samples:
-                    # 발화 종료
-                    speech_duration = self.current_sample - self.speech_start_sample
-                    silence_ms = silence_duration / self.sample_rate * 1000
-                    print(f"[VAD 디버그] 긴 침묵 감지 ({silence_ms:.0f}ms) -> 발화 종료!", flush=True)
-                    
-                    # 🆕 콜백 호출 (긴 침묵 감지 시)
-                    if on_speech_end_callback is not None:
-                        try:
-                            on_speech_end_callback()
-                        except Exception as e:
-                            print(f"[VAD] 콜백 오류: {e}", flush=True)
-                    
-                    if speech_duration >= self.min_speech_samples:
-                        # 유효한 발화
-                        speech_audio = np.concatenate(self.speech_buffer)
-                        self.reset()
-                        return True, speech_audio, False
-                    else:
-                        # 너무 짧은 발화 - 무시
-                        print(f"[VAD 디버그] 발화가 너무 짧아 무시됨", flush=True)
-                        self.reset()
-                        
-                elif (self.current_sample - self.speech_start_sample) >= self.max_speech_samples:
-                    # 최대 발화 길이 초과
-                    speech_audio = np.concatenate(self.speech_buffer)
+                self.short_pause_triggered = True
+                silence_ms = silence_duration / self.sample_rate * 1000
+                print(f"[VAD 디버그] 짧은 침묵 감지됨! ({silence_ms:.0f}ms)", flush=True)
+
+                # ✅ CRITICAL: Short pause 시 즉시 speech_audio 반환! (버퍼는 계속 누적)
+                speech_audio = self.speech_buffer.view()
+                print(f"[VAD 디버그] Short pause - speech_audio 반환: {len(speech_audio)} samples", flush=True)
+                self.last_was_speech = False
+                self.current_sample += frame_len
+                events.append((False, speech_audio, True))
+
+            elif k == k_long:
+                # 발화 종료
+                speech_duration = self.current_sample - self.speech_start_sample
+                silence_ms = silence_duration / self.sample_rate * 1000
+                print(f"[VAD 디버그] 긴 침묵 감지 ({silence_ms:.0f}ms) -> 발화 종료!", flush=True)
+
+                # 🆕 콜백 호출 (긴 침묵 감지 시)
+                if on_speech_end_callback is not None:
+                    try:
+                        on_speech_end_callback()
+                    except Exception as e:
+                        print(f"[VAD] 콜백 오류: {e}", flush=True)
+
+                if speech_duration >= self.min_speech_samples:
+                    # 유효한 발화
+                    events.append((True, self._emit_speech(), False))
+                else:
+                    # 너무 짧은 발화 - 무시
+                    print(f"[VAD 디버그] 발화가 너무 짧아 무시됨", flush=True)
                     self.reset()
-                    return True, speech_audio, False
-        
-        # 이전 상태 업데이트
-        self.last_was_speech = current_is_speech
-        self.current_sample += len(audio_chunk)
-        return False, None, False
-        
+                    self.current_sample += frame_len
+
+            else:
+                # 최대 발화 길이 초과
+                events.append((True, self._emit_speech(), False))
+
     def get_speech_probability(self, audio_chunk: np.ndarray) -> float:
         """
         오디오 청크의 음성 확률 계산
-        
+
         Args:
             audio_chunk: 오디오 데이터
-            
+
         Returns:
-            음성 확률 (0.0 ~ 1.0)
+            음성 확률 (0.0 ~ 1.0, 청크 내 프레임 중 최대값)
         """
         if len(audio_chunk) == 0:
             return 0.0
-            
-        audio_tensor = torch.from_numpy(audio_chunk).float()
-        
-        with torch.no_grad():
-            speech_prob = self.model(audio_tensor, self.sample_rate).item()
-            
-        return speech_prob
-    
+
+        speech_probs, _ = self._score_chunk(audio_chunk)
+        return float(speech_probs.max())
+
     def get_current_silence_duration_ms(self) -> float:
         """
         현재 침묵 지속 시간 반환 (ms)
-        
+
         Returns:
             침묵 지속 시간 (밀리초)
         """
         if not self.is_speaking:
             return 0.0
-        
+
         silence_duration_samples = self.current_sample - self.silence_start_sample
         return (silence_duration_samples / self.sample_rate) * 1000
-    
+
     def has_short_pause(self) -> bool:
         """
         짧은 침묵(문장 구분용)이 감지되었는지 확인
-        
+
         Returns:
             짧은 침묵 감지 여부
         """
         if not self.is_speaking:
             return False
-        
+
         silence_duration = self.current_sample - self.silence_start_sample
         return silence_duration >= self.short_silence_samples
-    
+
     def get_buffer_length(self) -> int:
         """
         현재 버퍼에 저장된 오디오 길이 반환
-        
+
+        Returns:
+            버퍼 샘플 수
+        """
+        return len(self.speech_buffer)
+
+    def get_current_buffer(self) -> Optional[np.ndarray]:
+        """
+        현재까지 누적된 발화 오디오 (강제 인식용)
+
         Returns:
-            버퍼 청크 개수
+            발화 버퍼의 뷰 (발화 중이 아니면 None)
         """
-        return len(self.speech_buffer)
\ No newline at end of file
+        if not self.is_speaking or len(self.speech_buffer) == 0:
+            return None
+        return self.speech_buffer.view()
@@ -0,0 +1,77 @@
+"""마음봄 · TTS 오디오 인코딩 (메모리 내 처리)
+
+- 모델이 만든 float32 PCM 버퍼를 임시 파일 없이 BytesIO에서 바로 인코딩
+- wav: 표준 라이브러리 wave (PCM16, 추가 의존성 없음)
+- mp3 / opus: soundfile(libsndfile) 사용, opus는 48kHz로 리샘플 후 Ogg 컨테이너에 저장
+"""
+
+from __future__ import annotations
+
+import io
+import wave
+
+import numpy as np
+
+SUPPORTED_FORMATS = ("wav", "mp3", "opus")
+
+# libsndfile Opus가 지원하는 샘플레이트
+_OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+
+def pcm_to_int16(samples: np.ndarray) -> np.ndarray:
+    """float32 [-1, 1] PCM → int16 (범위 밖 값은 잘라냄)"""
+    samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+    return (np.clip(samples, -1.0, 1.0) * 32767.0).astype("<i2")
+
+
+def encode_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    """float32 PCM → 모노 16-bit WAV bytes"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(int(sample_rate))
+        wav.writeframes(pcm_to_int16(samples).tobytes())
+    return buffer.getvalue()
+
+
+def _encode_with_soundfile(samples: np.ndarray, sample_rate: int, fmt: str) -> bytes:
+    try:
+        import soundfile
+    except ImportError as e:
+        raise RuntimeError(f"{fmt} 인코딩에는 soundfile 패키지가 필요합니다") from e
+
+    samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+    if fmt == "opus":
+        if sample_rate not in _OPUS_SAMPLE_RATES:
+            import soxr
+
+            samples = soxr.resample(samples, sample_rate, 48000)
+            sample_rate = 48000
+        container, subtype = "OGG", "OPUS"
+    else:
+        container, subtype = "MP3", "MPEG_LAYER_III"
+
+    buffer = io.BytesIO()
+    soundfile.write(buffer, samples, int(sample_rate), format=container, subtype=subtype)
+    return buffer.getvalue()
+
+
+def encode_pcm(samples: np.ndarray, sample_rate: int, fmt: str = "wav") -> bytes:
+    """
+    float32 PCM 버퍼를 지정한 포맷으로 인코딩
+
+    Args:
+        samples: 모노 float32 PCM ([-1, 1])
+        sample_rate: 샘플레이트
+        fmt: "wav" | "mp3" | "opus"
+
+    Returns:
+        인코딩된 오디오 bytes
+    """
+    fmt = (fmt or "wav").lower()
+    if fmt == "wav":
+        return encode_wav(samples, sample_rate)
+    if fmt in ("mp3", "opus"):
+        return _encode_with_soundfile(samples, sample_rate, fmt)
+    raise ValueError(f"지원하지 않는 오디오 포맷: {fmt} (지원: {', '.join(SUPPORTED_FORMATS)})")
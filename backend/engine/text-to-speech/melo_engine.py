@@ -1,7 +1,11 @@
 from pathlib import Path
+from uuid import uuid4
 
+from audio_encoding import encode_wav
 from base import BaseTTSEngine
-from tts_model import synthesize_to_wav as melo_synthesize
+from provider_registry import get_tts_provider
+
+OUTPUT_DIR = Path(__file__).parent / "outputs"
 
 
 class MeloTTSEngine(BaseTTSEngine):
@@ -13,9 +17,12 @@ class MeloTTSEngine(BaseTTSEngine):
         voice_id: str | None = None,
         emotion: str | None = None,
     ) -> Path:
-        return melo_synthesize(
-            text=text,
-            speed=None,
-            tone=emotion,
-            engine=self.name,
+        # 로컬 MeloTTS 풀에서 동기 합성 후 outputs/에 저장
+        # (TTS_MELO_FORMAT과 무관하게 항상 WAV로 저장)
+        audio, sample_rate = get_tts_provider(self.name).synthesize_pcm(
+            text, speaker=voice_id, emotion=emotion
         )
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        out_path = OUTPUT_DIR / f"{uuid4().hex}.wav"
+        out_path.write_bytes(encode_wav(audio, sample_rate))
+        return out_path
@@ -0,0 +1,175 @@
+"""마음봄 · 고정 시스템 발화 프레이즈 뱅크
+
+- 음성 미감지 / 소음 안내처럼 문구가 정해진 발화를 미리 합성해 한 파일(팩)에 저장
+- 요청 시 합성 호출 없이 팩에서 바로 반환
+- 팩 헤더에 음성 설정 서명(엔진, voice/model, 설정, 포맷, 문구)을 기록하고,
+  서명이 달라지면 팩을 다시 만든다
+
+팩 형식: MAGIC(8) + 인덱스 길이(uint32 LE) + 인덱스(JSON) + 오디오 데이터 연속 배치
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from tts_cache import normalize_text
+
+PACK_MAGIC = b"BOMPACK1"
+_HEADER = struct.Struct("<I")
+
+# 고정 시스템 발화 레지스트리 (phrase_id -> 문구)
+SYSTEM_PHRASES: Dict[str, str] = {
+    "no_speech": "음성이 감지되지 않았어요. 다시 말씀해주시겠어요?",
+    "low_quality": "소음이 심해서 잘 들리지 않았어요. 조용한 곳에서 다시 말씀해주시겠어요?",
+    "low_quality_retry": "잘 못 들었어요. 다시 한번 말씀해 주세요!",
+}
+
+
+def voice_signature(
+    engine: str,
+    voice_id: str,
+    model_id: str,
+    settings: Dict[str, Any],
+    audio_format: str,
+    phrases: Dict[str, str],
+) -> str:
+    """팩 내용을 결정하는 음성 설정 + 문구의 해시"""
+    payload = json.dumps(
+        {
+            "engine": engine,
+            "voice_id": voice_id,
+            "model_id": model_id,
+            "settings": settings,
+            "audio_format": audio_format,
+            "phrases": phrases,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PhraseBank:
+    """인덱스가 있는 단일 파일 오디오 팩"""
+
+    def __init__(
+        self,
+        signature: str,
+        engine: str,
+        audio_format: str,
+        audio: Dict[str, bytes],
+        texts: Dict[str, str],
+    ):
+        self.signature = signature
+        self.engine = engine
+        self.audio_format = audio_format
+        self._audio = audio
+        self._by_text = {normalize_text(text): phrase_id for phrase_id, text in texts.items()}
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def get(self, phrase_id: str) -> Optional[bytes]:
+        return self._audio.get(phrase_id)
+
+    def lookup(self, text: str, engine: str) -> Optional[Tuple[bytes, str]]:
+        """문구가 팩에 있고 같은 엔진이면 (오디오, 포맷) 반환"""
+        if engine != self.engine:
+            return None
+        phrase_id = self._by_text.get(normalize_text(text))
+        if phrase_id is None or phrase_id not in self._audio:
+            return None
+        return self._audio[phrase_id], self.audio_format
+
+    def __len__(self) -> int:
+        return len(self._audio)
+
+    # ------------------------------------------------------------------
+    # 팩 파일
+    # ------------------------------------------------------------------
+
+    def save(self, path: str | Path):
+        """팩 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        entries = {}
+        offset = 0
+        for phrase_id, audio in self._audio.items():
+            entries[phrase_id] = {"offset": offset, "length": len(audio)}
+            offset += len(audio)
+        index = json.dumps(
+            {
+                "signature": self.signature,
+                "engine": self.engine,
+                "audio_format": self.audio_format,
+                "texts": self._by_text,
+                "entries": entries,
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(PACK_MAGIC)
+            f.write(_HEADER.pack(len(index)))
+            f.write(index)
+            for audio in self._audio.values():
+                f.write(audio)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> Optional["PhraseBank"]:
+        """팩 파일 로드 (없거나 손상되었으면 None)"""
+        if not Path(path).exists():
+            return None
+        try:
+            data = Path(path).read_bytes()
+            if not data.startswith(PACK_MAGIC):
+                return None
+            start = len(PACK_MAGIC) + _HEADER.size
+            (index_len,) = _HEADER.unpack_from(data, len(PACK_MAGIC))
+            index = json.loads(data[start:start + index_len].decode("utf-8"))
+            body = memoryview(data)[start + index_len:]
+            audio = {
+                phrase_id: bytes(body[e["offset"]:e["offset"] + e["length"]])
+                for phrase_id, e in index["entries"].items()
+            }
+            texts = {phrase_id: text for text, phrase_id in index["texts"].items()}
+            return cls(index["signature"], index["engine"], index["audio_format"], audio, texts)
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            print(f"[PhraseBank] ⚠️ 팩 로드 실패 ({path}): {e}")
+            return None
+
+    @classmethod
+    async def build(
+        cls,
+        signature: str,
+        engine: str,
+        audio_format: str,
+        synthesize: Callable[[str], Awaitable[bytes]],
+        phrases: Dict[str, str] = SYSTEM_PHRASES,
+    ) -> "PhraseBank":
+        """레지스트리의 모든 문구를 합성해 새 팩 생성 (실패한 문구는 건너뜀)"""
+        audio: Dict[str, bytes] = {}
+        for phrase_id, text in phrases.items():
+            try:
+                audio[phrase_id] = await synthesize(text)
+            except Exception as e:
+                print(f"[PhraseBank] ⚠️ '{phrase_id}' 합성 실패: {e}")
+        return cls(signature, engine, audio_format, audio, phrases)
+
+
+if __name__ == "__main__":
+    # 빌드 단계에서 팩 미리 생성: python phrase_bank.py [--force]
+    import asyncio
+    import sys
+
+    import tts_model
+
+    asyncio.run(tts_model.prepare_phrase_bank(force="--force" in sys.argv))
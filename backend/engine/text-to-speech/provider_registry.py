@@ -1,19 +1,29 @@
 """Provider registry for text-to-speech engines."""
 from __future__ import annotations
 
+import importlib
 import os
-from typing import Dict, Type
+from typing import Dict, Iterable, Type
 
-from providers.melo_tts_provider import MeloTtsProvider
 from tts_base import TextToSpeechProvider
 
-PROVIDERS: Dict[str, Type[TextToSpeechProvider]] = {
-    "melo": MeloTtsProvider,
+# 이름 -> "모듈:클래스" (torch 등 무거운 의존성은 실제로 선택될 때만 import)
+PROVIDERS: Dict[str, str] = {
+    "melo": "providers.melo_tts_provider:MeloTtsProvider",
+    "elevenlabs": "providers.elevenlabs_tts_provider:ElevenLabsTtsProvider",
 }
 
 _provider_instances: Dict[str, TextToSpeechProvider] = {}
 
 
+def _load_provider_class(selected: str) -> Type[TextToSpeechProvider]:
+    target = PROVIDERS.get(selected)
+    if target is None:
+        raise ValueError(f"Unsupported TTS provider: {selected}")
+    module_name, class_name = target.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 def get_tts_provider(provider_name: str | None = None) -> TextToSpeechProvider:
     """Return a configured TTS provider instance.
 
@@ -21,14 +31,31 @@ def get_tts_provider(provider_name: str | None = None) -> TextToSpeechProvider:
     1. Explicit ``provider_name`` argument.
     2. ``TTS_PROVIDER`` environment variable.
     3. Fallback to "melo".
+
+    Instances are owned by the registry and live for the whole process, so
+    providers can keep models and connection pools between requests.
     """
 
     selected = (provider_name or os.getenv("TTS_PROVIDER", "melo")).lower()
-    provider_cls = PROVIDERS.get(selected)
-    if provider_cls is None:
-        raise ValueError(f"Unsupported TTS provider: {selected}")
-
     if selected not in _provider_instances:
-        _provider_instances[selected] = provider_cls()
+        _provider_instances[selected] = _load_provider_class(selected)()
     return _provider_instances[selected]
 
+
+async def warmup_tts_providers(provider_names: Iterable[str]) -> None:
+    """Create the given providers and let them open connections / load models."""
+    for name in provider_names:
+        try:
+            await get_tts_provider(name).warmup()
+        except Exception as e:
+            print(f"[TTS Registry] ⚠️ {name} 예열 실패: {e}")
+
+
+async def close_tts_providers() -> None:
+    """Release resources held by every created provider (app shutdown)."""
+    for name, provider in list(_provider_instances.items()):
+        try:
+            await provider.aclose()
+        except Exception as e:
+            print(f"[TTS Registry] ⚠️ {name} 종료 실패: {e}")
+    _provider_instances.clear()
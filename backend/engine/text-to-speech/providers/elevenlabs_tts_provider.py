@@ -0,0 +1,259 @@
+"""ElevenLabs provider implementation (pooled, long-lived HTTP client)."""
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+from dotenv import load_dotenv
+
+from tts_base import TextToSpeechProvider, TtsProviderTimeout
+
+load_dotenv()
+
+API_BASE_URL = "https://api.elevenlabs.io/v1"
+DEFAULT_VOICE_ID = "z8usQlwmsuMMxGSH3vnV"
+DEFAULT_MODEL_ID = "eleven_v3"
+DEFAULT_VOICE_SETTINGS: Dict[str, float] = {"stability": 0.5, "similarity_boost": 0.5}
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class ElevenLabsTtsProvider(TextToSpeechProvider):
+    """Text-to-speech provider backed by the ElevenLabs REST API.
+
+    하나의 AsyncClient(HTTP/2, keep-alive 풀)를 프로세스 수명 동안 재사용해
+    매 요청마다 DNS/TCP/TLS 연결을 새로 맺지 않는다.
+    """
+
+    audio_format = "mp3"
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        voice_id: str | None = None,
+        model_id: str | None = None,
+        voice_settings: Dict[str, Any] | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.api_key = api_key or os.getenv("ELEVENLABS_API_KEY")
+        self.voice_id = voice_id or DEFAULT_VOICE_ID
+        self.model_id = model_id or DEFAULT_MODEL_ID
+        self.voice_settings = dict(voice_settings or DEFAULT_VOICE_SETTINGS)
+
+        # 연결 풀 설정
+        self.max_connections = int(_env_float("ELEVENLABS_MAX_CONNECTIONS", 10))
+        self.max_keepalive_connections = int(_env_float("ELEVENLABS_MAX_KEEPALIVE", 5))
+        self.keepalive_expiry = _env_float("ELEVENLABS_KEEPALIVE_EXPIRY", 60.0)
+        self.connect_timeout = _env_float("ELEVENLABS_CONNECT_TIMEOUT", 5.0)
+
+        # 요청 마감 시간 = base + per_char * 글자 수 (최대 max)
+        self.deadline_base = _env_float("ELEVENLABS_DEADLINE_BASE", 8.0)
+        self.deadline_per_char = _env_float("ELEVENLABS_DEADLINE_PER_CHAR", 0.08)
+        self.deadline_max = _env_float("ELEVENLABS_DEADLINE_MAX", 45.0)
+
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sync_client: Optional[httpx.Client] = None
+
+    # ------------------------------------------------------------------
+    # Client lifecycle
+    # ------------------------------------------------------------------
+
+    def _client_options(self) -> Dict[str, Any]:
+        try:
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:
+            print("[Eleven Labs TTS] ⚠️ h2 패키지가 없어 HTTP/1.1로 연결합니다 (pip install 'httpx[http2]')")
+            http2 = False
+
+        return {
+            "base_url": API_BASE_URL,
+            "http2": http2,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "timeout": httpx.Timeout(self.deadline_max, connect=self.connect_timeout),
+            "headers": {"xi-api-key": self.api_key or ""},
+        }
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(transport=self._transport, **self._client_options())
+        return self._client
+
+    async def warmup(self) -> None:
+        """시작 시 연결을 미리 맺어 첫 응답의 TLS 지연 제거"""
+        if not self.api_key:
+            print("[Eleven Labs TTS] ⚠️ ELEVENLABS_API_KEY 없음 - 연결 예열 생략")
+            return
+        try:
+            response = await self._get_client().get("/models", timeout=self.connect_timeout * 2)
+            print(
+                f"[Eleven Labs TTS] ✅ 연결 예열 완료 "
+                f"({response.http_version}, HTTP {response.status_code})"
+            )
+        except httpx.HTTPError as e:
+            print(f"[Eleven Labs TTS] ⚠️ 연결 예열 실패: {e}")
+
+    async def aclose(self) -> None:
+        """연결 풀 정리 (앱 종료 시)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+    # ------------------------------------------------------------------
+    # Synthesis
+    # ------------------------------------------------------------------
+
+    def cache_params(
+        self,
+        speaker: str | None = None,
+        emotion: str | None = None,
+        speed: float | None = None,
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        # emotion/speed는 API에 전달되지 않으므로 키에서 제외
+        return speaker or self.voice_id, self.model_id, self.voice_settings
+
+    def request_deadline(self, text: str) -> float:
+        """텍스트 길이에 비례한 요청 마감 시간 (초)"""
+        return min(self.deadline_max, self.deadline_base + self.deadline_per_char * len(text))
+
+    def _payload(self, text: str) -> Dict[str, Any]:
+        return {
+            "text": text,
+            "model_id": self.model_id,
+            "voice_settings": self.voice_settings,
+        }
+
+    def _check_request(self, text: str) -> None:
+        if not self.api_key:
+            raise ValueError(
+                "ELEVENLABS_API_KEY is not set. Please add it to your .env file."
+            )
+        if not text or not str(text).strip():
+            raise ValueError("text is empty")
+
+    async def asynthesize(
+        self,
+        text: str,
+        speaker: str | None = None,
+        emotion: str | None = None,
+        speed: float | None = None,
+    ) -> bytes:
+        """MP3 bytes 반환 (speaker를 주면 voice ID로 사용)"""
+        self._check_request(text)
+        voice_id = speaker or self.voice_id
+        deadline = self.request_deadline(text)
+
+        try:
+            response = await asyncio.wait_for(
+                self._get_client().post(
+                    f"/text-to-speech/{voice_id}",
+                    json=self._payload(text),
+                    headers={"Accept": "audio/mpeg"},
+                    timeout=httpx.Timeout(deadline, connect=self.connect_timeout),
+                ),
+                timeout=deadline,
+            )
+            response.raise_for_status()
+        except (asyncio.TimeoutError, httpx.TimeoutException):
+            error_msg = f"Eleven Labs API 시간 초과 ({deadline:.1f}초, {len(text)}자)"
+            print(f"[Eleven Labs TTS ERROR] {error_msg}")
+            raise TtsProviderTimeout(error_msg)
+        except httpx.HTTPStatusError as e:
+            error_msg = (
+                f"Eleven Labs API 오류 (HTTP {e.response.status_code}): {e.response.text}"
+            )
+            print(f"[Eleven Labs TTS ERROR] {error_msg}")
+            raise Exception(error_msg)
+        except httpx.RequestError as e:
+            error_msg = f"Eleven Labs API 요청 실패: {str(e)}"
+            print(f"[Eleven Labs TTS ERROR] {error_msg}")
+            raise Exception(error_msg)
+
+        audio_bytes = response.content
+        print(f"[Eleven Labs TTS] 오디오 생성 완료 ({len(audio_bytes)} bytes, {response.http_version})")
+        return audio_bytes
+
+    async def astream(
+        self,
+        text: str,
+        speaker: str | None = None,
+        emotion: str | None = None,
+        speed: float | None = None,
+    ) -> AsyncIterator[bytes]:
+        """스트리밍 엔드포인트에서 MP3 조각을 도착하는 대로 반환"""
+        self._check_request(text)
+        voice_id = speaker or self.voice_id
+        deadline = self.request_deadline(text)
+        total = 0
+
+        try:
+            async with self._get_client().stream(
+                "POST",
+                f"/text-to-speech/{voice_id}/stream",
+                json=self._payload(text),
+                headers={"Accept": "audio/mpeg"},
+                timeout=httpx.Timeout(deadline, connect=self.connect_timeout),
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    total += len(chunk)
+                    yield chunk
+        except httpx.TimeoutException:
+            error_msg = f"Eleven Labs 스트리밍 시간 초과 ({deadline:.1f}초, {len(text)}자)"
+            print(f"[Eleven Labs TTS ERROR] {error_msg}")
+            raise TtsProviderTimeout(error_msg)
+        except httpx.HTTPStatusError as e:
+            error_msg = (
+                f"Eleven Labs API 오류 (HTTP {e.response.status_code}): {e.response.text}"
+            )
+            print(f"[Eleven Labs TTS ERROR] {error_msg}")
+            raise Exception(error_msg)
+        except httpx.RequestError as e:
+            error_msg = f"Eleven Labs API 요청 실패: {str(e)}"
+            print(f"[Eleven Labs TTS ERROR] {error_msg}")
+            raise Exception(error_msg)
+
+        print(f"[Eleven Labs TTS] 스트리밍 완료 ({total} bytes)")
+
+    def synthesize(
+        self,
+        text: str,
+        speaker: str | None = None,
+        emotion: str | None = None,
+        speed: float | None = None,
+    ) -> bytes:
+        """동기 호출용 (별도의 keep-alive 풀 사용)"""
+        self._check_request(text)
+        if self._sync_client is None:
+            self._sync_client = httpx.Client(**self._client_options())
+
+        deadline = self.request_deadline(text)
+        try:
+            response = self._sync_client.post(
+                f"/text-to-speech/{speaker or self.voice_id}",
+                json=self._payload(text),
+                headers={"Accept": "audio/mpeg"},
+                timeout=httpx.Timeout(deadline, connect=self.connect_timeout),
+            )
+            response.raise_for_status()
+        except httpx.TimeoutException:
+            raise TtsProviderTimeout(f"Eleven Labs API 시간 초과 ({deadline:.1f}초, {len(text)}자)")
+        return response.content
@@ -1,20 +1,31 @@
-"""MeloTTS provider implementation."""
+"""MeloTTS provider implementation (offline, warm model pool)."""
 from __future__ import annotations
 
+import asyncio
 import os
-import tempfile
-from pathlib import Path
-from typing import Dict, Optional
-from uuid import uuid4
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 import torch
 from melo.api import TTS
 
+from audio_encoding import SUPPORTED_FORMATS, encode_pcm
 from tts_base import TextToSpeechProvider
 
 
 class MeloTtsProvider(TextToSpeechProvider):
-    """Text-to-speech provider backed by MeloTTS."""
+    """Text-to-speech provider backed by MeloTTS.
+
+    N개의 TTS 인스턴스를 미리 로드해 풀로 관리하고, 추론은 워커 스레드에서 실행한다.
+    동시에 진행되는 합성 수는 풀 크기로 제한된다 (인스턴스 1개 = 동시 요청 1개).
+    합성 결과는 파일을 거치지 않고 메모리에서 바로 인코딩한다 (TTS_MELO_FORMAT).
+    """
+
+    audio_format = "wav"
 
     BASE_PRESET: Dict[str, float] = {
         "sdp_ratio": 0.2,
@@ -56,49 +67,159 @@ class MeloTtsProvider(TextToSpeechProvider):
         },
     }
 
-    def __init__(self, language: str | None = None, device: str | None = None):
+    def __init__(
+        self,
+        language: str | None = None,
+        device: str | None = None,
+        pool_size: int | None = None,
+        audio_format: str | None = None,
+    ):
         self.language = (language or os.getenv("TTS_LANGUAGE", "KR")).upper()
+        self.audio_format = (audio_format or os.getenv("TTS_MELO_FORMAT", "wav")).lower()
+        if self.audio_format not in SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported MeloTTS audio format: {self.audio_format}")
         self.device = device or ("cuda:0" if torch.cuda.is_available() else "cpu")
+        self.pool_size = max(1, int(pool_size or os.getenv("TTS_MELO_POOL_SIZE", "1")))
         self._tts: Optional[TTS] = None
         self._speaker_id: Optional[int] = None
 
-    def synthesize(
+        # 모델 풀 (대여/반납) + 추론 워커 스레드
+        self._pool: "queue.Queue[TTS]" = queue.Queue()
+        self._loaded: List[TTS] = []
+        self._reserved = 0  # 로드 중이거나 로드된 인스턴스 수 (pool_size 초과 방지)
+        self._pool_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def synthesize_pcm(
         self,
         text: str,
         speaker: str | None = None,
         emotion: str | None = None,
         speed: float | None = None,
-    ) -> bytes:
+    ) -> Tuple[np.ndarray, int]:
+        """float32 PCM 버퍼와 샘플레이트 반환 (디스크를 거치지 않음)"""
         if not text or not str(text).strip():
             raise ValueError("text is empty")
 
-        tts = self._get_tts()
         preset = self._resolve_preset(emotion=emotion, speed=speed)
-        speaker_id = self._resolve_speaker(tts, speaker)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            out_path = Path(temp_dir) / f"{uuid4().hex}.wav"
-            tts.tts_to_file(
+        with self._checkout() as tts:
+            speaker_id = self._resolve_speaker(tts, speaker)
+            audio = tts.tts_to_file(
                 text.strip(),
                 speaker_id,
-                str(out_path),
+                output_path=None,
                 sdp_ratio=preset["sdp_ratio"],
                 noise_scale=preset["noise_scale"],
                 noise_scale_w=preset["noise_scale_w"],
                 speed=preset["speed"],
+                quiet=True,
+            )
+            sample_rate = int(tts.hps.data.sampling_rate)
+        return np.asarray(audio, dtype=np.float32), sample_rate
+
+    def synthesize(
+        self,
+        text: str,
+        speaker: str | None = None,
+        emotion: str | None = None,
+        speed: float | None = None,
+    ) -> bytes:
+        """audio_format으로 인코딩된 bytes 반환 (BytesIO에서 인코딩)"""
+        audio, sample_rate = self.synthesize_pcm(text, speaker=speaker, emotion=emotion, speed=speed)
+        return encode_pcm(audio, sample_rate, self.audio_format)
+
+    async def asynthesize(
+        self,
+        text: str,
+        speaker: str | None = None,
+        emotion: str | None = None,
+        speed: float | None = None,
+    ) -> bytes:
+        """전용 워커 스레드에서 합성 (풀이 모두 사용 중이면 반납될 때까지 대기)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            lambda: self.synthesize(text, speaker=speaker, emotion=emotion, speed=speed),
+        )
+
+    async def warmup(self) -> None:
+        """풀 크기만큼 모델을 미리 로드"""
+        await asyncio.get_running_loop().run_in_executor(self._get_executor(), self.preload)
+
+    async def aclose(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def cache_params(
+        self,
+        speaker: str | None = None,
+        emotion: str | None = None,
+        speed: float | None = None,
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        return (
+            f"melo:{self.language}:{speaker or 'default'}",
+            f"melo:{self.audio_format}",
+            self._resolve_preset(emotion=emotion, speed=speed),
+        )
+
+    # ------------------------------------------------------------------
+    # Model pool
+    # ------------------------------------------------------------------
+
+    def preload(self) -> int:
+        """풀을 pool_size까지 채움 (이미 로드된 인스턴스는 재사용)"""
+        while self._reserve_slot():
+            self._load_instance()
+        return len(self._loaded)
+
+    def _reserve_slot(self) -> bool:
+        with self._pool_lock:
+            if self._reserved >= self.pool_size:
+                return False
+            self._reserved += 1
+            return True
+
+    def _load_instance(self) -> TTS:
+        """모델 1개 로드 후 풀에 추가 (_reserve_slot 성공 후 호출)"""
+        try:
+            tts = TTS(language=self.language, device=self.device)
+        except Exception:
+            with self._pool_lock:
+                self._reserved -= 1
+            raise
+        with self._pool_lock:
+            if self._tts is None:
+                self._tts = tts
+                speakers = getattr(tts.hps.data, "spk2id", {})
+                self._speaker_id = speakers.get(self.language)
+                if self._speaker_id is None and speakers:
+                    self._speaker_id = next(iter(speakers.values()))
+            self._loaded.append(tts)
+        self._pool.put(tts)
+        print(f"[MeloTTS] ✅ 모델 로드 완료 ({len(self._loaded)}/{self.pool_size}, {self.device})")
+        return tts
+
+    @contextmanager
+    def _checkout(self) -> Iterator[TTS]:
+        """풀에서 인스턴스 대여 (풀이 덜 찼으면 새로 로드, 다 찼으면 반납 대기)"""
+        try:
+            tts = self._pool.get_nowait()
+        except queue.Empty:
+            if self._reserve_slot():
+                self._load_instance()
+            tts = self._pool.get()
+        try:
+            yield tts
+        finally:
+            self._pool.put(tts)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.pool_size, thread_name_prefix="melo-tts"
             )
-            return out_path.read_bytes()
-
-    def _get_tts(self) -> TTS:
-        if self._tts is not None:
-            return self._tts
-
-        self._tts = TTS(language=self.language, device=self.device)
-        speakers = getattr(self._tts.hps.data, "spk2id", {})
-        self._speaker_id = speakers.get(self.language)
-        if self._speaker_id is None and speakers:
-            self._speaker_id = next(iter(speakers.values()))
-        return self._tts
+        return self._executor
 
     def _resolve_speaker(self, tts: TTS, speaker: str | None) -> int:
         if speaker is not None:
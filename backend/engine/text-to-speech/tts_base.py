@@ -5,11 +5,20 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+from typing import Any, AsyncIterator, Dict, Tuple
+
+
+class TtsProviderTimeout(TimeoutError):
+    """Raised when a provider misses its per-request deadline."""
 
 
 class TextToSpeechProvider(abc.ABC):
     """Abstract base class for TTS providers."""
 
+    #: Encoding of the bytes returned by :meth:`synthesize` ("wav", "mp3", ...).
+    audio_format: str = "wav"
+
     @abc.abstractmethod
     def synthesize(
         self,
@@ -30,3 +39,53 @@ class TextToSpeechProvider(abc.ABC):
             Raw audio bytes (e.g., WAV/MP3) produced by the provider.
         """
 
+    async def asynthesize(
+        self,
+        text: str,
+        speaker: str | None = None,
+        emotion: str | None = None,
+        speed: float | None = None,
+    ) -> bytes:
+        """Async variant of :meth:`synthesize`.
+
+        기본 구현은 이벤트 루프를 막지 않도록 워커 스레드에서 ``synthesize`` 를 실행한다.
+        """
+        return await asyncio.to_thread(
+            self.synthesize, text, speaker=speaker, emotion=emotion, speed=speed
+        )
+
+    async def astream(
+        self,
+        text: str,
+        speaker: str | None = None,
+        emotion: str | None = None,
+        speed: float | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Yield encoded audio chunks as they become available.
+
+        스트리밍을 지원하지 않는 프로바이더는 전체 결과를 한 조각으로 반환한다.
+        """
+        yield await self.asynthesize(text, speaker=speaker, emotion=emotion, speed=speed)
+
+    def cache_params(
+        self,
+        speaker: str | None = None,
+        emotion: str | None = None,
+        speed: float | None = None,
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """Return (voice_id, model_id, settings) that determine the output audio.
+
+        Used to build the TTS audio cache key; override when the provider ignores
+        some of the arguments or has extra settings.
+        """
+        return (
+            f"{type(self).__name__}:{speaker or ''}",
+            type(self).__name__,
+            {"emotion": emotion, "speed": speed},
+        )
+
+    async def warmup(self) -> None:
+        """Prepare long-lived resources (models, connections) at startup."""
+
+    async def aclose(self) -> None:
+        """Release long-lived resources at shutdown."""
@@ -0,0 +1,289 @@
+"""마음봄 · TTS 오디오 캐시
+
+- 키: hash(정규화 텍스트, voice ID, model ID, voice_settings) → 내용 주소 기반
+- 1단계: 메모리 LRU (인코딩된 오디오 bytes, 용량 제한)
+- 2단계: 디스크 (용량 제한, 오래 안 쓴 파일부터 삭제)
+- 같은 키의 동시 미스는 요청 1번으로 합침 (single-flight)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (NFC + 공백 정리)"""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def make_cache_key(
+    text: str,
+    voice_id: str,
+    model_id: str,
+    voice_settings: Optional[Dict[str, Any]] = None,
+) -> str:
+    """합성 결과를 결정하는 모든 입력으로 만든 SHA-256 키"""
+    payload = json.dumps(
+        {
+            "text": normalize_text(text),
+            "voice_id": voice_id,
+            "model_id": model_id,
+            "voice_settings": voice_settings or {},
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TtsAudioCache:
+    """메모리 LRU + 디스크 2단계 TTS 오디오 캐시"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str | Path] = None,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+        file_suffix: str = ".mp3",
+    ):
+        """
+        Args:
+            cache_dir: 디스크 캐시 디렉터리 (None이면 메모리만 사용)
+            max_memory_bytes: 메모리 단계 최대 크기
+            max_disk_bytes: 디스크 단계 최대 크기
+            file_suffix: 디스크 파일 확장자
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.file_suffix = file_suffix
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._disk: "OrderedDict[str, int]" = OrderedDict()  # key -> 파일 크기 (오래된 순)
+        self._disk_bytes = 0
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._load_disk_index()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.bytes_saved = 0
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+
+    async def get_or_create(self, key: str, producer: Callable[[], Awaitable[bytes]]) -> bytes:
+        """
+        캐시에서 오디오를 찾고, 없으면 producer로 생성 후 저장
+
+        같은 키로 동시에 들어온 미스는 첫 요청(리더)의 결과를 함께 기다림.
+        리더가 취소되면(시간 초과, 연결 종료) 기다리던 요청 중 하나가 리더를 이어받음
+        """
+        while True:
+            audio = self._get_memory(key)
+            if audio is not None:
+                self._record_hit(audio, disk=False)
+                return audio
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                return await self._produce(key, producer)
+
+            audio = await asyncio.shield(inflight)
+            if audio is None:
+                # 리더가 취소됨: 다시 조회해 리더를 이어받거나 새 리더를 기다림
+                continue
+            with self._lock:
+                self.coalesced += 1
+                self.bytes_saved += len(audio)
+            return audio
+
+    async def _produce(self, key: str, producer: Callable[[], Awaitable[bytes]]) -> bytes:
+        """리더: 디스크 조회 → 생성 → 저장 후 기다리는 요청에 결과 전달"""
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            audio = await asyncio.to_thread(self._read_disk, key)
+            if audio is not None:
+                self._record_hit(audio, disk=True)
+                self._put_memory(key, audio)
+            else:
+                with self._lock:
+                    self.misses += 1
+                audio = await producer()
+                self._put_memory(key, audio)
+                await asyncio.to_thread(self._write_disk, key, audio)
+            future.set_result(audio)
+            return audio
+        except asyncio.CancelledError:
+            # 리더의 취소를 기다리는 요청에 전파하지 않음 (None: 다시 시도하라는 신호)
+            future.set_result(None)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 요청이 없으면 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """메모리 → 디스크 순으로 조회 (없으면 미스로 기록하고 None)"""
+        audio = self._get_memory(key)
+        if audio is not None:
+            self._record_hit(audio, disk=False)
+            return audio
+        audio = await asyncio.to_thread(self._read_disk, key)
+        if audio is not None:
+            self._record_hit(audio, disk=True)
+            self._put_memory(key, audio)
+            return audio
+        with self._lock:
+            self.misses += 1
+        return None
+
+    async def put(self, key: str, audio: bytes):
+        """생성된 오디오를 두 단계 모두에 저장 (스트리밍 합성 완료 후 등)"""
+        self._put_memory(key, audio)
+        await asyncio.to_thread(self._write_disk, key, audio)
+
+    def _record_hit(self, audio: bytes, disk: bool):
+        with self._lock:
+            if disk:
+                self.disk_hits += 1
+            else:
+                self.memory_hits += 1
+            self.bytes_saved += len(audio)
+
+    def _get_memory(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+            return audio
+
+    def _put_memory(self, key: str, audio: bytes):
+        if len(audio) > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._memory[key] = audio
+            self._memory_bytes += len(audio)
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    # ------------------------------------------------------------------
+    # 디스크 단계
+    # ------------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.file_suffix}"
+
+    def _load_disk_index(self):
+        """기존 캐시 파일을 마지막 사용 시각 순으로 색인"""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith(self.file_suffix):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[: -len(self.file_suffix)], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+        self._evict_disk()
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if self.cache_dir is None:
+            return None
+        with self._lock:
+            if key not in self._disk:
+                return None
+            self._disk.move_to_end(key)
+        path = self._path(key)
+        try:
+            audio = path.read_bytes()
+            os.utime(path)  # 재시작 후에도 LRU 순서 유지
+            return audio
+        except OSError:
+            with self._lock:
+                size = self._disk.pop(key, None)
+                if size is not None:
+                    self._disk_bytes -= size
+            return None
+
+    def _write_disk(self, key: str, audio: bytes):
+        if self.cache_dir is None or len(audio) > self.max_disk_bytes:
+            return
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(audio)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[TTS Cache] ⚠️ 디스크 캐시 저장 실패: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        with self._lock:
+            previous = self._disk.pop(key, None)
+            if previous is not None:
+                self._disk_bytes -= previous
+            self._disk[key] = len(audio)
+            self._disk_bytes += len(audio)
+        self._evict_disk()
+
+    def _evict_disk(self):
+        while True:
+            with self._lock:
+                if self._disk_bytes <= self.max_disk_bytes or not self._disk:
+                    return
+                key, size = self._disk.popitem(last=False)
+                self._disk_bytes -= size
+            self._path(key).unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """적중률, 절약한 바이트 등 캐시 통계"""
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits + self.coalesced
+            total = hits + self.misses
+            return {
+                "hits": hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "coalesced": self.coalesced,
+                "misses": self.misses,
+                "hit_ratio": hits / total if total else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_bytes,
+            }
@@ -1,18 +1,29 @@
 # tts_model.py
-"""마음봄 · TTS 모듈 (Eleven Labs v3 API)
+"""마음봄 · TTS 모듈 (Eleven Labs v3 API / 로컬 MeloTTS)
 
-- Eleven Labs v3 API를 사용한 한국어 TTS
+- Eleven Labs v3 API를 사용한 한국어 TTS (기본)
 - Voice ID: z8usQlwmsuMMxGSH3vnV
 - Model: eleven_v3
+- 로컬 MeloTTS 엔진 선택 및 클라우드 시간 초과 시 자동 대체 지원
 """
 
 import os
+import asyncio
+import base64
 from pathlib import Path
 from uuid import uuid4
-from typing import Optional
-import httpx
+from typing import AsyncIterator, List, Optional, Tuple
 from dotenv import load_dotenv
 
+from phrase_bank import SYSTEM_PHRASES, PhraseBank, voice_signature
+from tts_cache import TtsAudioCache, make_cache_key, normalize_text
+from provider_registry import get_tts_provider
+from providers.elevenlabs_tts_provider import (
+    DEFAULT_MODEL_ID,
+    DEFAULT_VOICE_ID,
+    DEFAULT_VOICE_SETTINGS,
+)
+
 # .env 파일 로드
 load_dotenv()
 
@@ -22,9 +33,31 @@ load_dotenv()
 
 # Eleven Labs API 설정
 ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
-VOICE_ID = "z8usQlwmsuMMxGSH3vnV"
-MODEL_ID = "eleven_v3"
-API_BASE_URL = "https://api.elevenlabs.io/v1"
+VOICE_ID = DEFAULT_VOICE_ID
+MODEL_ID = DEFAULT_MODEL_ID
+VOICE_SETTINGS = DEFAULT_VOICE_SETTINGS
+
+# 오디오 캐시 설정 (TTS_CACHE_ENABLED=false로 끌 수 있음)
+TTS_CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "true").lower() != "false"
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", str(Path(__file__).parent / "cache"))
+TTS_CACHE_MEMORY_MB = int(os.getenv("TTS_CACHE_MEMORY_MB", "64"))
+TTS_CACHE_DISK_MB = int(os.getenv("TTS_CACHE_DISK_MB", "512"))
+
+# 엔진 선택: 요청의 engine 인자 > TTS_ENGINE ("elevenlabs" | "melo")
+TTS_ENGINE = os.getenv("TTS_ENGINE", "elevenlabs").lower()
+# 클라우드 엔진 시간 초과 시 대체할 로컬 엔진 (예: "melo", 비우면 사용 안 함)
+TTS_FALLBACK_ENGINE = os.getenv("TTS_FALLBACK_ENGINE", "").lower()
+# 호출자 예산(budget)이 있을 때 fallback 합성용으로 남겨둘 시간 (초, 예산의 2/3 이하)
+TTS_FALLBACK_RESERVE_SEC = float(os.getenv("TTS_FALLBACK_RESERVE_SEC", "10"))
+
+# 고정 시스템 발화 팩 (TTS_PHRASE_BANK_ENABLED=false로 끌 수 있음)
+TTS_PHRASE_BANK_ENABLED = os.getenv("TTS_PHRASE_BANK_ENABLED", "true").lower() != "false"
+TTS_PHRASE_PACK = os.getenv(
+    "TTS_PHRASE_PACK", str(Path(__file__).parent / "cache" / "phrase_bank.pack")
+)
+
+# 캐시 적중 오디오를 스트리밍할 때의 조각 크기
+STREAM_CHUNK_BYTES = 16 * 1024
 
 # API Key 검증을 함수 내부로 이동하여 서버 실행 시 오류 방지
 if not ELEVENLABS_API_KEY:
@@ -33,9 +66,291 @@ if not ELEVENLABS_API_KEY:
     )
 
 
+# ----------------------------------------------------------------------
+# 오디오 캐시 (같은 문장은 API 재호출 없이 재사용)
+# ----------------------------------------------------------------------
+_audio_cache: Optional[TtsAudioCache] = None
+
+
+def get_audio_cache() -> Optional[TtsAudioCache]:
+    """TTS 오디오 캐시 싱글톤 (비활성화 시 None)"""
+    global _audio_cache
+    if _audio_cache is None and TTS_CACHE_ENABLED:
+        _audio_cache = TtsAudioCache(
+            cache_dir=TTS_CACHE_DIR or None,
+            max_memory_bytes=TTS_CACHE_MEMORY_MB * 1024 * 1024,
+            max_disk_bytes=TTS_CACHE_DISK_MB * 1024 * 1024,
+            file_suffix=".audio",  # 엔진별 포맷(mp3/wav)이 섞이므로 중립 확장자
+        )
+    return _audio_cache
+
+
+def get_cache_stats() -> dict:
+    """캐시 적중률 / 절약한 바이트"""
+    cache = get_audio_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+# ----------------------------------------------------------------------
+# 프레이즈 뱅크 (고정 시스템 발화는 합성 없이 반환)
+# ----------------------------------------------------------------------
+_phrase_bank: Optional[PhraseBank] = None
+
+
+def get_phrase_bank() -> Optional[PhraseBank]:
+    """준비된 프레이즈 뱅크 (prepare_phrase_bank 전이거나 비활성화 시 None)"""
+    return _phrase_bank
+
+
+def _phrase_bank_signature(engine: str) -> str:
+    provider = get_tts_provider(engine)
+    voice_id, model_id, settings = provider.cache_params(emotion="neutral")
+    return voice_signature(
+        engine, voice_id, model_id, settings, provider.audio_format, SYSTEM_PHRASES
+    )
+
+
+async def prepare_phrase_bank(engine: Optional[str] = None, force: bool = False) -> Optional[PhraseBank]:
+    """
+    기본 엔진용 프레이즈 팩 로드 (음성 설정이 바뀌었거나 팩이 없으면 다시 생성)
+
+    앱 시작 시 또는 빌드 단계에서 호출
+    """
+    global _phrase_bank
+    if not TTS_PHRASE_BANK_ENABLED:
+        return None
+
+    engine = resolve_engine(engine)
+    signature = _phrase_bank_signature(engine)
+    bank = None if force else await asyncio.to_thread(PhraseBank.load, TTS_PHRASE_PACK)
+
+    if bank is None or bank.signature != signature or len(bank) < len(SYSTEM_PHRASES):
+        print(f"[PhraseBank] 🔄 {engine} 음성으로 고정 발화 {len(SYSTEM_PHRASES)}개 합성 중...")
+        provider = get_tts_provider(engine)
+        bank = await PhraseBank.build(
+            signature,
+            engine,
+            provider.audio_format,
+            lambda text: provider.asynthesize(normalize_text(text), emotion="neutral"),
+        )
+        if len(bank):
+            await asyncio.to_thread(bank.save, TTS_PHRASE_PACK)
+
+    _phrase_bank = bank
+    print(f"[PhraseBank] ✅ 고정 발화 {len(bank)}개 준비 완료 ({engine}, {bank.audio_format})")
+    return bank
+
+
+def get_phrase_audio(phrase_id: str) -> Optional[Tuple[bytes, str]]:
+    """phrase_id로 미리 합성된 (오디오, 포맷) 조회"""
+    bank = _phrase_bank
+    if bank is None:
+        return None
+    audio = bank.get(phrase_id)
+    return (audio, bank.audio_format) if audio is not None else None
+
+
+def _lookup_phrase(
+    text: str, engine: str, tone: Optional[str], speed: Optional[float]
+) -> Optional[Tuple[bytes, str]]:
+    # 팩은 기본 톤/속도로 만들어지므로 같은 조건의 요청만 대체
+    bank = _phrase_bank
+    if bank is None or speed is not None or (tone or "neutral") != "neutral":
+        return None
+    return bank.lookup(text, engine)
+
+
+# ----------------------------------------------------------------------
+# 엔진 선택 / 로컬 fallback
+# ----------------------------------------------------------------------
+def resolve_engine(engine: Optional[str] = None) -> str:
+    """요청의 engine 인자 > TTS_ENGINE 환경변수 순으로 엔진 이름 결정"""
+    return (engine or TTS_ENGINE).lower()
+
+
+def active_engines() -> List[str]:
+    """시작 시 예열할 엔진 목록 (기본 엔진 + fallback 엔진)"""
+    engines = [TTS_ENGINE]
+    if TTS_FALLBACK_ENGINE and TTS_FALLBACK_ENGINE not in engines:
+        engines.append(TTS_FALLBACK_ENGINE)
+    return engines
+
+
+def _fallback_for(engine: str) -> Optional[str]:
+    if TTS_FALLBACK_ENGINE and TTS_FALLBACK_ENGINE != engine:
+        return TTS_FALLBACK_ENGINE
+    return None
+
+
 # ----------------------------------------------------------------------
 # 외부 API: 텍스트 → WAV
 # ----------------------------------------------------------------------
+async def synthesize_audio(
+    text: str,
+    engine: Optional[str] = None,
+    tone: Optional[str] = None,
+    speed: Optional[float] = None,
+    budget: Optional[float] = None,
+) -> Tuple[bytes, str]:
+    """텍스트를 오디오로 변환 (캐시 우선)
+
+    클라우드 엔진이 마감 시간을 넘기면 TTS_FALLBACK_ENGINE(예: melo)으로 다시 합성한다.
+    budget(초)을 주면 전체가 그 안에 끝나도록, 기본 엔진은 fallback 몫
+    (TTS_FALLBACK_RESERVE_SEC)을 뺀 시간까지만 기다리고 남은 시간을 fallback에 준다.
+    호출자는 asyncio.wait_for로 감싸지 말고 budget을 넘겨야 fallback이 동작한다.
+
+    Raises
+    ------
+    TimeoutError
+        fallback까지 예산(또는 마감 시간) 안에 끝나지 않은 경우
+
+    Returns
+    -------
+    (오디오 bytes, 포맷) - 포맷은 "mp3"(Eleven Labs) 또는 "wav"(MeloTTS)
+    """
+    if not text or not text.strip():
+        raise ValueError("text is empty")
+
+    selected = resolve_engine(engine)
+    phrase = _lookup_phrase(text, selected, tone, speed)
+    if phrase is not None:
+        return phrase
+    fallback = _fallback_for(selected)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    primary_timeout = budget
+    if budget is not None and fallback is not None:
+        primary_timeout = budget - min(TTS_FALLBACK_RESERVE_SEC, budget * 2 / 3)
+    try:
+        return await asyncio.wait_for(
+            _synthesize_with(selected, text, tone, speed), timeout=primary_timeout
+        )
+    except TimeoutError as e:
+        if fallback is None:
+            raise
+        print(f"[TTS] ⏱️ {selected} 시간 초과 → {fallback} 엔진으로 대체 ({e or '예산 초과'})")
+    remaining = None if budget is None else max(budget - (loop.time() - started), 0.0)
+    return await asyncio.wait_for(
+        _synthesize_with(fallback, text, tone, speed), timeout=remaining
+    )
+
+
+async def _synthesize_with(
+    engine: str, text: str, tone: Optional[str], speed: Optional[float]
+) -> Tuple[bytes, str]:
+    provider = get_tts_provider(engine)
+
+    async def produce() -> bytes:
+        return await provider.asynthesize(normalize_text(text), emotion=tone, speed=speed)
+
+    cache = get_audio_cache()
+    if cache is None:
+        audio = await produce()
+    else:
+        voice_id, model_id, settings = provider.cache_params(emotion=tone, speed=speed)
+        audio = await cache.get_or_create(make_cache_key(text, voice_id, model_id, settings), produce)
+    return audio, provider.audio_format
+
+
+async def synthesize_audio_bytes(text: str, engine: Optional[str] = None) -> bytes:
+    """텍스트를 오디오 bytes로 변환 (포맷이 필요 없는 호출용)"""
+    audio, _ = await synthesize_audio(text, engine=engine)
+    return audio
+
+
+async def stream_audio_chunks(
+    text: str,
+    engine: Optional[str] = None,
+    tone: Optional[str] = None,
+    speed: Optional[float] = None,
+) -> AsyncIterator[bytes]:
+    """텍스트를 오디오 조각 스트림으로 변환 (도착하는 대로 전달, 완료 후 캐시에 저장)"""
+    if not text or not text.strip():
+        raise ValueError("text is empty")
+
+    provider = get_tts_provider(resolve_engine(engine))
+    cache = get_audio_cache()
+    voice_id, model_id, settings = provider.cache_params(emotion=tone, speed=speed)
+    key = make_cache_key(text, voice_id, model_id, settings)
+    if cache is not None:
+        audio = await cache.get(key)
+        if audio is not None:
+            for start in range(0, len(audio), STREAM_CHUNK_BYTES):
+                yield audio[start:start + STREAM_CHUNK_BYTES]
+            return
+
+    chunks = []
+    async for chunk in provider.astream(normalize_text(text), emotion=tone, speed=speed):
+        chunks.append(chunk)
+        yield chunk
+
+    # 끝까지 받은 경우에만 캐시에 저장
+    if cache is not None:
+        await cache.put(key, b"".join(chunks))
+
+
+async def open_audio_stream(
+    text: str,
+    engine: Optional[str] = None,
+    tone: Optional[str] = None,
+    speed: Optional[float] = None,
+    first_chunk_timeout: Optional[float] = None,
+) -> Tuple[str, AsyncIterator[bytes]]:
+    """첫 조각까지 받은 뒤 (포맷, 조각 스트림) 반환
+
+    첫 조각 전에 시간 초과가 나면 fallback 엔진으로 전환한다
+    (재생이 시작된 뒤에는 엔진을 바꿀 수 없음).
+    """
+    selected = resolve_engine(engine)
+    phrase = _lookup_phrase(text, selected, tone, speed)
+    if phrase is not None:
+        audio, audio_format = phrase
+
+        async def single() -> AsyncIterator[bytes]:
+            yield audio
+
+        return audio_format, single()
+    try:
+        return await _open_stream_with(selected, text, tone, speed, first_chunk_timeout)
+    except TimeoutError as e:
+        fallback = _fallback_for(selected)
+        if fallback is None:
+            raise
+        print(f"[TTS] ⏱️ {selected} 스트리밍 시간 초과 → {fallback} 엔진으로 대체 ({e})")
+        return await _open_stream_with(fallback, text, tone, speed, first_chunk_timeout)
+
+
+async def _open_stream_with(
+    engine: str,
+    text: str,
+    tone: Optional[str],
+    speed: Optional[float],
+    first_chunk_timeout: Optional[float],
+) -> Tuple[str, AsyncIterator[bytes]]:
+    audio_format = get_tts_provider(engine).audio_format
+    chunks = stream_audio_chunks(text, engine=engine, tone=tone, speed=speed)
+    try:
+        first_chunk = await asyncio.wait_for(chunks.__anext__(), timeout=first_chunk_timeout)
+    except StopAsyncIteration:
+        first_chunk = b""
+    except BaseException:
+        await chunks.aclose()
+        raise
+
+    async def rest() -> AsyncIterator[bytes]:
+        try:
+            if first_chunk:
+                yield first_chunk
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    return audio_format, rest()
+
+
 async def synthesize_to_wav(
     text: str,
     speed: Optional[float] = None,
@@ -49,66 +364,16 @@ async def synthesize_to_wav(
     text : str
         입력 텍스트 (한국어)
     speed : float | None
-        말하기 속도 (Eleven Labs API에서는 미지원, 호환성을 위해 유지)
+        말하기 속도 (MeloTTS에서만 사용)
     tone : str | None
-        감정/톤 라벨 (Eleven Labs API에서는 미지원, 호환성을 위해 유지)
+        감정/톤 라벨 (MeloTTS 프리셋, Eleven Labs에서는 무시)
     engine : str | None
-        엔진 이름 (호환성을 위해 유지, 무시됨)
+        엔진 이름 ("elevenlabs" | "melo", None이면 TTS_ENGINE)
 
     Returns
     -------
     str
-        base64로 인코딩된 오디오 데이터 (MP3 형식)
+        base64로 인코딩된 오디오 데이터 (Eleven Labs: MP3, MeloTTS: WAV)
     """
-    if not ELEVENLABS_API_KEY:
-        raise ValueError(
-            "ELEVENLABS_API_KEY is not set. Please add it to your .env file."
-        )
-
-    if not text or not text.strip():
-        raise ValueError("text is empty")
-
-    # Eleven Labs API 요청
-    url = f"{API_BASE_URL}/text-to-speech/{VOICE_ID}"
-
-    headers = {
-        "Accept": "audio/mpeg",
-        "Content-Type": "application/json",
-        "xi-api-key": ELEVENLABS_API_KEY,
-    }
-
-    data = {
-        "text": text.strip(),
-        "model_id": MODEL_ID,
-        "voice_settings": {"stability": 0.5, "similarity_boost": 0.5},
-    }
-
-    try:
-        import base64
-        
-        # ✅ Async API 요청 (블로킹 제거!)
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, json=data, headers=headers)
-            response.raise_for_status()
-
-        # 🆕 파일로 저장하지 않고 base64로 인코딩하여 반환
-        audio_bytes = response.content
-        audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
-        
-        print(f"[Eleven Labs TTS] 오디오 생성 완료 (base64, {len(audio_bytes)} bytes)")
-        return audio_base64
-
-    except httpx.HTTPStatusError as e:
-        error_msg = (
-            f"Eleven Labs API 오류 (HTTP {e.response.status_code}): {e.response.text}"
-        )
-        print(f"[Eleven Labs TTS ERROR] {error_msg}")
-        raise Exception(error_msg)
-    except httpx.RequestError as e:
-        error_msg = f"Eleven Labs API 요청 실패: {str(e)}"
-        print(f"[Eleven Labs TTS ERROR] {error_msg}")
-        raise Exception(error_msg)
-    except Exception as e:
-        error_msg = f"TTS 처리 중 오류 발생: {str(e)}"
-        print(f"[Eleven Labs TTS ERROR] {error_msg}")
-        raise Exception(error_msg)
+    audio_bytes, _ = await synthesize_audio(text, engine=engine, tone=tone, speed=speed)
+    return base64.b64encode(audio_bytes).decode("utf-8")
@@ -5,9 +5,10 @@
 import os
 import sys
 import json
+import base64
 import asyncio  # ✅ Phase 3: 백그라운드 비동기 STT용
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import importlib.util
@@ -23,7 +24,7 @@ from fastapi import (
 
 # noqa
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
 # =========================
@@ -37,6 +38,10 @@ sys.path.insert(0, str(backend_path))
 tts_path = backend_path / "engine" / "text-to-speech"
 sys.path.insert(0, str(tts_path))
 
+# ✅ STT 공통 모듈 경로 추가
+stt_path = backend_path / "engine" / "speech-to-text"
+sys.path.insert(0, str(stt_path))
+
 # =========================
 # 라우터 / 엔진 import
 # =========================
@@ -53,9 +58,20 @@ from app.routine_survey.models import (
 
 # DB 세션/초기화
 from app.db.database import SessionLocal, init_db
+from app.db.instrumentation import DBTimingMiddleware, get_db_stats, track_db_request
 
 # TTS 모델
-from tts_model import synthesize_to_wav
+from tts_model import (
+    synthesize_audio,
+    open_audio_stream,
+    active_engines as active_tts_engines,
+    get_cache_stats as get_tts_cache_stats,
+    get_phrase_audio,
+    prepare_phrase_bank,
+)
+from phrase_bank import SYSTEM_PHRASES
+from provider_registry import warmup_tts_providers, close_tts_providers
+from common.audio_ingest import AudioFrameAssembler
 
 # 루틴 추천 엔진
 from engine.routine_recommend.engine import RoutineRecommendFromEmotionEngine
@@ -65,7 +81,7 @@ from engine.routine_recommend.models.schemas import (
 )
 
 # Auth / User 모델
-from app.auth.dependencies import get_current_user
+from app.auth.dependencies import get_current_user, get_current_user_async
 from app.db.models import User
 
 # =========================
@@ -117,6 +133,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 DB 시간 요약 (쿼리 수, DB 시간, 풀 대기, N+1 의심 쿼리) + Server-Timing 헤더
+app.add_middleware(DBTimingMiddleware)
+
 # =========================
 # Scheduler Setup
 # =========================
@@ -141,6 +160,32 @@ except Exception as e:
     traceback.print_exc()
 
 
+# =========================
+# TTS Provider Lifecycle
+# =========================
+
+
+@app.on_event("startup")
+async def warmup_tts():
+    """TTS 엔진 예열 (ElevenLabs 연결 풀, MeloTTS 모델 풀) + 고정 발화 팩 준비"""
+    await warmup_tts_providers(active_tts_engines())
+    # 팩이 없거나 음성 설정이 바뀐 경우의 재합성은 시작을 막지 않도록 백그라운드에서 실행
+    app.state.phrase_bank_task = asyncio.create_task(prepare_tts_phrase_bank())
+
+
+async def prepare_tts_phrase_bank():
+    try:
+        await prepare_phrase_bank()
+    except Exception as e:
+        print(f"[PhraseBank] ⚠️ 고정 발화 팩 준비 실패: {e}")
+
+
+@app.on_event("shutdown")
+async def close_tts():
+    """TTS 프로바이더 연결 풀 정리"""
+    await close_tts_providers()
+
+
 # =========================
 # Static Files (TTS Outputs) - DISABLED: Now using base64 instead
 # =========================
@@ -591,6 +636,7 @@ class AgentTextRequest(BaseModel):
         None  # "success" | "medium" | "low_quality" | "no_speech" | None
     )
     tts_enabled: bool = False  # 🆕 TTS 활성화 여부
+    tts_stream: bool = False  # 🆕 True면 base64 대신 /api/tts/stream으로 오디오 스트리밍
 
 
 class AgentAudioRequest(BaseModel):
@@ -603,13 +649,73 @@ class AgentAudioRequest(BaseModel):
 # =====================================================================
 
 
-async def generate_tts_async(text: str) -> str:
-    """비동기로 TTS 생성 (base64 반환)"""
-    # synthesize_to_wav는 이제 base64 string을 반환
-    audio_base64 = await synthesize_to_wav(
-        text=text, speed=None, tone="neutral", engine=None
+# 오디오 포맷 -> MIME 타입
+AUDIO_MEDIA_TYPES = {"mp3": "audio/mpeg", "wav": "audio/wav", "opus": "audio/ogg"}
+
+
+def attach_phrase_audio(result: Dict[str, Any], phrase_id: str) -> bool:
+    """미리 합성된 고정 발화 오디오를 응답에 포함 (팩이 준비되지 않았으면 False)"""
+    phrase = get_phrase_audio(phrase_id)
+    if phrase is None:
+        return False
+    audio_bytes, audio_format = phrase
+    audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
+    for target in (result, result.setdefault("meta", {})):
+        target["tts_audio_base64"] = audio_base64
+        target["tts_audio_format"] = audio_format
+        target["tts_status"] = "ready"
+    return True
+
+
+async def generate_tts_async(text: str, budget: Optional[float] = None) -> Tuple[str, str]:
+    """비동기로 TTS 생성 (base64, 오디오 포맷) 반환
+
+    기본 엔진이 시간 초과되면 TTS_FALLBACK_ENGINE으로 대체되므로 포맷이 달라질 수 있음
+    budget(초): fallback까지 포함한 전체 대기 한도 (넘으면 asyncio.TimeoutError)
+    """
+    audio_bytes, audio_format = await synthesize_audio(
+        text=text, engine=None, tone="neutral", speed=None, budget=budget
+    )
+    return base64.b64encode(audio_bytes).decode("utf-8"), audio_format
+
+
+# 스트리밍 중 다음 오디오 조각을 기다리는 최대 시간 (초)
+TTS_STREAM_STALL_TIMEOUT = 15.0
+
+
+async def stream_tts_to_websocket(websocket: WebSocket, text: str, session_id: Optional[str]) -> int:
+    """
+    TTS 오디오를 도착하는 대로 바이너리 프레임으로 전송
+
+    tts_start(JSON) → 오디오 조각(binary) ... → tts_end(JSON)
+
+    Returns:
+        전송한 오디오 바이트 수
+    """
+    audio_format, chunks = await open_audio_stream(
+        text, tone="neutral", first_chunk_timeout=TTS_STREAM_STALL_TIMEOUT
     )
-    return audio_base64
+    await websocket.send_json(
+        {"type": "tts_start", "audio_format": audio_format, "session_id": session_id}
+    )
+    total = 0
+    try:
+        while True:
+            try:
+                chunk = await asyncio.wait_for(
+                    chunks.__anext__(), timeout=TTS_STREAM_STALL_TIMEOUT
+                )
+            except StopAsyncIteration:
+                break
+            await websocket.send_bytes(chunk)
+            total += len(chunk)
+    finally:
+        await chunks.aclose()
+
+    await websocket.send_json(
+        {"type": "tts_end", "bytes": total, "session_id": session_id}
+    )
+    return total
 
 
 @app.post("/api/agent/v2/text")
@@ -639,8 +745,8 @@ async def agent_text_v2_endpoint(
 
         # STT Quality 전처리
         if request.stt_quality == "no_speech":
-            return {
-                "reply_text": "음성이 감지되지 않았어요. 다시 말씀해주시겠어요?",
+            result = {
+                "reply_text": SYSTEM_PHRASES["no_speech"],
                 "input_text": request.user_text or "",
                 "emotion_result": None,
                 "routine_result": None,
@@ -655,9 +761,12 @@ async def agent_text_v2_endpoint(
                     "note": "no_speech_detected",
                 },
             }
+            if request.tts_enabled:
+                attach_phrase_audio(result, "no_speech")
+            return result
         elif request.stt_quality == "low_quality":
-            return {
-                "reply_text": "소음이 심해서 잘 들리지 않았어요. 조용한 곳에서 다시 말씀해주시겠어요?",
+            result = {
+                "reply_text": SYSTEM_PHRASES["low_quality"],
                 "input_text": request.user_text or "",
                 "emotion_result": None,
                 "routine_result": None,
@@ -672,6 +781,9 @@ async def agent_text_v2_endpoint(
                     "note": "low_quality_audio",
                 },
             }
+            if request.tts_enabled:
+                attach_phrase_audio(result, "low_quality")
+            return result
 
         # LLM 입력 생성 (컨텍스트 + 사용자 텍스트)
         llm_input = request.user_text
@@ -700,7 +812,14 @@ async def agent_text_v2_endpoint(
         # 🆕 TTS 처리 (동기 방식 - 응답에 포함 필수)
         # 🎤 Phase 5: 파일 저장 없이 base64로 전달
         print(f"[TTS] 🔍 DEBUG: tts_enabled = {request.tts_enabled}")
-        if request.tts_enabled:
+        if request.tts_enabled and request.tts_stream:
+            # 🆕 스트리밍 모드: 오디오는 /api/tts/stream에서 조각 단위로 수신
+            tts_text = result.get("reply_text_with_tags", result["reply_text"])
+            for target in (result, result["meta"]):
+                target["tts_status"] = "stream"
+                target["tts_stream_url"] = "/api/tts/stream"
+                target["tts_text"] = tts_text
+        elif request.tts_enabled:
             try:
                 # TTS 생성 - audio tag 포함 텍스트 사용
                 tts_text = result.get("reply_text_with_tags", result["reply_text"])
@@ -709,14 +828,14 @@ async def agent_text_v2_endpoint(
                 )
 
                 # 🆕 base64 오디오 생성 (await 필수!)
-                audio_base64 = await asyncio.wait_for(
-                    generate_tts_async(tts_text),
-                    timeout=30.0,  # 30초로 증가 (긴 텍스트 대응)
+                # 30초 예산 안에서 클라우드 시간 초과 시 로컬 엔진 fallback까지 수행
+                audio_base64, audio_format = await generate_tts_async(
+                    tts_text, budget=30.0
                 )
 
                 # 🆕 base64 오디오를 response에 포함 (파일 URL 대신)
                 result["tts_audio_base64"] = audio_base64
-                result["tts_audio_format"] = "mp3"  # Eleven Labs는 MP3 반환
+                result["tts_audio_format"] = audio_format  # Eleven Labs: mp3, MeloTTS: wav
                 result["tts_status"] = "ready"
 
                 # Meta에도 설정 (Frontend 요구사항)
@@ -724,7 +843,7 @@ async def agent_text_v2_endpoint(
                     result["meta"] = {}
 
                 result["meta"]["tts_audio_base64"] = audio_base64
-                result["meta"]["tts_audio_format"] = "mp3"
+                result["meta"]["tts_audio_format"] = audio_format
                 result["meta"]["tts_status"] = "ready"
 
                 print(f"[TTS] 오디오 생성 완료 (base64, {len(audio_base64)} chars)")
@@ -750,9 +869,14 @@ async def agent_text_v2_endpoint(
 @app.get("/api/agent/v2/sessions")
 async def get_all_agent_sessions_v2(
     current_user: User = Depends(get_current_user),
+    limit: int = None,
+    before_id: int = None,
 ):
     """
-    LangChain Agent V2 - 현재 유저의 모든 세션 정보 조회
+    LangChain Agent V2 - 현재 유저의 세션 목록 조회 (최근 활동순)
+
+    - limit이 없으면 전체 세션
+    - 있으면 limit개씩 페이지 조회 (응답의 next_cursor를 before_id로 전달)
     """
     try:
         from engine.langchain_agent.db_conversation_store import (
@@ -762,12 +886,15 @@ async def get_all_agent_sessions_v2(
         user_id = current_user.ID
         store = get_conversation_store()
 
-        sessions = store.get_user_sessions(user_id)
+        page = store.get_user_sessions_page(user_id, limit=limit, before_id=before_id)
+        sessions = page["sessions"]
 
         return {
             "user_id": user_id,
             "session_count": len(sessions),
             "sessions": sessions,
+            "has_more": page["has_more"],
+            "next_cursor": page["next_cursor"],
         }
     except Exception as e:
         import traceback
@@ -779,11 +906,15 @@ async def get_all_agent_sessions_v2(
 @app.get("/api/agent/v2/sessions/{session_id}")
 async def get_agent_session_v2(
     session_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_async),
     limit: int = None,
+    before_id: int = None,
 ):
     """
     LangChain Agent V2 - 특정 세션의 대화 히스토리 조회
+
+    - limit/before_id가 없으면 전체 히스토리
+    - 있으면 최신 메시지부터 limit개씩 역방향 페이지 조회 (응답의 next_cursor를 before_id로 전달)
     """
     try:
         from engine.langchain_agent.db_conversation_store import (
@@ -793,8 +924,12 @@ async def get_agent_session_v2(
         user_id = current_user.ID
         store = get_conversation_store()
 
-        history = store.get_history(user_id, session_id, limit=limit)
-        metadata = store.get_session_metadata(user_id, session_id)
+        if limit is None and before_id is None:
+            page = {"messages": await store.get_history_async(user_id, session_id), "has_more": False, "next_cursor": None}
+        else:
+            page = await store.get_history_page_async(user_id, session_id, limit=limit or 50, before_id=before_id)
+        history = page["messages"]
+        metadata = await store.get_session_metadata_async(user_id, session_id)
 
         return {
             "session_id": session_id,
@@ -802,6 +937,8 @@ async def get_agent_session_v2(
             "metadata": metadata,
             "message_count": len(history),
             "messages": history,
+            "has_more": page["has_more"],
+            "next_cursor": page["next_cursor"],
         }
     except Exception as e:
         import traceback
@@ -1034,6 +1171,78 @@ def get_stt_engine():
     return stt_engine
 
 
+speaker_service = None
+
+
+def get_speaker_service():
+    """화자 식별 서비스 싱글톤 (Resemblyzer 인코더 + 보이스프린트 캐시)"""
+    global speaker_service
+    if speaker_service is None:
+        try:
+            fw_path = backend_path / "engine" / "speech-to-text" / "faster_whisper_engine"
+            if str(fw_path) not in sys.path:
+                sys.path.insert(0, str(fw_path))
+            from speaker_service import SpeakerIdService
+            from engine.langchain_agent import get_conversation_store
+
+            speaker_service = SpeakerIdService(
+                get_conversation_store(), config_path=str(fw_path / "config.yaml")
+            )
+        except Exception as e:
+            print(f"[Speaker] 화자 식별 서비스 초기화 실패: {e}")
+    return speaker_service
+
+
+@app.on_event("shutdown")
+async def close_speaker_service():
+    """종료 시 대기 중인 화자 프로필 쓰기 반영"""
+    if speaker_service is not None:
+        speaker_service.close()
+
+
+async def transcribe_with_speaker_embedding(engine, speech_audio, service):
+    """
+    Whisper 디코딩과 화자 임베딩 추출을 동시에 실행
+
+    Returns:
+        (transcript, quality, embedding) - 임베딩 추출 실패 시 embedding은 None
+    """
+    embedding_future = None
+    if service is not None and service.enabled:
+        # VAD 버퍼 뷰는 다음 발화에 재사용되므로 복사본을 워커 스레드에 넘김
+        embedding_future = asyncio.get_running_loop().run_in_executor(
+            None, service.extract_embedding, np.array(speech_audio, dtype=np.float32)
+        )
+
+    transcript, quality = engine.whisper.transcribe(speech_audio, callback=None)
+
+    current_embedding = None
+    if embedding_future is not None:
+        try:
+            current_embedding = await embedding_future
+        except Exception as e:
+            print(f"[Speaker] 임베딩 추출 오류: {e}")
+    return transcript, quality, current_embedding
+
+
+def identify_speaker_for_user(service, user_id, current_embedding):
+    """캐시된 보이스프린트로 화자 식별 + 프로필 반영 (DB 쓰기는 일괄 처리)"""
+    if service is None or current_embedding is None:
+        print("[Speaker] 임베딩 추출 실패 (화자 검증 생략)")
+        return None
+    try:
+        speaker_id, similarity = service.identify_and_register(user_id, current_embedding)
+        print(f"[Speaker] 화자 식별: {speaker_id} (유사도: {similarity:.3f})")
+        print(f"[Speaker Debug] 현재 등록된 화자: {service.speaker_ids(user_id)}")
+        return speaker_id
+    except Exception as e:
+        import traceback
+
+        print(f"[Speaker] 화자 검증 오류: {e}")
+        traceback.print_exc()
+        return None
+
+
 @app.websocket("/stt/stream")
 async def stt_websocket(websocket: WebSocket):
     await websocket.accept()
@@ -1045,6 +1254,12 @@ async def stt_websocket(websocket: WebSocket):
         )
 
         engine = get_stt_engine()
+        # 🆕 연결별 오디오 재조립기 (기본: float32 PCM, 16kHz)
+        audio_ingestor = AudioFrameAssembler(
+            sample_format="float32",
+            target_sample_rate=engine.config["audio"]["sample_rate"],
+            max_chunk_samples=engine.config["audio"]["chunk_size"],
+        )
 
         await websocket.send_json({"status": "ready", "message": "STT 엔진 준비 완료"})
 
@@ -1058,184 +1273,99 @@ async def stt_websocket(websocket: WebSocket):
                 raise
 
             if "bytes" in data:
-                audio_bytes = data["bytes"]
-                audio_chunk = np.frombuffer(audio_bytes, dtype=np.float32)
-
-                if len(audio_chunk) != 4096:
-                    print(f"[WARNING] Expected 4096 samples, got {len(audio_chunk)}, skipping")
-                    continue
-
-                is_speech_end, speech_audio, is_short_pause = engine.vad.process_chunk(
-                    audio_chunk
-                )
-
-                # Debug counter
-                if hasattr(engine.vad, "_debug_counter"):
-                    engine.vad._debug_counter = (
-                        getattr(engine.vad, "_debug_counter", 0) + 1
+                # 🆕 임의 크기 패킷을 VAD 청크 단위로 재조립 (버려지는 오디오 없음)
+                for audio_chunk in audio_ingestor.feed(data["bytes"]):
+                    is_speech_end, speech_audio, is_short_pause = engine.vad.process_chunk(
+                        audio_chunk
                     )
-                else:
-                    engine.vad._debug_counter = 1
 
-                if engine.vad._debug_counter % 100 == 0:
-                    print(
-                        f"[STT DEBUG] 청크 처리: speech_end={is_speech_end}, "
-                        f"short_pause={is_short_pause}, "
-                        f"speech_audio_len={len(speech_audio) if speech_audio is not None else 0}"
-                    )
+                    # Debug counter
+                    if hasattr(engine.vad, "_debug_counter"):
+                        engine.vad._debug_counter = (
+                            getattr(engine.vad, "_debug_counter", 0) + 1
+                        )
+                    else:
+                        engine.vad._debug_counter = 1
 
-                if is_speech_end and speech_audio is not None:
-                    print(
-                        f"[STT] 발화 종료 감지, STT 처리 시작 (오디오 길이: {len(speech_audio)} 샘플)"
-                    )
+                    if engine.vad._debug_counter % 100 == 0:
+                        print(
+                            f"[STT DEBUG] 청크 처리: speech_end={is_speech_end}, "
+                            f"short_pause={is_short_pause}, "
+                            f"speech_audio_len={len(speech_audio) if speech_audio is not None else 0}"
+                        )
 
-                    # 클라이언트에게 처리 중 알림
-                    await websocket.send_json(
-                        {"status": "processing", "message": "듣고 생각하는 중..."}
-                    )
+                    if is_speech_end and speech_audio is not None:
+                        print(
+                            f"[STT] 발화 종료 감지, STT 처리 시작 (오디오 길이: {len(speech_audio)} 샘플)"
+                        )
 
-                    transcript, quality = engine.whisper.transcribe(
-                        speech_audio, callback=None
-                    )
-                    print(f"[STT] STT 결과: text='{transcript}', quality={quality}")
-
-                    # ========================================================================
-                    # 🆕 화자 검증 로직 (DB 기반)
-                    # ========================================================================
-                    speaker_id = None
-                    user_id = (
-                        1  # Default user ID for now (until auth is added to websocket)
-                    )
+                        # 클라이언트에게 처리 중 알림
+                        await websocket.send_json(
+                            {"status": "processing", "message": "듣고 생각하는 중..."}
+                        )
 
-                    if quality in ["success", "medium"]:
-                        try:
-                            stt_config_path = (
-                                backend_path
-                                / "engine"
-                                / "speech-to-text"
-                                / "faster_whisper_engine"
-                                / "config.yaml"
+                        # STT 디코딩과 화자 임베딩 추출을 동시에 실행
+                        speaker_identifier = get_speaker_service()
+                        transcript, quality, current_embedding = (
+                            await transcribe_with_speaker_embedding(
+                                engine, speech_audio, speaker_identifier
                             )
-                            sys.path.insert(
-                                0,
-                                str(
-                                    backend_path
-                                    / "engine"
-                                    / "speech-to-text"
-                                    / "faster_whisper_engine"
-                                ),
+                        )
+                        print(f"[STT] STT 결과: text='{transcript}', quality={quality}")
+
+                        # ========================================================================
+                        # 🆕 화자 검증 로직 (캐시된 보이스프린트 + DB 일괄 쓰기)
+                        # ========================================================================
+                        speaker_id = None
+                        user_id = (
+                            1  # Default user ID for now (until auth is added to websocket)
+                        )
+
+                        if quality in ["success", "medium"]:
+                            speaker_id = identify_speaker_for_user(
+                                speaker_identifier, user_id, current_embedding
                             )
-                            from speaker_verifier import SpeakerVerifier
-                            from engine.langchain_agent import (
-                                get_conversation_store,
+                        else:
+                            print(
+                                f"[Speaker] 품질 부족으로 화자 검증 skip (quality={quality})"
                             )
 
-                            verifier = SpeakerVerifier(config_path=str(stt_config_path))
-                            current_embedding = verifier.extract_embedding(speech_audio)
-
-                            if current_embedding is not None:
-                                store = get_conversation_store()
-
-                                # 1. DB에서 프로필 조회
-                                db_profiles = store.get_speaker_profiles(user_id)
-
-                                # 2. Verifier 포맷으로 변환
-                                existing_profiles = {}
-                                for p in db_profiles:
-                                    existing_profiles[p["speaker_type"]] = {
-                                        "embedding": np.array(p["embedding"]),
-                                        "current_score": p["current_score"],
-                                        "quality": "success",  # DB에는 품질 저장 안하므로 기본값
-                                    }
-
-                                # 3. 화자 식별
-                                speaker_id, similarity = verifier.identify_speaker(
-                                    current_embedding, existing_profiles
-                                )
-                                print(
-                                    f"[Speaker] 화자 식별: {speaker_id} (유사도: {similarity:.3f})"
-                                )
-
-                                if speaker_id not in existing_profiles:
-                                    # 4. 신규 등록
-                                    store.save_speaker_profile(
-                                        user_id,
-                                        speaker_id,
-                                        current_embedding.tolist(),
-                                        similarity,
-                                    )
-                                    print(f"[Speaker] 신규 등록: {speaker_id}")
-                                else:
-                                    # 5. 기존 화자 업데이트 (점수가 더 높을 때만)
-                                    current_score = existing_profiles[speaker_id][
-                                        "current_score"
-                                    ]
-                                    if similarity > current_score:
-                                        # 임베딩 업데이트 (가중 평균)
-                                        old_embedding = existing_profiles[speaker_id][
-                                            "embedding"
-                                        ]
-                                        updated_embedding = verifier.update_embedding(
-                                            old_embedding,
-                                            current_embedding,
-                                            speaker_id=speaker_id,
-                                        )
-
-                                        # DB 업데이트
-                                        profile_id = next(
-                                            p["id"]
-                                            for p in db_profiles
-                                            if p["speaker_type"] == speaker_id
-                                        )
-                                        store.update_speaker_profile(
-                                            profile_id,
-                                            updated_embedding.tolist(),
-                                            similarity,
-                                            user_id,
-                                        )
-                                        print(
-                                            f"[Speaker] 🔄 프로필 업데이트: {speaker_id} (Score: {current_score:.3f} -> {similarity:.3f})"
-                                        )
-                                    else:
-                                        print(
-                                            f"[Speaker] ✓ 기존 사용자: {speaker_id} (업데이트 불필요, Score: {current_score:.3f} >= {similarity:.3f})"
-                                        )
-
-                                # 디버깅용 출력
-                                all_speaker_ids = [
-                                    p["speaker_type"]
-                                    for p in store.get_speaker_profiles(user_id)
-                                ]
-                                print(
-                                    f"[Speaker Debug] 현재 등록된 화자: {all_speaker_ids}"
-                                )
-                            else:
-                                print("[Speaker] 임베딩 추출 실패 (화자 검증 생략)")
-                        except Exception as e:
-                            import traceback
-
-                            print(f"[Speaker] 화자 검증 오류: {e}")
-                            traceback.print_exc()
-                    else:
-                        print(
-                            f"[Speaker] 품질 부족으로 화자 검증 skip (quality={quality})"
-                        )
-
-                    response = {
-                        "text": transcript
-                        if quality in ["success", "medium"]
-                        else None,
-                        "quality": quality,
-                        "speaker_id": speaker_id,
-                    }
-                    await websocket.send_json(response)
+                        response = {
+                            "text": transcript
+                            if quality in ["success", "medium"]
+                            else None,
+                            "quality": quality,
+                            "speaker_id": speaker_id,
+                        }
+                        await websocket.send_json(response)
 
-                    engine.vad.reset()
+                        engine.vad.reset()
 
             elif "text" in data:
                 command = data["text"]
-                if command == "reset":
+                if command.startswith("{"):
+                    # 🆕 오디오 포맷 협상: {"type": "config", "codec": "pcm", "audio_format": "int16", "sample_rate": 48000}
+                    # codec="opus"이면 바이너리 메시지 1개 = Opus 패킷 1개
+                    try:
+                        message = json.loads(command)
+                        audio_ingestor.configure(
+                            sample_format=message.get("audio_format"),
+                            sample_rate=message.get("sample_rate"),
+                            codec=message.get("codec"),
+                        )
+                        await websocket.send_json(
+                            {
+                                "status": "configured",
+                                "codec": audio_ingestor.codec,
+                                "audio_format": audio_ingestor.sample_format,
+                                "sample_rate": audio_ingestor.sample_rate,
+                            }
+                        )
+                    except (ValueError, ImportError) as e:
+                        await websocket.send_json({"error": f"오디오 설정 오류: {e}"})
+                elif command == "reset":
                     engine.vad.reset()
+                    audio_ingestor.reset()
                     await websocket.send_json(
                         {"status": "reset", "message": "VAD 리셋 완료"}
                     )
@@ -1324,6 +1454,7 @@ async def agent_websocket(websocket: WebSocket, user_id: int = 1):
     session_id = None
     temporary_message_ids = []  # 🆕 Phase 3: 임시 메시지 ID 추적
     tts_enabled = False  # 🆕 TTS 활성화 여부
+    tts_stream = False  # 🆕 True면 TTS 오디오를 바이너리 프레임으로 스트리밍
 
     try:
         await websocket.send_json(
@@ -1335,6 +1466,12 @@ async def agent_websocket(websocket: WebSocket, user_id: int = 1):
         )
 
         stt_engine_instance = get_stt_engine()
+        # 🆕 연결별 오디오 재조립기 (기본: int16 PCM, 16kHz)
+        audio_ingestor = AudioFrameAssembler(
+            sample_format="int16",
+            target_sample_rate=stt_engine_instance.config["audio"]["sample_rate"],
+            max_chunk_samples=stt_engine_instance.config["audio"]["chunk_size"],
+        )
 
         await websocket.send_json(
             {
@@ -1369,15 +1506,47 @@ async def agent_websocket(websocket: WebSocket, user_id: int = 1):
 
                     # 🆕 TTS 설정 수신 (config 또는 session_init 메시지)
                     if isinstance(message, dict) and message.get("type") in ["config", "session_init"]:
-                        if "tts_enabled" in message:
-                            tts_enabled = bool(message.get("tts_enabled"))
-                            print(f"[Agent WebSocket] TTS 설정: {tts_enabled}")
-                            # config 메시지에만 응답 (session_init은 아래에서 처리)
-                            if message.get("type") == "config":
+                        # 🆕 오디오 포맷 협상 (codec: pcm | opus, audio_format: int16 | float32, sample_rate)
+                        has_audio_config = any(
+                            key in message for key in ("codec", "audio_format", "sample_rate")
+                        )
+                        if has_audio_config:
+                            try:
+                                audio_ingestor.configure(
+                                    sample_format=message.get("audio_format"),
+                                    sample_rate=message.get("sample_rate"),
+                                    codec=message.get("codec"),
+                                )
+                                print(
+                                    f"[Agent WebSocket] 오디오 설정: {audio_ingestor.codec} "
+                                    f"({audio_ingestor.sample_format} @ {audio_ingestor.sample_rate}Hz)"
+                                )
+                            except (ValueError, ImportError) as e:
                                 await websocket.send_json(
-                                    {"type": "config_ack", "tts_enabled": tts_enabled}
+                                    {"type": "error", "message": f"오디오 설정 오류: {e}"}
                                 )
                                 continue
+                        if "tts_enabled" in message:
+                            tts_enabled = bool(message.get("tts_enabled"))
+                            print(f"[Agent WebSocket] TTS 설정: {tts_enabled}")
+                        if "tts_stream" in message:
+                            tts_stream = bool(message.get("tts_stream"))
+                            print(f"[Agent WebSocket] TTS 스트리밍: {tts_stream}")
+                        # config 메시지에만 응답 (session_init은 아래에서 처리)
+                        if message.get("type") == "config" and (
+                            "tts_enabled" in message or "tts_stream" in message or has_audio_config
+                        ):
+                            await websocket.send_json(
+                                {
+                                    "type": "config_ack",
+                                    "tts_enabled": tts_enabled,
+                                    "tts_stream": tts_stream,
+                                    "codec": audio_ingestor.codec,
+                                    "audio_format": audio_ingestor.sample_format,
+                                    "sample_rate": audio_ingestor.sample_rate,
+                                }
+                            )
+                            continue
 
                     # 🆕 Phase 3: interrupt 신호 처리
                     if isinstance(message, dict) and message.get("type") == "interrupt":
@@ -1400,6 +1569,7 @@ async def agent_websocket(websocket: WebSocket, user_id: int = 1):
                         # 2. VAD 버퍼 초기화
                         if stt_engine_instance:
                             stt_engine_instance.vad.reset()
+                            audio_ingestor.reset()
                             print("[Agent WebSocket] VAD 버퍼 초기화 완료")
 
                         # 3. Client에 응답
@@ -1441,349 +1611,253 @@ async def agent_websocket(websocket: WebSocket, user_id: int = 1):
                     pass
 
             if "bytes" in data:
-                audio_bytes = data["bytes"]
-
-                # Int16로 받아서 Float32로 변환 (정규화)
-                audio_chunk_int16 = np.frombuffer(audio_bytes, dtype=np.int16)
-                audio_chunk = (
-                    audio_chunk_int16.astype(np.float32) / 32768.0
-                )  # -1.0 ~ 1.0
-
-                # ✅ CRITICAL: 4096 샘플 체크 (256ms @ 16kHz)
-                if len(audio_chunk) != 4096:
-                    print(
-                        f"[WARNING] Expected 4096 samples, got {len(audio_chunk)}, skipping"
-                    )
-                    continue
-
-                # 🆕 VAD 콜백 함수 정의 (긴 침묵 감지 시 호출)
-                async def on_vad_speech_end():
-                    """VAD에서 긴 침묵 감지 시 프론트엔드에 처리 중 알림"""
-                    try:
-                        await websocket.send_json({
-                            "type": "speech_end"
-                        })
-                        print("[Agent WebSocket] 🎤 발화 종료 알림 전송")
-                    except Exception as e:
-                        print(f"[Agent WebSocket] 콜백 전송 오류: {e}")
-
-                # VAD 처리 (콜백 전달)
-                # Note: on_vad_speech_end는 async이지만 VAD는 sync 함수이므로
-                # asyncio.create_task로 비동기 실행
-                speech_end_callback = lambda: asyncio.create_task(on_vad_speech_end())
-                
-                is_speech_end, speech_audio, is_short_pause = (
-                    stt_engine_instance.vad.process_chunk(
-                        audio_chunk,
-                        on_speech_end_callback=speech_end_callback
-                    )
-                )
-
-                # VAD 결과 로깅
-                if is_speech_end:
-                    print(
-                        f"[VAD] speech_end=True, audio_len={len(speech_audio) if speech_audio is not None else 0}"
-                    )
-
-                # Phase 2: Speech end 처리 (최종 발화만 처리)
-                if is_speech_end and speech_audio is not None:
-                    print("[Agent WebSocket] 발화 종료 감지, STT + Agent 처리 시작")
-
-                    # 🆕 CRITICAL: STT 처리 전 즉시 speech_end 전송
-                    try:
-                        await websocket.send_json({
-                            "type": "speech_end"
-                        })
-                        print("[Agent WebSocket] ⚡ speech_end 전송 완료 (STT 처리 전)")
-                    except Exception as e:
-                        print(f"[Agent WebSocket] speech_end 전송 오류: {e}")
-
-                    # STT 실행
-                    transcript, quality = stt_engine_instance.whisper.transcribe(
-                        speech_audio, callback=None
-                    )
-
-                    print(
-                        f"[Agent WebSocket] STT 결과: text='{transcript}', quality={quality}"
-                    )
-                    speaker_id = None
-
-                    if quality in ["success", "medium"]:
+                # 🆕 임의 크기 패킷을 VAD 청크 단위로 재조립 (Int16 -> Float32 변환 포함)
+                for audio_chunk in audio_ingestor.feed(data["bytes"]):
+                    # 🆕 VAD 콜백 함수 정의 (긴 침묵 감지 시 호출)
+                    async def on_vad_speech_end():
+                        """VAD에서 긴 침묵 감지 시 프론트엔드에 처리 중 알림"""
                         try:
-                            stt_config_path = (
-                                backend_path
-                                / "engine"
-                                / "speech-to-text"
-                                / "faster_whisper_engine"
-                                / "config.yaml"
-                            )
-                            sys.path.insert(
-                                0,
-                                str(
-                                    backend_path
-                                    / "engine"
-                                    / "speech-to-text"
-                                    / "faster_whisper_engine"
-                                ),
-                            )
-                            from speaker_verifier import SpeakerVerifier
-                            from engine.langchain_agent import (
-                                get_conversation_store,
-                            )
-
-                            verifier = SpeakerVerifier(config_path=str(stt_config_path))
-                            current_embedding = verifier.extract_embedding(speech_audio)
-
-                            if current_embedding is not None:
-                                store = get_conversation_store()
-
-                                # 1. DB에서 프로필 조회
-                                db_profiles = store.get_speaker_profiles(user_id)
-
-                                # 2. Verifier 포맷으로 변환
-                                existing_profiles = {}
-                                for p in db_profiles:
-                                    existing_profiles[p["speaker_type"]] = {
-                                        "embedding": np.array(p["embedding"]),
-                                        "current_score": p["current_score"],
-                                        "quality": "success",
-                                    }
-
-                                # 3. 화자 식별
-                                speaker_id, similarity = verifier.identify_speaker(
-                                    current_embedding, existing_profiles
-                                )
-                                print(
-                                    f"[Speaker] 화자 식별: {speaker_id} (유사도: {similarity:.3f})"
-                                )
-
-                                if speaker_id not in existing_profiles:
-                                    # 4. 신규 등록
-                                    store.save_speaker_profile(
-                                        user_id,
-                                        speaker_id,
-                                        current_embedding.tolist(),
-                                        similarity,
-                                    )
-                                    print(f"[Speaker] 신규 등록: {speaker_id}")
-                                else:
-                                    # 5. 기존 화자 업데이트
-                                    current_score = existing_profiles[speaker_id][
-                                        "current_score"
-                                    ]
-                                    if similarity > current_score:
-                                        old_embedding = existing_profiles[speaker_id][
-                                            "embedding"
-                                        ]
-                                        updated_embedding = verifier.update_embedding(
-                                            old_embedding,
-                                            current_embedding,
-                                            speaker_id=speaker_id,
-                                        )
-
-                                        profile_id = next(
-                                            p["id"]
-                                            for p in db_profiles
-                                            if p["speaker_type"] == speaker_id
-                                        )
-                                        store.update_speaker_profile(
-                                            profile_id,
-                                            updated_embedding.tolist(),
-                                            similarity,
-                                            user_id,
-                                        )
-                                        print(
-                                            f"[Speaker] 🔄 프로필 업데이트: {speaker_id} (Score: {current_score:.3f} -> {similarity:.3f})"
-                                        )
-                                    else:
-                                        print(
-                                            f"[Speaker] ✓ 기존 사용자: {speaker_id} (업데이트 불필요, Score: {current_score:.3f} >= {similarity:.3f})"
-                                        )
-
-                                all_speaker_ids = [
-                                    p["speaker_type"]
-                                    for p in store.get_speaker_profiles(user_id)
-                                ]
-                                print(
-                                    f"[Speaker Debug] 현재 등록된 화자: {all_speaker_ids}"
-                                )
-                            else:
-                                print("[Speaker] 임베딩 추출 실패")
+                            await websocket.send_json({
+                                "type": "speech_end"
+                            })
+                            print("[Agent WebSocket] 🎤 발화 종료 알림 전송")
                         except Exception as e:
-                            import traceback
+                            print(f"[Agent WebSocket] 콜백 전송 오류: {e}")
+
+                    # VAD 처리 (콜백 전달)
+                    # Note: on_vad_speech_end는 async이지만 VAD는 sync 함수이므로
+                    # asyncio.create_task로 비동기 실행
+                    speech_end_callback = lambda: asyncio.create_task(on_vad_speech_end())
+                    
+                    is_speech_end, speech_audio, is_short_pause = (
+                        stt_engine_instance.vad.process_chunk(
+                            audio_chunk,
+                            on_speech_end_callback=speech_end_callback
+                        )
+                    )
 
-                            print(f"[Speaker] 화자 검증 오류: {e}")
-                            traceback.print_exc()
-                    else:
+                    # VAD 결과 로깅
+                    if is_speech_end:
                         print(
-                            f"[Speaker] 품질 부족으로 화자 검증 skip (quality={quality})"
+                            f"[VAD] speech_end=True, audio_len={len(speech_audio) if speech_audio is not None else 0}"
                         )
 
-                    await websocket.send_json(
-                        {
-                            "type": "stt_result",
-                            "text": transcript if quality != "no_speech" else None,
-                            "quality": quality,
-                            "speaker_id": speaker_id,
-                        }
-                    )
+                    # Phase 2: Speech end 처리 (최종 발화만 처리)
+                    if is_speech_end and speech_audio is not None:
+                        print("[Agent WebSocket] 발화 종료 감지, STT + Agent 처리 시작")
 
-                    if quality in ["success", "medium"] and transcript:
+                        # 🆕 CRITICAL: STT 처리 전 즉시 speech_end 전송
                         try:
-                            from engine.langchain_agent import run_ai_bomi_from_text_v2
+                            await websocket.send_json({
+                                "type": "speech_end"
+                            })
+                            print("[Agent WebSocket] ⚡ speech_end 전송 완료 (STT 처리 전)")
+                        except Exception as e:
+                            print(f"[Agent WebSocket] speech_end 전송 오류: {e}")
 
-                            await websocket.send_json(
-                                {
-                                    "type": "status",
-                                    "status": "processing",
-                                    "message": "AI 봄이가 생각 중...",
-                                }
+                        # STT 실행 (화자 임베딩 추출과 동시에)
+                        speaker_identifier = get_speaker_service()
+                        transcript, quality, current_embedding = (
+                            await transcribe_with_speaker_embedding(
+                                stt_engine_instance, speech_audio, speaker_identifier
                             )
+                        )
 
-                            # Generate unique session_id if not provided (same logic as REST API)
-                            import time
-
-                            if not session_id:
-                                timestamp = int(time.time() * 1000)
-                                session_id = f"user_{user_id}_{timestamp}"
-                                print(
-                                    f"🔐 [WebSocket] Generated session_id: {session_id}"
-                                )
-
-                            # 🆕 Phase 3: 사용자 메시지 저장 및 ID 추적
-                            from engine.langchain_agent import get_conversation_store
+                        print(
+                            f"[Agent WebSocket] STT 결과: text='{transcript}', quality={quality}"
+                        )
+                        speaker_id = None
 
-                            store = get_conversation_store()
-                            user_msg_id = store.add_message(
-                                user_id,
-                                session_id,
-                                "user",
-                                transcript,
-                                speaker_id=speaker_id,
+                        if quality in ["success", "medium"]:
+                            speaker_id = identify_speaker_for_user(
+                                speaker_identifier, user_id, current_embedding
                             )
-                            temporary_message_ids.append(user_msg_id)
+                        else:
                             print(
-                                f"[Agent WebSocket] 임시 메시지 추가: user_msg_id={user_msg_id}"
+                                f"[Speaker] 품질 부족으로 화자 검증 skip (quality={quality})"
                             )
 
-                            # Agent 호출 (save_to_db=False로 중복 저장 방지)
-                            result = await run_ai_bomi_from_text_v2(
-                                user_text=transcript,
-                                user_id=user_id,
-                                session_id=session_id,
-                                stt_quality=quality,
-                                speaker_id=speaker_id,
-                                save_to_db=False,  # 🆕 WebSocket에서 직접 저장하므로 False
-                            )
+                        await websocket.send_json(
+                            {
+                                "type": "stt_result",
+                                "text": transcript if quality != "no_speech" else None,
+                                "quality": quality,
+                                "speaker_id": speaker_id,
+                            }
+                        )
 
-                            # 🆕 Phase 3: AI 응답 저장 및 ID 추적
-                            ai_msg_id = store.add_message(
-                                user_id, session_id, "assistant", result["reply_text"]
-                            )
-                            temporary_message_ids.append(ai_msg_id)
-                            print(
-                                f"[Agent WebSocket] 임시 메시지 추가: ai_msg_id={ai_msg_id}"
-                            )
+                        if quality in ["success", "medium"] and transcript:
+                            try:
+                                from engine.langchain_agent import run_ai_bomi_from_text_v2
 
-                            # 🆕 DEBUG: result 내용 확인
-                            print(
-                                f"[Agent WebSocket] 🔍 Sending result keys: {result.keys()}"
-                            )
-                            print(
-                                f"[Agent WebSocket] 🔍 Response type: {result.get('response_type')}"
-                            )
-                            if "alarm_info" in result:
-                                print(
-                                    f"[Agent WebSocket] ✅ alarm_info FOUND: {result['alarm_info']}"
+                                await websocket.send_json(
+                                    {
+                                        "type": "status",
+                                        "status": "processing",
+                                        "message": "AI 봄이가 생각 중...",
+                                    }
                                 )
-                            else:
-                                print(f"[Agent WebSocket] ❌ alarm_info NOT in result!")
 
-                            await websocket.send_json(
-                                {
-                                    "type": "agent_response",
-                                    "data": result,
-                                }
-                            )
+                                # Generate unique session_id if not provided (same logic as REST API)
+                                import time
 
-                            # 🆕 TTS 처리 (tts_enabled가 True일 때만)
-                            print(f"[Agent WebSocket] 🔊 TTS 토글 상태: {tts_enabled}")
-                            if tts_enabled:
-                                try:
-                                    # 🆕 TTS는 reply_text_with_tags 사용 (마크다운 제거 + audio tags 유지)
-                                    tts_text = result.get("reply_text_with_tags") or result["reply_text"]
-                                    print(f"[Agent WebSocket] TTS 생성 시작: {tts_text[:50]}...")
-                                    
-                                    # 🆕 TTS 생성 (base64 문자열 반환, 최대 15초 대기)
-                                    audio_base64 = await asyncio.wait_for(
-                                        generate_tts_async(tts_text),
-                                        timeout=15.0,
+                                if not session_id:
+                                    timestamp = int(time.time() * 1000)
+                                    session_id = f"user_{user_id}_{timestamp}"
+                                    print(
+                                        f"🔐 [WebSocket] Generated session_id: {session_id}"
                                     )
-                                    await websocket.send_json(
-                                        {
-                                            "type": "tts_ready",
-                                            "audio_base64": audio_base64,  # 🆕 base64 직접 전송
-                                            "audio_format": "mp3",
-                                            "session_id": session_id,
-                                        }
+
+                                # 턴 단위 DB 시간 요약 (웹소켓 연결 전체가 아닌 발화 한 번 기준)
+                                with track_db_request(f"ws turn {session_id}"):
+                                    # 🆕 Phase 3: 사용자 메시지 저장 및 ID 추적
+                                    from engine.langchain_agent import get_conversation_store
+
+                                    store = get_conversation_store()
+                                    user_msg_id = await store.add_message_async(
+                                        user_id,
+                                        session_id,
+                                        "user",
+                                        transcript,
+                                        speaker_id=speaker_id,
                                     )
+                                    temporary_message_ids.append(user_msg_id)
                                     print(
-                                        f"[Agent WebSocket] TTS 음성 생성 완료 (base64, {len(audio_base64)} chars)"
+                                        f"[Agent WebSocket] 임시 메시지 추가: user_msg_id={user_msg_id}"
                                     )
-                                except asyncio.TimeoutError:
-                                    await websocket.send_json(
-                                        {
-                                            "type": "tts_error",
-                                            "error": "timeout",
-                                            "message": "TTS 생성 시간 초과 (15초)",
-                                        }
+
+                                    # Agent 호출 (save_to_db=False로 중복 저장 방지)
+                                    result = await run_ai_bomi_from_text_v2(
+                                        user_text=transcript,
+                                        user_id=user_id,
+                                        session_id=session_id,
+                                        stt_quality=quality,
+                                        speaker_id=speaker_id,
+                                        save_to_db=False,  # 🆕 WebSocket에서 직접 저장하므로 False
+                                    )
+
+                                    # 🆕 Phase 3: AI 응답 저장 및 ID 추적
+                                    ai_msg_id = await store.add_message_async(
+                                        user_id, session_id, "assistant", result["reply_text"]
+                                    )
+                                    temporary_message_ids.append(ai_msg_id)
+                                    print(
+                                        f"[Agent WebSocket] 임시 메시지 추가: ai_msg_id={ai_msg_id}"
+                                    )
+
+                                    # 🆕 DEBUG: result 내용 확인
+                                    print(
+                                        f"[Agent WebSocket] 🔍 Sending result keys: {result.keys()}"
+                                    )
+                                    print(
+                                        f"[Agent WebSocket] 🔍 Response type: {result.get('response_type')}"
                                     )
-                                    print("[Agent WebSocket] TTS 타임아웃")
-                                except Exception as e:
+                                    if "alarm_info" in result:
+                                        print(
+                                            f"[Agent WebSocket] ✅ alarm_info FOUND: {result['alarm_info']}"
+                                        )
+                                    else:
+                                        print(f"[Agent WebSocket] ❌ alarm_info NOT in result!")
+
                                     await websocket.send_json(
                                         {
-                                            "type": "tts_error",
-                                            "error": "generation_failed",
-                                            "message": str(e),
+                                            "type": "agent_response",
+                                            "data": result,
                                         }
                                     )
-                                    print(f"[Agent WebSocket] TTS 생성 오류: {e}")
 
-                            else:
-                                # TTS가 비활성화되어 있음
-                                print("[Agent WebSocket] ⏭️  TTS 스킵됨 (토글 OFF)")
+                                    # 🆕 TTS 처리 (tts_enabled가 True일 때만)
+                                    print(f"[Agent WebSocket] 🔊 TTS 토글 상태: {tts_enabled}")
+                                    if tts_enabled:
+                                        try:
+                                            # 🆕 TTS는 reply_text_with_tags 사용 (마크다운 제거 + audio tags 유지)
+                                            tts_text = result.get("reply_text_with_tags") or result["reply_text"]
+                                            print(f"[Agent WebSocket] TTS 생성 시작: {tts_text[:50]}...")
+
+                                            if tts_stream:
+                                                # 🆕 도착하는 대로 바이너리 프레임 전송 (base64 없음)
+                                                streamed = await stream_tts_to_websocket(
+                                                    websocket, tts_text, session_id
+                                                )
+                                                print(
+                                                    f"[Agent WebSocket] TTS 스트리밍 완료 ({streamed} bytes)"
+                                                )
+                                            else:
+                                                # 🆕 TTS 생성 (base64 문자열 반환, fallback 포함 최대 15초)
+                                                audio_base64, audio_format = await generate_tts_async(
+                                                    tts_text, budget=15.0
+                                                )
+                                                await websocket.send_json(
+                                                    {
+                                                        "type": "tts_ready",
+                                                        "audio_base64": audio_base64,  # 🆕 base64 직접 전송
+                                                        "audio_format": audio_format,
+                                                        "session_id": session_id,
+                                                    }
+                                                )
+                                                print(
+                                                    f"[Agent WebSocket] TTS 음성 생성 완료 (base64, {len(audio_base64)} chars)"
+                                                )
+                                        except asyncio.TimeoutError:
+                                            await websocket.send_json(
+                                                {
+                                                    "type": "tts_error",
+                                                    "error": "timeout",
+                                                    "message": "TTS 생성 시간 초과 (15초)",
+                                                }
+                                            )
+                                            print("[Agent WebSocket] TTS 타임아웃")
+                                        except Exception as e:
+                                            await websocket.send_json(
+                                                {
+                                                    "type": "tts_error",
+                                                    "error": "generation_failed",
+                                                    "message": str(e),
+                                                }
+                                            )
+                                            print(f"[Agent WebSocket] TTS 생성 오류: {e}")
 
-                            # 🆕 Phase 3: 성공 시 임시 추적 초기화
-                            temporary_message_ids.clear()
-                            print(
-                                "[Agent WebSocket] 대화 성공 - 임시 메시지 추적 초기화"
-                            )
-                            print("[Agent WebSocket] Agent 응답 완료")
+                                    else:
+                                        # TTS가 비활성화되어 있음
+                                        print("[Agent WebSocket] ⏭️  TTS 스킵됨 (토글 OFF)")
 
-                        # 🆕 low_quality STT 처리 else 블록 추가
-                        except Exception as e:
-                            import traceback
+                                    # 🆕 Phase 3: 성공 시 임시 추적 초기화
+                                    temporary_message_ids.clear()
+                                    print(
+                                        "[Agent WebSocket] 대화 성공 - 임시 메시지 추적 초기화"
+                                    )
+                                    print("[Agent WebSocket] Agent 응답 완료")
 
-                            print(f"[Agent WebSocket] Agent 처리 오류: {e}")
-                            traceback.print_exc()
-                            await websocket.send_json(
-                                {
-                                    "type": "error",
-                                    "message": f"Agent 처리 오류: {str(e)}",
-                                }
-                            )
-                    else:
-                        # 🆕 low_quality STT 처리
-                        print(f"[Agent WebSocket] ⚠️ STT 품질 낮음 (quality={quality}) - 재시도 요청")
-                        await websocket.send_json({
-                            "type": "low_quality",
-                            "message": "잘 못 들었어요. 다시 한번 말씀해 주세요!"
-                        })
-
-                    # VAD 리셋 후 다음 발화 대기
-                    stt_engine_instance.vad.reset()
-                    # ✅ continue를 추가하여 다음 오디오 청크 수신 계속
-                    continue
+                            # 🆕 low_quality STT 처리 else 블록 추가
+                            except Exception as e:
+                                import traceback
+
+                                print(f"[Agent WebSocket] Agent 처리 오류: {e}")
+                                traceback.print_exc()
+                                await websocket.send_json(
+                                    {
+                                        "type": "error",
+                                        "message": f"Agent 처리 오류: {str(e)}",
+                                    }
+                                )
+                        else:
+                            # 🆕 low_quality STT 처리
+                            print(f"[Agent WebSocket] ⚠️ STT 품질 낮음 (quality={quality}) - 재시도 요청")
+                            low_quality_message = {
+                                "type": "low_quality",
+                                "message": SYSTEM_PHRASES["low_quality_retry"],
+                            }
+                            phrase = get_phrase_audio("low_quality_retry") if tts_enabled else None
+                            if phrase is not None:
+                                # 🆕 미리 합성된 안내 음성 (합성 호출 없음)
+                                low_quality_message["audio_base64"] = base64.b64encode(phrase[0]).decode("utf-8")
+                                low_quality_message["audio_format"] = phrase[1]
+                            await websocket.send_json(low_quality_message)
+
+                        # VAD 리셋 후 다음 발화 대기
+                        stt_engine_instance.vad.reset()
+                        # ✅ continue를 추가하여 다음 오디오 청크 수신 계속
+                        continue
 
     except WebSocketDisconnect:
         print("[Agent WebSocket] 연결 종료")
@@ -1868,6 +1942,52 @@ async def health():
     return {"status": "ok"}
 
 
+class TtsStreamRequest(BaseModel):
+    text: str
+    engine: Optional[str] = None  # "elevenlabs" | "melo" (None이면 TTS_ENGINE)
+    tone: Optional[str] = None
+
+
+@app.post("/api/tts/stream")
+async def tts_stream(request: TtsStreamRequest):
+    """
+    텍스트 -> 음성 스트리밍 (audio/mpeg, chunked)
+
+    합성이 끝나기 전에 재생을 시작할 수 있도록 오디오 조각을 도착하는 대로 전송
+    """
+    if not request.text or not request.text.strip():
+        raise HTTPException(status_code=400, detail="text is required")
+
+    # 첫 조각까지 받아 본 뒤 응답 시작 (헤더 전송 후에는 상태 코드를 바꿀 수 없음)
+    try:
+        audio_format, chunks = await open_audio_stream(
+            request.text, engine=request.engine, tone=request.tone
+        )
+    except asyncio.TimeoutError as e:
+        raise HTTPException(status_code=504, detail=f"TTS timeout: {e}")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print(f"[TTS ERROR] 스트리밍 시작 실패: {e}")
+        raise HTTPException(status_code=502, detail=f"TTS error: {e}")
+
+    return StreamingResponse(
+        chunks, media_type=AUDIO_MEDIA_TYPES.get(audio_format, "application/octet-stream")
+    )
+
+
+@app.get("/api/tts/cache/stats")
+async def tts_cache_stats():
+    """TTS 오디오 캐시 통계 (적중률, 절약한 바이트)"""
+    return get_tts_cache_stats()
+
+
+@app.get("/api/db/stats")
+async def db_stats():
+    """DB 커넥션 풀 포화도 (사용 중/최대 커넥션, 대기 시간) 및 쿼리 지연 통계"""
+    return get_db_stats()
+
+
 @app.post("/api/tts")
 async def tts(request: Request):
     """
@@ -1897,12 +2017,14 @@ async def tts(request: Request):
         raise HTTPException(status_code=400, detail="text is required")
 
     try:
-        wav_path = synthesize_to_wav(
+        audio_bytes, audio_format = await synthesize_audio(
             text=str(text),
-            speed=speed,
-            tone=str(tone),
             engine=str(engine_name),
+            tone=str(tone),
+            speed=speed,
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         import traceback
         import sys as _sys
@@ -1911,10 +2033,10 @@ async def tts(request: Request):
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"TTS error: {e}")
 
-    return FileResponse(
-        path=str(wav_path),
-        filename=wav_path.name,
-        media_type="audio/wav",
+    return Response(
+        content=audio_bytes,
+        media_type=AUDIO_MEDIA_TYPES.get(audio_format, "application/octet-stream"),
+        headers={"Content-Disposition": f'inline; filename="tts.{audio_format}"'},
     )
 
 
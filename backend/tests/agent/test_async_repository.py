@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("greenlet")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import func, select  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.db import async_repository  # noqa: E402
+from app.db.database import Base  # noqa: E402
+from app.db.models import (  # noqa: E402
+    Conversation,
+    EmotionAnalysis,
+    GlobalMemory,
+    SessionSummary,
+    User,
+)
+
+ENGINE_ROOT = Path(__file__).resolve().parents[2] / "engine" / "langchain_agent"
+
+
+def load(name, path):
+    # Load by path: importing the engine.langchain_agent package pulls in the agent
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+db_conversation_store = load("db_conversation_store", ENGINE_ROOT / "db_conversation_store.py")
+memory_adapter = load("memory_adapter", ENGINE_ROOT / "adapters" / "memory_adapter.py")
+
+TABLES = [
+    User.__table__,
+    Conversation.__table__,
+    SessionSummary.__table__,
+    GlobalMemory.__table__,
+    EmotionAnalysis.__table__,
+]
+
+
+async def make_session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, tables=TABLES))
+    return engine, async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+def run(test):
+    async def main():
+        engine, session_factory = await make_session_factory()
+        try:
+            await test(session_factory)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(main())
+
+
+def test_async_store_writes_messages_summaries_and_pages_history() -> None:
+    async def scenario(session_factory):
+        store = db_conversation_store.DBConversationStore(
+            max_messages_per_session=4, message_cleanup_every=2
+        )
+        store._get_async_db = session_factory
+
+        ids = [
+            await store.add_message_async(1, "s1", "user" if i % 2 else "assistant", f"m{i}")
+            for i in range(6)
+        ]
+
+        history = await store.get_history_async(1, "s1")
+        assert [m["message_id"] for m in history] == ids[2:]  # FIFO cleanup ran via run_sync
+        assert [m["role"] for m in history] == ["assistant", "user", "assistant", "user"]
+
+        page = await store.get_history_page_async(1, "s1", limit=3)
+        assert [m["message_id"] for m in page["messages"]] == ids[3:]
+        assert page["has_more"] is True
+        page = await store.get_history_page_async(1, "s1", limit=3, before_id=page["next_cursor"])
+        assert [m["message_id"] for m in page["messages"]] == ids[2:3]
+        assert page["has_more"] is False
+
+        async with session_factory() as db:
+            summary = (await db.execute(select(SessionSummary))).scalars().one()
+        assert (summary.SESSION_ID, summary.MESSAGE_COUNT, summary.PREVIEW) == ("s1", 4, "m3")
+
+        metadata = await store.get_session_metadata_async(1, "s1")
+        assert (metadata["session_id"], metadata["message_count"]) == ("s1", 4)
+        assert metadata["first_message"] == "m3"
+        assert await store.get_session_metadata_async(1, "missing") is None
+        assert await store.get_session_metadata_async(2, "s1") is None
+
+    run(scenario)
+
+
+def test_user_lookup_memories_and_emotion_analysis() -> None:
+    async def scenario(session_factory):
+        async with session_factory() as db:
+            db.add(User(ID=7, SOCIAL_ID="g-7", EMAIL="a@b.c", NICKNAME="봄"))
+            db.add_all([
+                GlobalMemory(USER_ID=7, CATEGORY="allergy", MEMORY_TEXT="땅콩 알러지", IMPORTANCE=10, IS_DELETED="N", CREATED_BY=7),
+                GlobalMemory(USER_ID=7, CATEGORY="other", MEMORY_TEXT="산책 좋아함", IMPORTANCE=2, IS_DELETED="N", CREATED_BY=7),
+                GlobalMemory(USER_ID=7, CATEGORY="other", MEMORY_TEXT="삭제됨", IMPORTANCE=9, IS_DELETED="Y", CREATED_BY=7),
+            ])
+            await db.commit()
+
+            assert (await async_repository.get_user_by_id(db, 7)).NICKNAME == "봄"
+            assert await async_repository.get_user_by_id(db, 8) is None
+            assert (await async_repository.get_first_user(db)).ID == 7
+
+            memories = await async_repository.get_global_memories(db, 7)
+            assert [m.MEMORY_TEXT for m in memories] == ["땅콩 알러지", "산책 좋아함"]
+
+        layer = memory_adapter.MemoryLayer()
+        layer._get_async_db = session_factory
+        prompt = await layer.get_memories_for_prompt_async("s1", 7)
+        assert prompt.splitlines()[1].startswith("⭐⭐⭐⭐⭐ [allergy] 땅콩 알러지")
+
+        store = db_conversation_store.DBConversationStore()
+        store._get_async_db = session_factory
+        analysis_id = await store.save_emotion_analysis_async(
+            7, "오늘 좀 지쳤어", {"primary_emotion": {"name": "tired"}, "sentiment_overall": "negative"}
+        )
+        assert analysis_id > 0
+        async with session_factory() as db:
+            assert await db.scalar(select(func.count(EmotionAnalysis.ID))) == 1
+
+    run(scenario)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.database import Base
+from app.db.models import Conversation, SessionSummary, User
+
+# Load the store by path: importing the engine.langchain_agent package pulls in the agent
+STORE_PATH = Path(__file__).resolve().parents[2] / "engine" / "langchain_agent" / "db_conversation_store.py"
+spec = importlib.util.spec_from_file_location("db_conversation_store", STORE_PATH)
+db_conversation_store = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(db_conversation_store)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    # Only the tables under test: some index names repeat across tables, which SQLite rejects
+    Base.metadata.create_all(bind=engine, tables=[User.__table__, Conversation.__table__, SessionSummary.__table__])
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def make_store(session_factory, **kwargs):
+    store = db_conversation_store.DBConversationStore(**kwargs)
+    store._get_db = session_factory
+    return store
+
+
+def active_ids(session_factory, session_id=None):
+    db = session_factory()
+    try:
+        query = db.query(Conversation.ID).filter(Conversation.IS_DELETED == "N")
+        if session_id is not None:
+            query = query.filter(Conversation.SESSION_ID == session_id)
+        return [row.ID for row in query.order_by(Conversation.ID)]
+    finally:
+        db.close()
+
+
+def test_message_limit_is_enforced_in_batches(session_factory) -> None:
+    store = make_store(session_factory, max_messages_per_session=4, message_cleanup_every=3)
+    ids = [store.add_message(1, "s1", "user", f"m{i}") for i in range(6)]
+
+    # Cleanup ran after the 3rd and 6th insert only
+    assert active_ids(session_factory, "s1") == ids[2:]
+
+    ids.append(store.add_message(1, "s1", "assistant", "m6"))
+    assert active_ids(session_factory, "s1") == ids[2:]  # soft limit: one extra row until the next batch
+
+
+def active_sessions(session_factory):
+    db = session_factory()
+    try:
+        return {
+            (row.USER_ID, row.SESSION_ID)
+            for row in db.query(Conversation).filter(Conversation.IS_DELETED == "N")
+        }
+    finally:
+        db.close()
+
+
+def test_session_limit_soft_deletes_least_recent_sessions(session_factory) -> None:
+    store = make_store(session_factory, max_sessions_per_user=2, session_cleanup_every=2)
+    for session_id in ("a", "b", "c"):
+        store.add_message(1, session_id, "user", "hi")
+    store.add_message(2, "other-user", "user", "hi")
+    # Three sessions but the 2nd cleanup is only due at the next new session
+    assert {sid for uid, sid in active_sessions(session_factory) if uid == 1} == {"a", "b", "c"}
+
+    store.add_message(1, "a", "user", "again")  # "a" becomes the most recent
+    store.add_message(1, "d", "user", "hi")
+
+    assert active_sessions(session_factory) == {(1, "a"), (1, "d"), (2, "other-user")}
+
+
+def test_history_returns_last_messages_and_pages_backwards(session_factory) -> None:
+    store = make_store(session_factory)
+    ids = [store.add_message(1, "s1", "user" if i % 2 else "assistant", f"m{i}") for i in range(7)]
+    store.add_message(1, "s2", "user", "elsewhere")
+
+    last = store.get_history(1, "s1", limit=3)
+    assert [m["message_id"] for m in last] == ids[4:]
+    assert [m["content"] for m in last] == ["m4", "m5", "m6"]
+    assert len(store.get_history(1, "s1")) == 7
+
+    page = store.get_history_page(1, "s1", limit=3)
+    pages = [[m["message_id"] for m in page["messages"]]]
+    while page["has_more"]:
+        page = store.get_history_page(1, "s1", limit=3, before_id=page["next_cursor"])
+        pages.append([m["message_id"] for m in page["messages"]])
+
+    assert pages == [ids[4:], ids[1:4], ids[:1]]
+    assert page["next_cursor"] is None
+
+
+def test_session_list_is_served_from_summaries(session_factory) -> None:
+    store = make_store(session_factory, max_messages_per_session=2, message_cleanup_every=1)
+    store.add_message(1, "a", "assistant", "안녕하세요")
+    store.add_message(1, "a", "user", "첫 질문")
+    store.add_message(1, "b", "user", "다른 세션")
+    store.add_message(1, "a", "user", "두 번째")  # trims the greeting in "a"
+    store.add_message(1, "c", "assistant", "인사만")
+
+    sessions = store.get_user_sessions(1)
+    assert [(s["session_id"], s["message_count"], s["first_message"]) for s in sessions] == [
+        ("c", 1, "새로운 대화"),
+        ("a", 2, "첫 질문"),
+        ("b", 1, "다른 세션"),
+    ]
+
+    first = store.get_user_sessions_page(1, limit=2)
+    assert [s["session_id"] for s in first["sessions"]] == ["c", "a"]
+    rest = store.get_user_sessions_page(1, limit=2, before_id=first["next_cursor"])
+    assert [s["session_id"] for s in rest["sessions"]] == ["b"]
+    assert rest["has_more"] is False
+
+    store.clear_session(1, "a")
+    assert store.get_session_metadata(1, "a") is None
+    assert store.get_session_metadata(1, "b")["message_count"] == 1
+
+
+def test_backfill_builds_summaries_for_existing_conversations(session_factory) -> None:
+    from app.db.session_summary import backfill_session_summaries
+
+    db = session_factory()
+    try:
+        db.add_all([
+            Conversation(USER_ID=1, SESSION_ID="old", SPEAKER_TYPE="assistant", CONTENT="hi", CREATED_BY=1),
+            Conversation(USER_ID=1, SESSION_ID="old", SPEAKER_TYPE="user-A", CONTENT="preview", CREATED_BY=1),
+        ])
+        db.commit()
+        assert backfill_session_summaries(db) == 1
+        assert backfill_session_summaries(db) == 0
+    finally:
+        db.close()
+
+    store = make_store(session_factory)
+    assert store.get_session_metadata(1, "old")["first_message"] == "preview"
+    assert store.get_session_metadata(1, "old")["message_count"] == 2
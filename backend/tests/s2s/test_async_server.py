@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+# Ensure speech-to-speech modules are importable
+S2S_ROOT = Path(__file__).resolve().parents[2] / "engine" / "speech-to-speech"
+if str(S2S_ROOT) not in sys.path:
+    sys.path.insert(0, str(S2S_ROOT))
+
+from baseHandler import BaseHandler  # noqa: E402
+from connections.async_server import AsyncSessionServer  # noqa: E402
+from utils.pipeline_queue import FairPipelineQueue  # noqa: E402
+from utils.sessions import ClientSession, SessionItem  # noqa: E402
+
+
+class Recorder(BaseHandler):
+    """Keeps a per-session history and echoes how many items the session sent."""
+
+    session_attributes = ("history",)
+
+    def setup(self):
+        self.history = []
+
+    def process(self, chunk):
+        self.history.append(chunk)
+        yield bytes([len(self.history)]) * len(chunk)
+
+
+def test_fair_queue_round_robins_sessions() -> None:
+    queue = FairPipelineQueue()
+    chatty, quiet = ClientSession(), ClientSession()
+    for i in range(3):
+        queue.put(SessionItem(chatty, i))
+    queue.put(SessionItem(quiet, "q"))
+
+    order = [queue.get() for _ in range(4)]
+    assert [item.session for item in order] == [chatty, quiet, chatty, chatty]
+    assert queue.snapshot()["high_watermark"] == 4
+
+
+def test_fair_queue_evicts_from_longest_lane() -> None:
+    queue = FairPipelineQueue(maxsize=3, policy="drop_oldest")
+    chatty, quiet = ClientSession(), ClientSession()
+    queue.put(SessionItem(quiet, "q"))
+    queue.put(SessionItem(chatty, 1))
+    queue.put(SessionItem(chatty, 2))
+    queue.put(SessionItem(chatty, 3))
+
+    payloads = [queue.get().payload for _ in range(3)]
+    assert payloads == ["q", 2, 3]
+    assert queue.dropped == 1
+
+
+def test_handler_keeps_state_per_session() -> None:
+    queue_in, queue_out = FairPipelineQueue(), FairPipelineQueue()
+    handler = Recorder(threading.Event(), queue_in, queue_out)
+    a, b = ClientSession(), ClientSession()
+    for session in (a, a, b):
+        queue_in.put(SessionItem(session, b"x"))
+    queue_in.put(SessionItem(a, b"END"))
+    queue_in.put(b"END")
+    handler.run()
+
+    outputs = [queue_out.get() for _ in range(5)]
+    counts = [(item.session, item.payload) for item in outputs if not item_is_end(item)]
+    assert sorted(counts, key=lambda pair: pair[0].id) == [(a, b"\x01"), (a, b"\x02"), (b, b"\x01")]
+    assert a.state == {}  # released on the session's END
+
+
+def item_is_end(item) -> bool:
+    return item == b"END" or item.is_end
+
+
+def test_server_routes_audio_back_to_each_client() -> None:
+    stop_event = threading.Event()
+    recv_queue, send_queue = FairPipelineQueue(), FairPipelineQueue()
+    server = AsyncSessionServer(
+        stop_event, recv_queue, send_queue, host="127.0.0.1", port=0, chunk_size=4
+    )
+    handler = Recorder(stop_event, recv_queue, send_queue)
+    threads = [threading.Thread(target=server.run), threading.Thread(target=handler.run)]
+    for thread in threads:
+        thread.start()
+    assert server.ready.wait(5)
+
+    async def client(n_chunks):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        received = []
+        for _ in range(n_chunks):
+            writer.write(b"abcd")
+            await writer.drain()
+            received.append(await asyncio.wait_for(reader.readexactly(4), 5))
+        writer.close()
+        return received
+
+    async def main():
+        return await asyncio.gather(client(3), client(1))
+
+    try:
+        first, second = asyncio.run(main())
+    finally:
+        stop_event.set()
+        for thread in threads:
+            thread.join(5)
+
+    assert first == [b"\x01" * 4, b"\x02" * 4, b"\x03" * 4]
+    assert second == [b"\x01" * 4]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import sys
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("librosa")
+pytest.importorskip("rich")
+
+import numpy as np  # noqa: E402
+
+# Ensure speech-to-speech modules are importable
+S2S_ROOT = Path(__file__).resolve().parents[2] / "engine" / "speech-to-speech"
+if str(S2S_ROOT) not in sys.path:
+    sys.path.insert(0, str(S2S_ROOT))
+
+SPEAKERS = {"EN-BR": 0, "FR": 1, "ES": 2, "ZH": 3, "JP": 4, "KR": 5}
+
+
+class FakeTTS:
+    """Stands in for melo.api.TTS: records every checkpoint load."""
+
+    loads = []
+
+    def __init__(self, language, device):
+        self.language = language
+        self.loads.append(language)
+        self.hps = types.SimpleNamespace(data=types.SimpleNamespace(spk2id=SPEAKERS))
+
+    def tts_to_file(self, text, speaker_id, quiet=False):
+        return np.zeros(441, dtype=np.float32)
+
+
+# melo_handler imports TTS from a sibling `api` module that is not part of this tree
+sys.modules.setdefault("TTS.api", types.SimpleNamespace(TTS=FakeTTS))
+from TTS import melo_handler  # noqa: E402
+from TTS.melo_handler import MeloModelCache, MeloTTSHandler  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fake_tts(monkeypatch):
+    monkeypatch.setattr(melo_handler, "TTS", FakeTTS)
+    monkeypatch.setattr(FakeTTS, "loads", [])
+    return FakeTTS
+
+
+def test_cache_evicts_least_recently_used_language() -> None:
+    cache = MeloModelCache(capacity=2)
+
+    english = cache.get("EN", "cpu")
+    cache.get("KR", "cpu")
+    assert cache.get("EN", "cpu") is english  # EN is now the most recently used
+    cache.get("FR", "cpu")
+
+    assert list(cache.models) == [("EN", "cpu"), ("FR", "cpu")]
+    assert ("KR", "cpu") not in cache
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    cache.get("KR", "cpu")  # evicted: loaded again
+    assert FakeTTS.loads == ["EN", "KR", "FR", "KR"]
+    assert list(cache.models) == [("FR", "cpu"), ("KR", "cpu")]
+
+
+def make_handler(**setup_kwargs) -> MeloTTSHandler:
+    return MeloTTSHandler(
+        threading.Event(),
+        None,
+        None,
+        setup_args=(threading.Event(),),
+        setup_kwargs={"device": "cpu", **setup_kwargs},
+    )
+
+
+def test_capacity_grows_to_fit_preloaded_languages() -> None:
+    handler = make_handler(language="en", model_cache_size=1, preload_languages="ko, fr, xx, en")
+
+    # Unsupported and duplicate codes are skipped; the main language fits as well
+    assert handler.models.capacity == 3
+    assert FakeTTS.loads == ["KR", "FR", "EN"]
+    assert handler.speaker_id == SPEAKERS["EN-BR"]
+
+
+def test_switching_back_to_a_cached_language_does_not_reload() -> None:
+    handler = make_handler(language="en", preload_languages="ko")
+    loads = len(FakeTTS.loads)
+
+    for language in ("ko", "en", "ko"):
+        list(handler.process(("문장", language)))
+        assert handler.language == language
+
+    assert len(FakeTTS.loads) == loads
+    assert handler.models.hits == 3
+    assert handler.speaker_id == SPEAKERS["KR"]
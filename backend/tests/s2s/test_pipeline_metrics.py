@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+
+# Ensure speech-to-speech modules are importable
+S2S_ROOT = Path(__file__).resolve().parents[2] / "engine" / "speech-to-speech"
+if str(S2S_ROOT) not in sys.path:
+    sys.path.insert(0, str(S2S_ROOT))
+
+from baseHandler import BaseHandler  # noqa: E402
+from utils.latency_histogram import LatencyHistogram  # noqa: E402
+from utils.pipeline_queue import PipelineQueue  # noqa: E402
+from utils.thread_manager import ThreadManager  # noqa: E402
+
+
+class Doubler(BaseHandler):
+    def process(self, value):
+        yield value * 2
+
+
+def test_drop_policies_keep_sentinel() -> None:
+    oldest = PipelineQueue(maxsize=2, policy="drop_oldest")
+    for item in (1, 2, 3, b"END"):
+        oldest.put(item)
+    # The sentinel bypasses the bound instead of evicting another item
+    assert [oldest.get() for _ in range(3)] == [2, 3, b"END"]
+    assert oldest.dropped == 1
+
+    newest = PipelineQueue(maxsize=2, policy="drop_newest")
+    for item in (1, 2, 3):
+        newest.put(item)
+    assert [newest.get() for _ in range(2)] == [1, 2]
+    assert newest.snapshot()["dropped"] == 1
+
+
+def test_histogram_percentiles_use_fixed_buckets() -> None:
+    histogram = LatencyHistogram()
+    buckets = len(histogram._counts)
+    for i in range(1, 1001):
+        histogram.record(i / 1000)  # 1ms .. 1s
+
+    assert len(histogram._counts) == buckets
+    assert 0.5 <= histogram.percentile(50) <= 0.5 * histogram.growth
+    assert 0.99 <= histogram.percentile(99) <= 1.0
+    assert histogram.snapshot()["count"] == 1000
+
+
+def test_handler_records_queue_wait_and_service_time() -> None:
+    queue_in, queue_out = PipelineQueue(maxsize=4), PipelineQueue(maxsize=4)
+    handler = Doubler(threading.Event(), queue_in, queue_out)
+    manager = ThreadManager([handler], queues={"in": queue_in, "out": queue_out})
+
+    for item in (1, 2, b"END"):
+        queue_in.put(item)
+    handler.run()
+
+    assert [queue_out.get() for _ in range(3)] == [2, 4, b"END"]
+    snapshot = manager.snapshot()
+    assert snapshot["handlers"]["Doubler"]["service"]["count"] == 2
+    assert snapshot["handlers"]["Doubler"]["queue_wait"]["count"] == 2
+    assert snapshot["queues"]["in"]["high_watermark"] == 3
+
+
+def test_blocked_producer_shuts_down_after_consumer_stops() -> None:
+    stop_event = threading.Event()
+    queue_in = PipelineQueue(maxsize=4, stop_event=stop_event)
+    queue_out = PipelineQueue(maxsize=1, stop_event=stop_event)  # nobody reads it
+    handler = Doubler(stop_event, queue_in, queue_out)
+    for item in (1, 2, 3):
+        queue_in.put(item)
+
+    thread = threading.Thread(target=handler.run)
+    thread.start()
+    thread.join(timeout=0.5)
+    assert thread.is_alive()  # blocked on the full output queue
+
+    stop_event.set()
+    thread.join(timeout=2)
+
+    assert not thread.is_alive()
+    assert queue_out.dropped == 1
+    assert [queue_out.get(timeout=1) for _ in range(2)] == [2, b"END"]
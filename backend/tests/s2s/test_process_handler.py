@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import multiprocessing
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+
+# Ensure speech-to-speech modules are importable
+S2S_ROOT = Path(__file__).resolve().parents[2] / "engine" / "speech-to-speech"
+if str(S2S_ROOT) not in sys.path:
+    sys.path.insert(0, str(S2S_ROOT))
+
+from baseHandler import BaseHandler  # noqa: E402
+from utils.pipeline_queue import PipelineQueue  # noqa: E402
+from utils.process_handler import ProcessHandler  # noqa: E402
+from utils.shared_audio import SharedAudio, from_shared, to_shared  # noqa: E402
+
+
+class Louder(BaseHandler):
+    def process(self, item):
+        audio, text = item
+        yield audio * 2, text.upper()
+
+
+def test_shared_audio_round_trip() -> None:
+    audio = np.arange(16000, dtype=np.int16)
+    shared = to_shared((audio, "hi", np.zeros(4)))
+
+    assert isinstance(shared[0], SharedAudio)
+    assert isinstance(shared[2], np.ndarray)  # small arrays are pickled as usual
+
+    restored = from_shared(shared)
+    np.testing.assert_array_equal(restored[0], audio)
+    assert restored[1] == "hi"
+
+
+def test_process_handler_runs_until_end_sentinel() -> None:
+    stop_event = multiprocessing.get_context("spawn").Event()
+    queue_in, queue_out = PipelineQueue(), PipelineQueue()
+    handler = ProcessHandler(Louder, stop_event, queue_in, queue_out)
+
+    audio = np.ones(8000, dtype=np.float32)
+    for text in ("a", "b"):
+        queue_in.put((audio, text))
+    queue_in.put(b"END")
+
+    thread = threading.Thread(target=handler.run)
+    thread.start()
+    outputs = [queue_out.get(timeout=60) for _ in range(3)]
+    thread.join(10)
+
+    assert not thread.is_alive()
+    assert handler.process.exitcode == 0
+    assert [text for _, text in outputs[:2]] == ["A", "B"]
+    np.testing.assert_array_equal(outputs[0][0], audio * 2)
+    assert outputs[2] == b"END"
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Ensure speech-to-speech modules are importable
+S2S_ROOT = Path(__file__).resolve().parents[2] / "engine" / "speech-to-speech"
+if str(S2S_ROOT) not in sys.path:
+    sys.path.insert(0, str(S2S_ROOT))
+
+from LLM.sentence_segmenter import SentenceSegmenter  # noqa: E402
+
+
+def stream(text: str, step: int = 2, **kwargs) -> list[tuple[int, str]]:
+    """Feed `text` in small chunks and record where each sentence was released."""
+    segmenter = SentenceSegmenter(**kwargs)
+    released = []
+    for i in range(0, len(text), step):
+        released += [(i + step, sentence) for sentence in segmenter.feed(text[i:i + step])]
+    rest = segmenter.flush()
+    if rest:
+        released.append((len(text), rest))
+    return released
+
+
+def test_korean_sentences_are_released_while_streaming() -> None:
+    text = "안녕하세요! 오늘 기분은 어떠세요? 저는 \"괜찮아요.\"라고 말했어요.그리고 좋아요... 음"
+    released = stream(text)
+
+    assert [sentence for _, sentence in released] == [
+        "안녕하세요!",
+        "오늘 기분은 어떠세요?",
+        "저는 \"괜찮아요.\"라고 말했어요.",
+        "그리고 좋아요...",
+        "음",
+    ]
+    # The first sentence goes out right after its boundary, long before the end
+    assert released[0][0] <= len("안녕하세요! ") + 2
+
+
+def test_english_abbreviations_decimals_and_short_fragments() -> None:
+    released = stream("Dr. Kim paid 3.5 dollars. Ok. Then we left!  Yes")
+
+    assert [sentence for _, sentence in released] == [
+        "Dr. Kim paid 3.5 dollars.",
+        "Ok. Then we left!",
+        "Yes",
+    ]
+
+
+def test_long_text_without_boundary_is_split_at_clause() -> None:
+    text = "구두점 없이 길게 이어지는 문장인데요, 그래도 적당한 곳에서 잘라서 먼저 읽어야 합니다 그리고"
+    released = stream(text, max_chars=30)
+
+    assert released[0][1] == "구두점 없이 길게 이어지는 문장인데요,"
+    assert "".join(sentence for _, sentence in released).replace(" ", "") == text.replace(" ", "")
+
+
+class FakeOpenAI:
+    """Streams the scripted deltas for every completion request."""
+
+    deltas: list[str] = []
+
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        return [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+            for delta in self.deltas
+        ]
+
+
+def test_openai_stream_does_not_emit_empty_last_sentence(monkeypatch) -> None:
+    pytest.importorskip("openai")
+    pytest.importorskip("rich")
+    from LLM import openai_api_language_model
+
+    monkeypatch.setattr(openai_api_language_model, "OpenAI", FakeOpenAI)
+    # Generation ends with whitespace after the last sentence boundary
+    monkeypatch.setattr(FakeOpenAI, "deltas", ["오늘 날씨가 ", "좋네요. 산책 ", "어떠세요? ", "\n"])
+    handler = openai_api_language_model.OpenApiModelHandler(
+        threading.Event(), None, None, setup_kwargs={"stream": True}
+    )
+
+    sentences = [sentence for sentence, _ in handler.process("안녕")]
+
+    assert sentences == ["오늘 날씨가 좋네요.", "산책 어떠세요?"]
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+STT_ROOT = Path(__file__).resolve().parents[2] / "engine" / "speech-to-text"
+if str(STT_ROOT) not in sys.path:
+    sys.path.insert(0, str(STT_ROOT))
+
+from common.audio_ingest import AudioFrameAssembler  # noqa: E402
+
+
+def collect(assembler: AudioFrameAssembler, packets: list[bytes]) -> list[np.ndarray]:
+    chunks = []
+    for packet in packets:
+        chunks.extend(chunk.copy() for chunk in assembler.feed(packet))
+    return chunks
+
+
+def test_odd_sized_packets_are_reframed_without_loss() -> None:
+    audio = np.linspace(-1, 1, 5000, dtype=np.float32)
+    raw = audio.tobytes()
+    # 20ms-ish packets that also split samples across packet boundaries
+    packets = [raw[i:i + 1283] for i in range(0, len(raw), 1283)]
+
+    chunks = collect(AudioFrameAssembler(sample_format="float32"), packets)
+
+    assert all(len(chunk) % 512 == 0 and len(chunk) <= 4096 for chunk in chunks)
+    np.testing.assert_array_equal(np.concatenate(chunks), audio[: 9 * 512])
+
+
+def test_int16_is_converted_to_float32() -> None:
+    pcm = np.array([0, 16384, -32768] * 400, dtype=np.int16)
+    assembler = AudioFrameAssembler(sample_format="int16")
+
+    chunks = collect(assembler, [pcm.tobytes()])
+
+    assert chunks[0].dtype == np.float32
+    np.testing.assert_allclose(chunks[0][:3], [0.0, 0.5, -1.0])
+    assert assembler.pending_samples == len(pcm) - 1024
+
+
+def test_configure_rejects_unknown_format() -> None:
+    assembler = AudioFrameAssembler()
+
+    with pytest.raises(ValueError):
+        assembler.configure(sample_format="mulaw")
+
+
+def test_opus_packets_are_decoded_into_frames(monkeypatch: pytest.MonkeyPatch) -> None:
+    decoded = np.full(320, 8192, dtype=np.int16)  # 20ms @ 16kHz
+
+    class FakeDecoder:
+        def __init__(self, fs: int, channels: int):
+            self.fs = fs
+
+        def decode(self, packet: bytes, frame_size: int) -> bytes:
+            return decoded.tobytes()
+
+        def reset_state(self) -> None:
+            pass
+
+    monkeypatch.setitem(sys.modules, "opuslib", type(sys)("opuslib"))
+    monkeypatch.setattr(sys.modules["opuslib"], "Decoder", FakeDecoder, raising=False)
+
+    assembler = AudioFrameAssembler(codec="opus")
+    chunks = collect(assembler, [b"\x01\x02"] * 5)
+
+    assert [len(chunk) for chunk in chunks] == [512, 512, 512]
+    np.testing.assert_allclose(chunks[0], 0.25)
+    assert assembler.pending_samples == 5 * 320 - 3 * 512
+
+
+def test_malformed_opus_packet_is_dropped(monkeypatch: pytest.MonkeyPatch) -> None:
+    decoded = np.full(320, 8192, dtype=np.int16)
+
+    class OpusError(Exception):
+        pass
+
+    class FakeDecoder:
+        def __init__(self, fs: int, channels: int):
+            pass
+
+        def decode(self, packet: bytes, frame_size: int) -> bytes:
+            if packet == b"garbage":
+                raise OpusError("corrupted stream")
+            return decoded.tobytes()
+
+        def reset_state(self) -> None:
+            pass
+
+    opuslib = type(sys)("opuslib")
+    opuslib.Decoder = FakeDecoder
+    opuslib.OpusError = OpusError
+    monkeypatch.setitem(sys.modules, "opuslib", opuslib)
+
+    assembler = AudioFrameAssembler(codec="opus")
+    chunks = collect(assembler, [b"\x01\x02", b"garbage", b"\x01\x02"])
+
+    assert assembler.dropped_packets == 1
+    assert [len(chunk) for chunk in chunks] == [512]
+    assert assembler.pending_samples == 2 * 320 - 512
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+STT_ROOT = Path(__file__).resolve().parents[2] / "engine" / "speech-to-text"
+if str(STT_ROOT) not in sys.path:
+    sys.path.insert(0, str(STT_ROOT))
+
+from common.ring_buffer import AudioRingBuffer  # noqa: E402
+
+
+def test_append_overwrites_oldest_samples() -> None:
+    ring = AudioRingBuffer(5)
+
+    assert ring.append(np.arange(3, dtype=np.float32)) == 0
+    assert ring.append(np.arange(3, 7, dtype=np.float32)) == 2
+
+    assert len(ring) == 5
+    assert ring.is_wrapped
+    np.testing.assert_array_equal(np.concatenate(ring.segments()), [2, 3, 4, 5, 6])
+    np.testing.assert_array_equal(ring.view(), [2, 3, 4, 5, 6])
+    assert not ring.is_wrapped
+
+
+def test_view_is_zero_copy() -> None:
+    ring = AudioRingBuffer(8)
+    ring.append(np.ones(4, dtype=np.float32))
+
+    view = ring.view()
+    ring.append(np.full(2, 7, dtype=np.float32))
+
+    assert np.shares_memory(view, ring.view())
+    np.testing.assert_array_equal(ring.tail(3), [1, 7, 7])
+
+
+def test_detach_keeps_returned_audio_intact() -> None:
+    ring = AudioRingBuffer(4)
+    ring.append(np.array([1, 2, 3], dtype=np.float32))
+
+    detached = ring.detach()
+    ring.append(np.array([9, 9, 9, 9], dtype=np.float32))
+
+    assert len(detached) == 3
+    np.testing.assert_array_equal(detached, [1, 2, 3])
+    np.testing.assert_array_equal(ring.view(), [9, 9, 9, 9])
+
+
+def test_audio_buffer_get_all_returns_a_copy() -> None:
+    pytest.importorskip("pyaudio")
+    from common.audio_handler import AudioBuffer
+
+    buffer = AudioBuffer(max_duration=1.0, sample_rate=4)
+    buffer.append(np.ones(3, dtype=np.float32))
+    snapshot = buffer.get_all()
+    buffer.append(np.full(3, 7, dtype=np.float32))
+
+    np.testing.assert_array_equal(snapshot, [1, 1, 1])
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("yaml")
+
+# Ensure STT engine modules are importable
+FW_ROOT = Path(__file__).resolve().parents[2] / "engine" / "speech-to-text" / "faster_whisper_engine"
+if str(FW_ROOT) not in sys.path:
+    sys.path.insert(0, str(FW_ROOT))
+
+import speaker_service  # noqa: E402
+
+
+class FakeStore:
+    def __init__(self, profiles: list[dict] | None = None):
+        self.profiles = profiles or []
+        self.reads = 0
+        self.batches: list[list[dict]] = []
+        self.listeners = []
+
+    def add_speaker_profile_listener(self, callback) -> None:
+        self.listeners.append(callback)
+
+    def get_speaker_profiles(self, user_id: int) -> list[dict]:
+        self.reads += 1
+        return [dict(p) for p in self.profiles]
+
+    def write_speaker_profiles(self, rows: list[dict]) -> list[int]:
+        self.batches.append(rows)
+        ids = []
+        for row in rows:
+            if row["profile_id"] is None:
+                row = dict(row, profile_id=100 + len(self.profiles))
+                self.profiles.append(
+                    {"id": row["profile_id"], "speaker_type": row["speaker_type"],
+                     "embedding": row["embedding"], "current_score": row["score"]}
+                )
+            ids.append(row["profile_id"])
+        return ids
+
+
+def unit(*values: float) -> np.ndarray:
+    vec = np.array(values, dtype=np.float32)
+    return vec / np.linalg.norm(vec)
+
+
+@pytest.fixture
+def store() -> FakeStore:
+    return FakeStore(
+        [
+            {"id": 1, "speaker_type": "user-A", "embedding": [2.0, 0.0, 0.0], "current_score": 0.8},
+            {"id": 2, "speaker_type": "user-B", "embedding": [0.0, 3.0, 0.0], "current_score": 0.9},
+        ]
+    )
+
+
+@pytest.fixture
+def service(store: FakeStore) -> speaker_service.SpeakerIdService:
+    return speaker_service.SpeakerIdService(store, config_path=str(FW_ROOT / "config.yaml"))
+
+
+def test_identify_uses_cached_normalized_matrix(service, store: FakeStore) -> None:
+    assert service.identify(1, unit(0.1, 1.0, 0.0))[0] == "user-B"
+    speaker_id, similarity = service.identify(1, unit(0.0, 0.0, 1.0))
+
+    assert (speaker_id, similarity) == ("user-C", 0.0)
+    assert store.reads == 1
+    np.testing.assert_allclose(np.linalg.norm(service.get_index(1).matrix, axis=1), 1.0, rtol=1e-6)
+
+
+def test_matches_legacy_identify_speaker(service) -> None:
+    profiles = {
+        "user-A": {"embedding": np.array([2.0, 0.0, 0.0])},
+        "user-B": {"embedding": np.array([0.0, 3.0, 0.0])},
+    }
+    for query in (unit(1.0, 0.2, 0.0), unit(0.3, 1.0, 0.1), unit(1.0, 1.0, 1.0)):
+        legacy = service.verifier.identify_speaker(query, profiles)
+        assert service.identify(1, query)[0] == legacy[0]
+
+
+def test_writes_are_batched_and_visible_before_flush(service, store: FakeStore) -> None:
+    service.identify_and_register(1, unit(0.0, 0.0, 1.0))  # new user-C
+    service.identify_and_register(1, unit(0.0, 0.1, 1.0))  # higher score update of user-C
+
+    assert store.batches == []
+    assert service.speaker_ids(1) == ["user-A", "user-B", "user-C"]
+
+    assert service.flush() == 1
+    assert len(store.batches) == 1
+    row = store.batches[0][0]
+    assert (row["speaker_type"], row["profile_id"]) == ("user-C", None)
+    assert service.get_index(1).profile_ids[-1] == 102
+    service.close()
+
+
+def test_store_listener_invalidates_cache(service, store: FakeStore) -> None:
+    service.get_index(1)
+    store.listeners[0](1)
+    service.get_index(1)
+
+    assert store.reads == 2
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Ensure STT engine modules are importable
+STT_ROOT = Path(__file__).resolve().parents[2] / "engine" / "speech-to-text"
+for path in (STT_ROOT, STT_ROOT / "faster_whisper_engine"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import vad_engine  # noqa: E402
+
+FRAME = vad_engine.VAD_FRAME_SIZE
+
+
+class ScriptedScorer:
+    """Returns pre-scripted per-frame speech probabilities."""
+
+    def __init__(self, sample_rate: int = 16000):
+        self.probs: list[float] = []
+        self.calls = 0
+
+    def reset_states(self) -> None:
+        pass
+
+    def predict_frames(self, frames):
+        self.calls += 1
+        out, self.probs = self.probs[: len(frames)], self.probs[len(frames):]
+        return np.array(out, dtype=np.float32)
+
+
+@pytest.fixture
+def vad(monkeypatch: pytest.MonkeyPatch) -> vad_engine.SileroVAD:
+    monkeypatch.setattr(vad_engine, "SileroTorchScorer", ScriptedScorer)
+    return vad_engine.SileroVAD(
+        threshold=0.5,
+        min_speech_duration_ms=100,
+        min_silence_duration_ms=256,
+        short_silence_duration_ms=64,
+        backend="torch",
+    )
+
+
+def feed(vad: vad_engine.SileroVAD, pattern: str):
+    """Feed one 8-frame chunk; pattern uses 'S' for speech and '.' for silence frames."""
+    vad.scorer.probs = [0.9 if c == "S" else 0.1 for c in pattern]
+    chunk = np.arange(len(pattern) * FRAME, dtype=np.float32)
+    return chunk, vad.process_chunk(chunk)
+
+
+def test_chunk_frames_are_scored_in_one_call(vad: vad_engine.SileroVAD) -> None:
+    feed(vad, "SSSSSSSS")
+
+    assert vad.scorer.calls == 1
+    assert vad.is_speaking
+    assert vad.get_buffer_length() == 8 * FRAME
+
+
+def test_short_pause_then_speech_end(vad: vad_engine.SileroVAD) -> None:
+    speech, _ = feed(vad, "SSSSSSSS")
+
+    # 64ms short pause fires at the 3rd silent frame, 256ms long silence at the 9th
+    chunk, (is_end, audio, is_short) = feed(vad, "SS......")
+    assert (is_end, is_short) == (False, True)
+    assert len(audio) == len(speech) + 5 * FRAME
+
+    callbacks = []
+    vad.scorer.probs = [0.1] * 8
+    is_end, audio, is_short = vad.process_chunk(
+        np.zeros(8 * FRAME, dtype=np.float32), on_speech_end_callback=lambda: callbacks.append(1)
+    )
+    assert is_end and not is_short
+    assert len(audio) == len(speech) + len(chunk) + 3 * FRAME
+    assert callbacks == [1]
+    assert not vad.is_speaking
+
+
+def test_too_short_speech_is_discarded(vad: vad_engine.SileroVAD) -> None:
+    vad.min_speech_samples = 16000
+    feed(vad, "S.......")
+    vad.scorer.probs = [0.1] * 8
+    is_end, audio, _ = vad.process_chunk(np.zeros(8 * FRAME, dtype=np.float32))
+
+    assert not is_end
+    assert audio is None
+    assert not vad.is_speaking
+
+
+def test_emitted_speech_survives_discarded_blip_and_next_speech(vad: vad_engine.SileroVAD) -> None:
+    feed(vad, "SSSSSSSS")
+    feed(vad, "........")
+    vad.scorer.probs = [0.1] * 8
+    is_end, emitted, _ = vad.process_chunk(np.zeros(8 * FRAME, dtype=np.float32))
+    assert is_end
+    expected = emitted.copy()
+
+    # Too-short blip: discarded through reset()
+    vad.min_speech_samples = 16000
+    feed(vad, "S.......")
+    vad.scorer.probs = [0.1] * 8
+    assert vad.process_chunk(np.zeros(8 * FRAME, dtype=np.float32))[1] is None
+
+    # The next utterance must not overwrite the audio returned above
+    vad.scorer.probs = [0.9] * 8
+    vad.process_chunk(np.full(8 * FRAME, -1.0, dtype=np.float32))
+    np.testing.assert_array_equal(emitted, expected)
+
+
+def test_speech_includes_preroll_padding(vad: vad_engine.SileroVAD) -> None:
+    silence, _ = feed(vad, "........")
+    speech, _ = feed(vad, "SSSSSSSS")
+
+    audio = vad.get_current_buffer()
+    pad = min(vad.speech_pad_samples, len(silence))
+    assert len(audio) == pad + len(speech)
+    np.testing.assert_array_equal(audio[:pad], silence[-pad:])
+    assert np.shares_memory(audio, vad.speech_buffer.view())
+
+
+def test_continuous_speech_is_split_at_max_duration(vad: vad_engine.SileroVAD) -> None:
+    vad.max_speech_samples = 6 * FRAME
+
+    chunk, (is_end, audio, is_short) = feed(vad, "SSSSSSSS")
+
+    assert is_end and not is_short
+    np.testing.assert_array_equal(audio, chunk[: 6 * FRAME])
+    assert vad.is_speaking
+    assert vad.get_buffer_length() == 2 * FRAME
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.db import instrumentation
+from app.db.instrumentation import (
+    DBTimingMiddleware,
+    InstrumentedQueuePool,
+    get_db_stats,
+    instrument_engine,
+    track_db_request,
+)
+
+
+class ProbePool(InstrumentedQueuePool):
+    stats_name = "test"
+
+
+@pytest.fixture
+def engine(tmp_path):
+    instrumentation._pool_stats.pop("test", None)
+    instrumentation._query_stats.pop("test", None)
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        poolclass=ProbePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    instrument_engine(engine, "test")
+    yield engine
+    instrumentation._engines.pop("test", None)
+    engine.dispose()
+
+
+def test_pool_saturation_is_reported(engine) -> None:
+    with engine.connect() as held:
+        held.execute(text("SELECT 1"))
+        assert get_db_stats()["test"]["pool"]["checked_out"] == 1
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    pool = get_db_stats()["test"]["pool"]
+    assert pool["checked_out"] == 0
+    assert pool["peak_checked_out"] == 1
+    assert pool["acquisitions"] == 1
+    assert pool["timeouts"] == 1
+
+
+def test_request_stats_flag_slow_and_repeated_statements(engine, monkeypatch) -> None:
+    monkeypatch.setattr(instrumentation, "DB_SLOW_QUERY_MS", 0.0)
+    with track_db_request("GET /sessions") as stats:
+        with engine.connect() as conn:
+            for user_id in range(5):
+                conn.execute(text("SELECT :id"), {"id": user_id})
+            conn.execute(text("SELECT 2"))
+
+    assert stats.queries == 6
+    assert stats.slow_queries == 6
+    assert stats.pool_wait > 0
+    assert stats.repeated_statements() == [("SELECT ?", 5)]
+    assert "N+1? 5x SELECT ?" in stats.summary()
+    assert instrumentation.current_request_stats() is None
+    assert get_db_stats()["test"]["queries"]["queries"] == 6
+
+
+def test_middleware_adds_server_timing(engine) -> None:
+    app = FastAPI()
+    app.add_middleware(DBTimingMiddleware)
+
+    @app.get("/items")
+    def items():
+        # Sync route: runs in the threadpool with a copy of the request context
+        with engine.connect() as conn:
+            return {"count": sum(conn.execute(text("SELECT 1")).scalar() for _ in range(3))}
+
+    response = TestClient(app).get("/items")
+
+    assert response.json() == {"count": 3}
+    assert response.headers["server-timing"].endswith('desc="3 queries"')
+
+
+def test_middleware_leaves_websockets_to_per_turn_tracking(engine) -> None:
+    app = FastAPI()
+    app.add_middleware(DBTimingMiddleware)
+    seen = []
+
+    @app.websocket("/ws")
+    async def ws(websocket: WebSocket):
+        await websocket.accept()
+        seen.append(instrumentation.current_request_stats())
+        for turn in range(2):
+            await websocket.receive_text()
+            with track_db_request(f"ws turn {turn}") as stats:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+            seen.append(stats)
+        await websocket.close()
+
+    with TestClient(app).websocket_connect("/ws") as websocket:
+        websocket.send_text("a")
+        websocket.send_text("b")
+
+    assert seen[0] is None  # no connection-wide stats
+    assert [(stats.label, stats.queries) for stats in seen[1:]] == [("ws turn 0", 1), ("ws turn 1", 1)]
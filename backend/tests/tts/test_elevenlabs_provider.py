@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("dotenv")
+
+# Ensure TTS modules are importable
+TTS_DIR = Path(__file__).resolve().parents[2] / "engine" / "text-to-speech"
+if str(TTS_DIR) not in sys.path:
+    sys.path.insert(0, str(TTS_DIR))
+
+import provider_registry  # noqa: E402
+from tts_base import TtsProviderTimeout  # noqa: E402
+
+
+@pytest.fixture
+def provider(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(provider_registry, "_provider_instances", {})
+    monkeypatch.setenv("ELEVENLABS_API_KEY", "test-key")
+    provider = provider_registry.get_tts_provider("elevenlabs")
+
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if b"slow" in request.content:
+            await asyncio.sleep(1)
+        return httpx.Response(200, content=b"mp3")
+
+    provider._transport = httpx.MockTransport(handler)
+    provider.requests = requests
+    return provider
+
+
+def test_deadline_scales_with_text_length(provider) -> None:
+    assert provider.request_deadline("가" * 10) < provider.request_deadline("가" * 100)
+    assert provider.request_deadline("가" * 100000) == provider.deadline_max
+
+
+def test_requests_reuse_one_client_and_close_on_shutdown(provider) -> None:
+    async def run():
+        first = await provider.asynthesize("안녕하세요")
+        client = provider._client
+        second = await provider.asynthesize("반가워요")
+        assert provider._client is client
+        await provider_registry.close_tts_providers()
+        return first, second, client
+
+    first, second, client = asyncio.run(run())
+    assert (first, second) == (b"mp3", b"mp3")
+    assert client.is_closed
+    assert provider.requests[0].headers["xi-api-key"] == "test-key"
+    assert provider.requests[0].url.path == f"/v1/text-to-speech/{provider.voice_id}"
+    assert provider_registry._provider_instances == {}
+
+
+def test_missed_deadline_raises_provider_timeout(provider) -> None:
+    provider.deadline_base = 0.01
+    provider.deadline_per_char = 0.0
+
+    with pytest.raises(TtsProviderTimeout):
+        asyncio.run(provider.asynthesize("slow"))
+
+
+def test_astream_yields_chunks_from_stream_endpoint(provider) -> None:
+    async def run():
+        return [chunk async for chunk in provider.astream("안녕하세요")]
+
+    assert b"".join(asyncio.run(run())) == b"mp3"
+    assert provider.requests[-1].url.path.endswith("/stream")
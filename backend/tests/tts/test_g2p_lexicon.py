@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+LEXICON_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "engine" / "speech-to-speech" / "melo" / "text" / "g2p_lexicon.py"
+)
+
+# melo 패키지(torch 의존) 없이 사전 모듈만 로드
+_spec = importlib.util.spec_from_file_location("melo_g2p_lexicon", LEXICON_PATH)
+g2p_lexicon = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(g2p_lexicon)
+
+
+def test_new_words_are_flushed_in_batches_and_reloaded(tmp_path: Path) -> None:
+    path = tmp_path / "lexicon.tsv"
+    lexicon = g2p_lexicon.PronunciationLexicon(path, flush_every=2)
+
+    lexicon.put("하늘", "하늘")
+    assert not path.exists()
+    lexicon.put("봄", "봄")
+    lexicon.put("하늘", "하늘")  # 이미 있는 단어는 다시 기록하지 않음
+    assert lexicon.flush() == 0
+
+    reloaded = g2p_lexicon.PronunciationLexicon(path)
+    assert reloaded.get("하늘") == "하늘"
+    assert reloaded.get("바다") is None
+    assert reloaded.stats() == {"entries": 2, "pending": 0, "hits": 1, "misses": 1}
+
+
+def test_memory_is_bounded_lru(tmp_path: Path) -> None:
+    lexicon = g2p_lexicon.PronunciationLexicon(tmp_path / "lexicon.tsv", max_entries=2)
+
+    lexicon.put("a", "1")
+    lexicon.put("b", "2")
+    lexicon.get("a")
+    lexicon.put("c", "3")
+
+    assert (lexicon.get("a"), lexicon.get("b"), lexicon.get("c")) == ("1", None, "3")
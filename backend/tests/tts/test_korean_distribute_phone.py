@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+TEXT_ROOT = Path(__file__).resolve().parents[2] / "engine" / "speech-to-speech" / "melo" / "text"
+
+
+def load_function(path: Path, name: str):
+    """
+    모듈 전체를 import 하지 않고 함수 하나만 로드
+    (korean.py 는 import 시 BERT 토크나이저를 내려받음)
+    """
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    node = next(n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == name)
+    namespace = {"List": list}
+    exec(compile(ast.Module(body=[node], type_ignores=[]), str(path), "exec"), namespace)
+    return namespace[name]
+
+
+distribute_phone = load_function(TEXT_ROOT / "korean.py", "distribute_phone")
+distribute_phone_loop = load_function(TEXT_ROOT.parent / "text_backup_original" / "korean.py", "distribute_phone")
+
+
+def test_closed_form_matches_original_loop() -> None:
+    for n_word in range(1, 13):
+        for n_phone in range(0, 40):
+            assert distribute_phone(n_phone, n_word) == distribute_phone_loop(n_phone, n_word), (
+                n_phone,
+                n_word,
+            )
+
+
+def test_phones_are_spread_front_first() -> None:
+    assert distribute_phone(7, 3) == [3, 2, 2]
+    assert sum(distribute_phone(17, 5)) == 17
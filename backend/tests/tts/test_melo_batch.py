@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+import numpy as np  # noqa: E402
+from torch import nn  # noqa: E402
+
+# Ensure speech-to-speech modules are importable
+S2S_ROOT = Path(__file__).resolve().parents[2] / "engine" / "speech-to-speech"
+if str(S2S_ROOT) not in sys.path:
+    sys.path.insert(0, str(S2S_ROOT))
+
+# melo.api 는 추론 의존성(numba, torchaudio, transformers ...)과
+# import 시 내려받는 한국어 BERT 토크나이저가 있어야 로드됨
+try:
+    from melo.api import TTS
+    from melo.models import SynthesizerTrn
+except (ImportError, OSError) as e:
+    pytest.skip(f"melo.api unavailable: {e}", allow_module_level=True)
+
+BERT_DIM = 1024
+JA_BERT_DIM = 768
+
+
+def tiny_tts() -> TTS:
+    """체크포인트 없이 작은 SynthesizerTrn 으로 TTS 를 구성 (설정/가중치 다운로드 생략)"""
+    torch.manual_seed(0)
+    model = SynthesizerTrn(
+        20,
+        9,
+        8,
+        inter_channels=8,
+        hidden_channels=8,
+        filter_channels=16,
+        n_heads=2,
+        n_layers=3,
+        kernel_size=3,
+        p_dropout=0.0,
+        resblock="1",
+        resblock_kernel_sizes=[3],
+        resblock_dilation_sizes=[[1, 3, 5]],
+        upsample_rates=[2, 2],
+        upsample_initial_channel=8,
+        upsample_kernel_sizes=[4, 4],
+        n_speakers=2,
+        gin_channels=8,
+        num_tones=4,
+        num_languages=2,
+        n_layers_trans_flow=3,
+        n_flow_layer=1,
+    ).eval()
+    tts = TTS.__new__(TTS)
+    nn.Module.__init__(tts)
+    tts.model = model
+    tts.device = "cpu"
+    return tts
+
+
+def sentence(length: int):
+    generator = torch.Generator().manual_seed(length)
+    return (
+        torch.randn(BERT_DIM, length, generator=generator) * 0.1,
+        torch.randn(JA_BERT_DIM, length, generator=generator) * 0.1,
+        torch.randint(1, 20, (length,), generator=generator),
+        torch.randint(0, 4, (length,), generator=generator),
+        torch.zeros(length, dtype=torch.long),
+    )
+
+
+def test_batched_inference_matches_per_sentence_lengths() -> None:
+    tts = tiny_tts()
+    features = [sentence(n) for n in (3, 9, 5)]
+    # 노이즈 없이 결정적 추론 (sdp_ratio=0: 결정적 duration predictor)
+    params = dict(speaker_id=1, sdp_ratio=0.0, noise_scale=0.0, noise_scale_w=0.0, speed=1.0)
+
+    batched = tts._infer_batch(features, **params)
+    single = [tts._infer_batch([f], **params)[0] for f in features]
+
+    # 문장별 길이만큼 잘려야 함 (패딩 구간이 남으면 문장 사이에 잡음/무음이 생김)
+    assert [len(audio) for audio in batched] == [len(audio) for audio in single]
+    assert len(set(len(audio) for audio in batched)) > 1
+    # 디코더 conv 는 문장 끝에서 패딩 프레임을 함께 보므로 끝부분은 조금 다를 수 있음:
+    # 첫 프레임(업샘플 2x2 = 4 샘플)만 비교
+    for audio, expected in zip(batched, single):
+        np.testing.assert_allclose(audio[:4], expected[:4], atol=1e-3)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from torch import nn  # noqa: E402
+
+CPU_OPTIM_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "engine" / "speech-to-speech" / "melo" / "cpu_optim.py"
+)
+
+# melo 패키지 전체(numba, 텍스트 처리 의존성) 없이 cpu_optim 모듈만 로드
+_spec = importlib.util.spec_from_file_location("melo_cpu_optim", CPU_OPTIM_PATH)
+cpu_optim = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(cpu_optim)
+
+
+@pytest.mark.parametrize("bias", [True, False])
+def test_pointwise_linear_matches_conv1d(bias: bool) -> None:
+    torch.manual_seed(0)
+    conv = nn.Conv1d(6, 4, 1, bias=bias)
+    x = torch.randn(2, 6, 11)
+
+    linear = cpu_optim.PointwiseLinear(conv)
+
+    torch.testing.assert_close(linear(x), conv(x), rtol=1e-5, atol=1e-6)
+
+
+def test_convert_pointwise_convs_only_touches_prefixed_1x1_convs() -> None:
+    torch.manual_seed(0)
+    model = nn.Module()
+    model.enc_p = nn.Sequential(nn.Conv1d(4, 4, 1), nn.Conv1d(4, 4, 3, padding=1))
+    model.flow = nn.Sequential(nn.utils.weight_norm(nn.Conv1d(4, 4, 1)))
+    model.dec = nn.Sequential(nn.Conv1d(4, 4, 1))
+    x = torch.randn(1, 4, 7)
+    expected = model.flow(model.enc_p(x))
+
+    converted = cpu_optim.convert_pointwise_convs(model, ("enc_p", "flow"))
+
+    assert converted == 2
+    assert isinstance(model.enc_p[0], cpu_optim.PointwiseLinear)
+    assert isinstance(model.enc_p[1], nn.Conv1d)  # kernel_size=3 은 그대로
+    assert isinstance(model.flow[0], cpu_optim.PointwiseLinear)  # weight norm 을 풀고 교체
+    assert isinstance(model.dec[0], nn.Conv1d)  # 대상 prefix 가 아님
+    torch.testing.assert_close(model.flow(model.enc_p(x)), expected, rtol=1e-5, atol=1e-6)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("dotenv")
+
+# Ensure TTS modules are importable
+TTS_DIR = Path(__file__).resolve().parents[2] / "engine" / "text-to-speech"
+if str(TTS_DIR) not in sys.path:
+    sys.path.insert(0, str(TTS_DIR))
+
+import provider_registry  # noqa: E402
+import tts_model  # noqa: E402
+from phrase_bank import SYSTEM_PHRASES, PhraseBank  # noqa: E402
+
+
+class CountingProvider:
+    audio_format = "mp3"
+
+    def __init__(self, voice: str = "voice"):
+        self.voice = voice
+        self.calls: list[str] = []
+
+    def cache_params(self, **kwargs):
+        return self.voice, "model", {}
+
+    async def asynthesize(self, text: str, **kwargs) -> bytes:
+        self.calls.append(text)
+        return f"{self.voice}:{text}".encode()
+
+
+@pytest.fixture
+def pack_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "phrase_bank.pack"
+    monkeypatch.setattr(tts_model, "TTS_PHRASE_PACK", str(path))
+    monkeypatch.setattr(tts_model, "TTS_PHRASE_BANK_ENABLED", True)
+    monkeypatch.setattr(tts_model, "_phrase_bank", None)
+    monkeypatch.setattr(tts_model, "get_audio_cache", lambda: None)
+    return path
+
+
+def test_pack_round_trips_through_file(tmp_path: Path) -> None:
+    async def synthesize(text: str) -> bytes:
+        return text.encode()
+
+    bank = asyncio.run(PhraseBank.build("sig", "melo", "wav", synthesize))
+    bank.save(tmp_path / "bank.pack")
+    loaded = PhraseBank.load(tmp_path / "bank.pack")
+
+    assert (loaded.signature, len(loaded)) == ("sig", len(SYSTEM_PHRASES))
+    assert loaded.get("no_speech") == SYSTEM_PHRASES["no_speech"].encode()
+    assert loaded.lookup(f" {SYSTEM_PHRASES['low_quality_retry']}  ", "melo")[1] == "wav"
+    assert loaded.lookup(SYSTEM_PHRASES["low_quality_retry"], "elevenlabs") is None
+
+
+def test_fixed_phrases_are_served_without_synthesis(pack_path: Path, monkeypatch) -> None:
+    provider = CountingProvider()
+    monkeypatch.setattr(provider_registry, "_provider_instances", {"elevenlabs": provider})
+
+    asyncio.run(tts_model.prepare_phrase_bank("elevenlabs"))
+    built_calls = len(provider.calls)
+    audio = asyncio.run(tts_model.synthesize_audio(SYSTEM_PHRASES["low_quality"], engine="elevenlabs"))
+
+    assert built_calls == len(SYSTEM_PHRASES)
+    assert audio == (f"voice:{SYSTEM_PHRASES['low_quality']}".encode(), "mp3")
+    assert len(provider.calls) == built_calls
+
+    # 다시 시작해도 팩을 그대로 사용
+    asyncio.run(tts_model.prepare_phrase_bank("elevenlabs"))
+    assert len(provider.calls) == built_calls
+
+
+def test_voice_change_regenerates_pack(pack_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(provider_registry, "_provider_instances", {"elevenlabs": CountingProvider()})
+    asyncio.run(tts_model.prepare_phrase_bank("elevenlabs"))
+
+    new_voice = CountingProvider("new-voice")
+    monkeypatch.setattr(provider_registry, "_provider_instances", {"elevenlabs": new_voice})
+    asyncio.run(tts_model.prepare_phrase_bank("elevenlabs"))
+
+    assert len(new_voice.calls) == len(SYSTEM_PHRASES)
+    assert tts_model.get_phrase_audio("no_speech")[0].startswith(b"new-voice:")
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import io
 import sys
 import types
+import wave
 from pathlib import Path
 
 import pytest
 
+np = pytest.importorskip("numpy")
+
 
 class DummyTTS:
     def __init__(self, language: str | None = None, device: str | None = None):
-        self.hps = types.SimpleNamespace(data=types.SimpleNamespace(spk2id={language or "KR": 0}))
+        self.hps = types.SimpleNamespace(
+            data=types.SimpleNamespace(spk2id={language or "KR": 0}, sampling_rate=44100)
+        )
 
-    def tts_to_file(self, text: str, speaker_id: int, path: str, **kwargs) -> None:
-        Path(path).write_bytes(b"dummy audio")
+    def tts_to_file(self, text: str, speaker_id: int, output_path: str | None = None, **kwargs):
+        if output_path is not None:
+            raise AssertionError("synthesis should stay in memory")
+        return np.full(441, 0.5, dtype=np.float32)
 
 
 # Stub heavy dependencies before importing provider modules
@@ -48,7 +57,19 @@ def test_melo_provider_synthesize_returns_bytes(patch_melo: None) -> None:
     audio = provider.synthesize(text="테스트", emotion="happy", speed=1.0)
 
     assert isinstance(audio, (bytes, bytearray))
-    assert audio == b"dummy audio"
+    with wave.open(io.BytesIO(audio)) as wav:
+        assert (wav.getframerate(), wav.getnframes(), wav.getsampwidth()) == (44100, 441, 2)
+        frames = np.frombuffer(wav.readframes(441), dtype="<i2")
+    assert frames[0] == int(0.5 * 32767)
+
+
+def test_melo_provider_returns_pcm_buffer(patch_melo: None) -> None:
+    provider = melo_tts_provider.MeloTtsProvider()
+    audio, sample_rate = provider.synthesize_pcm(text="테스트")
+
+    assert (audio.dtype, audio.shape, sample_rate) == (np.float32, (441,), 44100)
+    with pytest.raises(ValueError):
+        melo_tts_provider.MeloTtsProvider(audio_format="flac")
 
 
 def test_get_tts_provider_returns_singleton(patch_melo: None) -> None:
@@ -56,3 +77,20 @@ def test_get_tts_provider_returns_singleton(patch_melo: None) -> None:
     provider_again = provider_registry.get_tts_provider("melo")
 
     assert provider is provider_again
+
+
+def test_melo_pool_preloads_instances_and_reuses_them(patch_melo: None) -> None:
+    provider = melo_tts_provider.MeloTtsProvider(pool_size=2)
+
+    async def run():
+        await provider.warmup()
+        results = await asyncio.gather(
+            *(provider.asynthesize(text="테스트", emotion="sad") for _ in range(4))
+        )
+        await provider.aclose()
+        return results
+
+    results = asyncio.run(run())
+    assert len(set(results)) == 1 and results[0].startswith(b"RIFF")
+    assert len(provider._loaded) == 2
+    assert provider._pool.qsize() == 2
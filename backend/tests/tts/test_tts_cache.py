@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure TTS modules are importable
+TTS_DIR = Path(__file__).resolve().parents[2] / "engine" / "text-to-speech"
+if str(TTS_DIR) not in sys.path:
+    sys.path.insert(0, str(TTS_DIR))
+
+from tts_cache import TtsAudioCache, make_cache_key  # noqa: E402
+
+
+def test_cache_key_normalizes_text_and_orders_settings() -> None:
+    key = make_cache_key("안녕하세요  봄이에요 ", "voice", "model", {"a": 1, "b": 2})
+
+    assert key == make_cache_key(" 안녕하세요 봄이에요", "voice", "model", {"b": 2, "a": 1})
+    assert key != make_cache_key("안녕하세요 봄이에요", "voice", "other-model", {"a": 1, "b": 2})
+
+
+def test_concurrent_misses_are_single_flight(tmp_path: Path) -> None:
+    cache = TtsAudioCache(cache_dir=tmp_path)
+    calls = []
+
+    async def produce() -> bytes:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return b"mp3-bytes"
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_create("k", produce) for _ in range(5)))
+
+    assert asyncio.run(run()) == [b"mp3-bytes"] * 5
+    assert calls == [1]
+
+    stats = cache.stats()
+    assert (stats["misses"], stats["coalesced"]) == (1, 4)
+    assert stats["bytes_saved"] == 4 * len(b"mp3-bytes")
+
+
+def test_cancelled_leader_hands_over_to_coalesced_waiter() -> None:
+    cache = TtsAudioCache()
+    calls = []
+
+    async def produce() -> bytes:
+        calls.append(1)
+        await asyncio.sleep(0.5)
+        return b"mp3-bytes"
+
+    async def run():
+        leader = asyncio.create_task(asyncio.wait_for(cache.get_or_create("k", produce), 0.2))
+        await asyncio.sleep(0.05)  # 리더가 생성 중일 때 같은 키로 합류
+        waiter = asyncio.create_task(asyncio.wait_for(cache.get_or_create("k", produce), 5))
+        with pytest.raises(TimeoutError):
+            await leader
+        return await waiter
+
+    # 리더의 시간 초과가 기다리던 요청을 취소하지 않고, 기다리던 요청이 생성을 이어받음
+    assert asyncio.run(run()) == b"mp3-bytes"
+    assert calls == [1, 1]
+    assert cache.stats()["misses"] == 2
+
+
+def test_disk_tier_survives_restart_and_is_size_bounded(tmp_path: Path) -> None:
+    async def produce() -> bytes:
+        return b"x" * 10
+
+    cache = TtsAudioCache(cache_dir=tmp_path, max_disk_bytes=25)
+    for key in ("a", "b", "c"):
+        asyncio.run(cache.get_or_create(key, produce))
+
+    assert sorted(p.stem for p in tmp_path.iterdir()) == ["b", "c"]
+
+    async def fail() -> bytes:
+        raise AssertionError("should be served from disk")
+
+    restarted = TtsAudioCache(cache_dir=tmp_path, max_disk_bytes=25)
+    assert asyncio.run(restarted.get_or_create("c", fail)) == b"x" * 10
+    assert restarted.stats()["disk_hits"] == 1
+    assert restarted.stats()["hit_ratio"] == 1.0
+
+
+def test_memory_tier_evicts_least_recently_used() -> None:
+    cache = TtsAudioCache(max_memory_bytes=20)
+
+    async def run():
+        for key in ("a", "b"):
+            await cache.get_or_create(key, lambda: asyncio.sleep(0, result=b"y" * 10))
+        await cache.get_or_create("a", lambda: asyncio.sleep(0, result=b"never"))
+        await cache.get_or_create("c", lambda: asyncio.sleep(0, result=b"z" * 10))
+
+    asyncio.run(run())
+    assert cache.stats()["memory_hits"] == 1
+    assert list(cache._memory) == ["a", "c"]
+
+
+def test_streamed_audio_is_cached_after_completion(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("httpx")
+    pytest.importorskip("dotenv")
+    import provider_registry
+    import tts_model
+
+    class ChunkedProvider:
+        calls = 0
+        audio_format = "mp3"
+
+        def cache_params(self, **kwargs):
+            return "voice", "model", {}
+
+        async def astream(self, text: str, **kwargs):
+            ChunkedProvider.calls += 1
+            for chunk in (b"ab", b"cd"):
+                yield chunk
+
+    cache = TtsAudioCache(cache_dir=tmp_path)
+    monkeypatch.setattr(tts_model, "get_audio_cache", lambda: cache)
+    monkeypatch.setattr(provider_registry, "_provider_instances", {"elevenlabs": ChunkedProvider()})
+
+    async def collect():
+        return [chunk async for chunk in tts_model.stream_audio_chunks("반가워요", engine="elevenlabs")]
+
+    assert asyncio.run(collect()) == [b"ab", b"cd"]
+    assert asyncio.run(collect()) == [b"abcd"]
+    assert ChunkedProvider.calls == 1
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_cloud_timeout_falls_back_to_local_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("httpx")
+    pytest.importorskip("dotenv")
+    import provider_registry
+    import tts_model
+
+    class SlowCloud:
+        audio_format = "mp3"
+
+        def cache_params(self, **kwargs):
+            return "cloud", "model", {}
+
+        async def asynthesize(self, text: str, **kwargs) -> bytes:
+            raise TimeoutError("deadline exceeded")
+
+    class Local:
+        audio_format = "wav"
+
+        def cache_params(self, **kwargs):
+            return "local", "melo", kwargs
+
+        async def asynthesize(self, text: str, **kwargs) -> bytes:
+            return b"RIFF"
+
+    monkeypatch.setattr(tts_model, "get_audio_cache", lambda: TtsAudioCache())
+    monkeypatch.setattr(tts_model, "TTS_FALLBACK_ENGINE", "melo")
+    monkeypatch.setattr(provider_registry, "_provider_instances", {"elevenlabs": SlowCloud(), "melo": Local()})
+
+    audio = asyncio.run(tts_model.synthesize_audio("안녕하세요", engine="elevenlabs"))
+    assert audio == (b"RIFF", "wav")
+
+    monkeypatch.setattr(tts_model, "TTS_FALLBACK_ENGINE", "")
+    with pytest.raises(TimeoutError):
+        asyncio.run(tts_model.synthesize_audio("안녕하세요", engine="elevenlabs"))
+
+
+def test_slow_cloud_falls_back_within_caller_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("httpx")
+    pytest.importorskip("dotenv")
+    import provider_registry
+    import tts_model
+
+    class HangingCloud:
+        audio_format = "mp3"
+
+        def cache_params(self, **kwargs):
+            return "cloud", "model", {}
+
+        async def asynthesize(self, text: str, **kwargs) -> bytes:
+            # Provider deadline for long text (up to 45s) is past the caller's budget
+            await asyncio.sleep(45)
+            return b"late"
+
+    class SlowLocal:
+        audio_format = "wav"
+
+        def cache_params(self, **kwargs):
+            return "local", "melo", kwargs
+
+        async def asynthesize(self, text: str, **kwargs) -> bytes:
+            await asyncio.sleep(1.0)  # CPU synthesis takes a while too
+            return b"RIFF"
+
+    monkeypatch.setattr(tts_model, "get_audio_cache", lambda: None)
+    monkeypatch.setattr(tts_model, "TTS_FALLBACK_ENGINE", "melo")
+    monkeypatch.setattr(provider_registry, "_provider_instances", {"elevenlabs": HangingCloud(), "melo": SlowLocal()})
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        # Same budget as the agent websocket tts_ready path
+        audio = await tts_model.synthesize_audio("긴 답변 " * 30, engine="elevenlabs", budget=15.0)
+        return audio, loop.time() - started
+
+    audio, elapsed = asyncio.run(run())
+    assert audio == (b"RIFF", "wav")
+    assert elapsed < 15.0